@@ -0,0 +1,44 @@
+# benchmarks/bench_ingestion.py
+import os
+import tempfile
+import time
+from benchmarks.corpora import generate_tree
+from benchmarks.stubs import ensure_tokenizers
+
+def run(files: int = 300, scale: int = 1, workers: int = None) -> dict:
+    """
+    Mesure l'apprentissage d'une arborescence synthétique par RawLearner.learn_from_directory,
+    d'abord complet, puis incrémental (rien n'a changé : seul le manifeste est consulté).
+    :return: Les débits (fichiers et concepts par seconde) et la configuration mesurée.
+    """
+    tokenizer = ensure_tokenizers()
+    from hikmara.modules.module_01_knowledge_base.knowledge_base import KnowledgeBase
+    from hikmara.modules.module_02_structured_learning.structured_learning import StructuredLearner
+    from hikmara.modules.module_03_raw_learning.raw_learning import RawLearner
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_dir = os.path.join(tmp, "corpus")
+        corpus = generate_tree(corpus_dir, files, scale=scale)
+        kb = KnowledgeBase(db_path=os.path.join(tmp, "bench.db"))
+        learner = RawLearner(StructuredLearner(knowledge_base=kb))
+        try:
+            learner.learn_from_directory(corpus_dir, workers=workers, worker_initializer=ensure_tokenizers)
+            full = learner.last_report
+            start = time.perf_counter()
+            learner.learn_from_directory(corpus_dir, workers=workers, worker_initializer=ensure_tokenizers)
+            resync_seconds = time.perf_counter() - start
+        finally:
+            kb.close()
+
+    return {
+        "config": {"files": files, "bytes": corpus["bytes"], "workers": workers, "tokenizer": tokenizer},
+        "metrics": {
+            "full_files_per_second": full["files_per_second"],
+            "full_concepts_per_second": full["concepts_per_second"],
+            "full_elapsed_ms": full["elapsed"] * 1000,
+            "resync_elapsed_ms": resync_seconds * 1000,
+        },
+        "concepts": full["concepts"],
+        "failed_files": full["failed_files"],
+        "conflicts": full["conflicts"],
+    }
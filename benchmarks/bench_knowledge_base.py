@@ -0,0 +1,42 @@
+# benchmarks/bench_knowledge_base.py
+import os
+import random
+import tempfile
+import time
+from benchmarks.corpora import WORDS
+from benchmarks.measure import percentiles, time_each
+
+def _rows(count: int, rng: random.Random, prefix: str = "concept"):
+    for i in range(count):
+        content = " ".join(rng.choice(WORDS) for _ in range(12))
+        yield f"{prefix}_{i}", content, "benchmark"
+
+def run(rows: int = 10_000, samples: int = 1_000, seed: int = 0) -> dict:
+    """
+    Mesure la KnowledgeBase remplie de `rows` concepts : débit du chargement par lots,
+    puis latences (percentiles) des lectures, des insertions unitaires et de la recherche plein texte.
+    """
+    from hikmara.modules.module_01_knowledge_base.knowledge_base import KnowledgeBase
+
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        kb = KnowledgeBase(db_path=os.path.join(tmp, "bench.db"))
+        try:
+            start = time.perf_counter()
+            kb.add_knowledge_many(_rows(rows, rng))
+            load_seconds = time.perf_counter() - start
+
+            names = [f"concept_{rng.randrange(rows)}" for _ in range(samples)]
+            get_samples = time_each(kb.get_knowledge, names)
+            insert_samples = time_each(
+                lambda row: kb.add_knowledge(*row), list(_rows(samples, rng, prefix="insert"))
+            )
+            queries = [" ".join(rng.sample(WORDS, 2)) for _ in range(min(samples, 200))]
+            search_samples = time_each(kb.search, queries)
+        finally:
+            kb.close()
+
+    metrics = {"bulk_rows_per_second": rows / load_seconds if load_seconds else 0.0}
+    for name, values in (("get", get_samples), ("insert", insert_samples), ("search", search_samples)):
+        metrics.update({f"{name}_{key}": value for key, value in percentiles(values).items()})
+    return {"config": {"rows": rows, "samples": samples}, "metrics": metrics}
@@ -0,0 +1,44 @@
+# benchmarks/bench_nlp.py
+import time
+from benchmarks.corpora import generate_commands
+from benchmarks.measure import percentiles, time_each
+from benchmarks.stubs import spacy_model_name, STUB_SPACY_MODEL
+
+def run(commands: int = 2_000, distinct: int = 200) -> dict:
+    """
+    Mesure NLPProcessor : process_command sur des commandes distinctes (cache vide),
+    puis répétées (cache chaud), et process_commands par lots.
+    Sans le modèle français installé, un pipeline vierge est utilisé (tokenisation seule).
+    """
+    from hikmara.modules.module_04_nlp.nlp_processor import NLPProcessor, DEFAULT_DISABLED_COMPONENTS
+
+    model_name = spacy_model_name()
+    disabled = () if model_name == STUB_SPACY_MODEL else DEFAULT_DISABLED_COMPONENTS
+    processor = NLPProcessor(internet_controller=None, model_name=model_name,
+                             disabled_components=disabled, cache_size=distinct)
+    unique = generate_commands(distinct)
+    repeated = [unique[i % distinct] for i in range(commands)]
+
+    cold_samples = time_each(processor.process_command, unique)
+    processor.cache.clear()
+    start = time.perf_counter()
+    for command in repeated:
+        processor.process_command(command)
+    cached_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in processor.process_commands(repeated):
+        pass
+    batch_seconds = time.perf_counter() - start
+
+    metrics = {
+        "cold_commands_per_second": len(unique) / sum(cold_samples),
+        "cached_commands_per_second": commands / cached_seconds,
+        "batch_commands_per_second": commands / batch_seconds,
+    }
+    metrics.update({f"cold_{key}": value for key, value in percentiles(cold_samples).items()})
+    return {
+        "config": {"commands": commands, "distinct": distinct, "model": model_name},
+        "metrics": metrics,
+        "cache": processor.cache.stats(),
+    }
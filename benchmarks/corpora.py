@@ -0,0 +1,105 @@
+# benchmarks/corpora.py
+import os
+import random
+
+# Vocabulaire des corpus synthétiques : déterministe, pour des mesures reproductibles.
+WORDS = (
+    "hikmara apprend analyse module base connaissance phrase fichier code projet script "
+    "intention commande modèle recherche réseau voix visage donnée texte concept source "
+    "rapide lent mémoire disque requête index lot flux processus thread cache"
+).split()
+
+def _sentence(rng: random.Random, min_words: int = 6, max_words: int = 18) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words))]
+    return " ".join(words).capitalize() + "."
+
+def make_text(rng: random.Random, sentences: int) -> str:
+    """ Retourne un texte de plusieurs paragraphes. """
+    lines = []
+    for i in range(sentences):
+        lines.append(_sentence(rng))
+        if i % 8 == 7:
+            lines.append("\n\n")
+    return " ".join(lines)
+
+def make_python(rng: random.Random, functions: int, prefix: str = "") -> str:
+    """
+    Retourne un module Python valide avec des fonctions et des classes documentées.
+    :param prefix: Le préfixe des noms, pour qu'ils soient uniques dans le corpus : des noms
+                   répétés d'un fichier à l'autre seraient des concepts en conflit.
+    """
+    parts = []
+    for i in range(functions):
+        if i % 5 == 4:
+            parts.append(f'class Classe{prefix}{i}:\n    """{_sentence(rng)}"""\n    valeur = {i}\n')
+        else:
+            parts.append(
+                f'def fonction_{prefix}{i}(a, b={i}):\n    """{_sentence(rng)}"""\n    return a + b\n'
+            )
+    return "\n\n".join(parts) + "\n"
+
+def make_php(rng: random.Random, blocks: int) -> str:
+    """ Retourne une page mêlant HTML et blocs PHP. """
+    parts = []
+    for i in range(blocks):
+        parts.append(f"<p>{_sentence(rng)}</p>")
+        parts.append(f"<?php\n$variable_{i} = \"{_sentence(rng)}\";\necho $variable_{i};\n?>")
+    return "\n".join(parts) + "\n"
+
+GENERATORS = {
+    ".txt": (make_text, 40),
+    ".py": (make_python, 20),
+    ".php": (make_php, 15),
+}
+
+def generate_tree(root: str, files: int, kinds=(".txt", ".py", ".php"), scale: int = 1,
+                  files_per_dir: int = 50, seed: int = 0) -> dict:
+    """
+    Génère une arborescence de fichiers texte, Python et PHP.
+    :param root: Le dossier de destination (créé si besoin).
+    :param files: Le nombre total de fichiers.
+    :param kinds: Les extensions générées, en alternance.
+    :param scale: Le multiplicateur de la taille de chaque fichier.
+    :param files_per_dir: Le nombre de fichiers par sous-dossier.
+    :param seed: La graine du générateur (même graine = même corpus).
+    :return: Un dictionnaire (nombre de fichiers, octets écrits).
+    """
+    rng = random.Random(seed)
+    total_bytes = 0
+    for i in range(files):
+        extension = kinds[i % len(kinds)]
+        make, size = GENERATORS[extension]
+        directory = os.path.join(root, f"dossier_{i // files_per_dir:04d}")
+        os.makedirs(directory, exist_ok=True)
+        if make is make_python:
+            content = make_python(rng, size * scale, prefix=f"m{i}_")
+        else:
+            content = make(rng, size * scale)
+        with open(os.path.join(directory, f"fichier_{i:06d}{extension}"), 'w', encoding='utf-8') as f:
+            f.write(content)
+        total_bytes += len(content.encode('utf-8'))
+    return {"files": files, "bytes": total_bytes}
+
+def generate_commands(count: int, seed: int = 0) -> list:
+    """ Retourne des commandes utilisateur variées (toutes les intentions, quelques inconnues). """
+    rng = random.Random(seed)
+    templates = [
+        "crée un projet python nommé {name}",
+        "génère un site web {name}",
+        "exécute le projet {name}",
+        "installe {package}",
+        "recherche {words}",
+        "présente-toi",
+        "apprends mon visage",
+        "qui suis-je",
+        "{words}",
+    ]
+    commands = []
+    for _ in range(count):
+        template = rng.choice(templates)
+        commands.append(template.format(
+            name=f"Projet{rng.randint(1, 10000)}",
+            package=rng.choice(["requests", "numpy", "flask", "rich"]),
+            words=" ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 6))),
+        ))
+    return commands
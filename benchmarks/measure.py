@@ -0,0 +1,26 @@
+# benchmarks/measure.py
+import time
+
+def percentiles(samples: list, points=(50, 90, 99)) -> dict:
+    """
+    Retourne les percentiles (méthode du rang le plus proche) d'échantillons en secondes,
+    convertis en millisecondes : {"p50_ms": ..., "p90_ms": ..., "p99_ms": ..., "max_ms": ...}.
+    """
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    result = {}
+    for point in points:
+        index = min(len(ordered) - 1, max(0, round(point / 100 * len(ordered)) - 1))
+        result[f"p{point}_ms"] = ordered[index] * 1000
+    result["max_ms"] = ordered[-1] * 1000
+    return result
+
+def time_each(operation, arguments) -> list:
+    """ Exécute operation(argument) pour chaque argument et retourne la durée de chaque appel. """
+    samples = []
+    for argument in arguments:
+        start = time.perf_counter()
+        operation(argument)
+        samples.append(time.perf_counter() - start)
+    return samples
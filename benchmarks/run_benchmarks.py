@@ -0,0 +1,143 @@
+# benchmarks/run_benchmarks.py
+"""
+Lance les mesures de performance de Hikmara et les compare à une référence.
+
+    python -m benchmarks.run_benchmarks                      # préréglage rapide
+    python -m benchmarks.run_benchmarks --preset full        # KB à 10k et 1M lignes
+    python -m benchmarks.run_benchmarks --save-baseline      # enregistre la référence
+
+La référence versionnée (benchmarks/baseline.json) a été mesurée avec le préréglage rapide,
+sur la machine décrite dans sa section "meta" : la réenregistrer (--save-baseline) sur la
+machine de mesure avant de s'en servir pour détecter des régressions.
+
+Tout fonctionne hors ligne : sans le modèle spaCy ou les données NLTK, des substituts
+sont utilisés (et consignés dans la configuration de chaque mesure). Une mesure dont
+les dépendances manquent est marquée "skipped" au lieu d'interrompre la suite.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARKS_DIR))
+
+from benchmarks import bench_ingestion, bench_knowledge_base, bench_nlp
+
+DEFAULT_BASELINE = os.path.join(BENCHMARKS_DIR, "baseline.json")
+DEFAULT_RESULTS_DIR = os.path.join(BENCHMARKS_DIR, "results")
+
+PRESETS = {
+    "quick": {"files": 300, "kb_rows": (10_000,), "commands": 2_000},
+    "full": {"files": 5_000, "kb_rows": (10_000, 1_000_000), "commands": 20_000},
+}
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Mesures de performance de Hikmara.")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="quick")
+    parser.add_argument("--only", default="ingestion,knowledge_base,nlp",
+                        help="Les mesures à lancer, séparées par des virgules.")
+    parser.add_argument("--workers", type=int, default=None, help="Processus d'analyse pour l'ingestion.")
+    parser.add_argument("--output", help="Le fichier JSON des résultats (par défaut, benchmarks/results/).")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Le fichier JSON de référence.")
+    parser.add_argument("--save-baseline", action="store_true", help="Enregistre les résultats comme référence.")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="La dégradation relative signalée comme régression (0.10 = 10 %%).")
+    parser.add_argument("--fail-on-regression", action="store_true",
+                        help="Termine avec le code 1 si une régression est détectée.")
+    return parser.parse_args(argv)
+
+def _measure(name: str, function, **kwargs) -> dict:
+    print(f"-> {name}...", flush=True)
+    try:
+        return function(**kwargs)
+    except ImportError as e:
+        print(f"   ignorée : {e}")
+        return {"skipped": f"{type(e).__name__}: {e}"}
+
+def run_suite(preset: str, only: set, workers: int = None) -> dict:
+    """ Exécute les mesures demandées et retourne {nom: résultat}. """
+    config = PRESETS[preset]
+    results = {}
+    if "ingestion" in only:
+        results["ingestion"] = _measure("ingestion", bench_ingestion.run, files=config["files"], workers=workers)
+    if "knowledge_base" in only:
+        for rows in config["kb_rows"]:
+            results[f"knowledge_base.{rows}"] = _measure(f"knowledge_base ({rows} lignes)",
+                                                         bench_knowledge_base.run, rows=rows)
+    if "nlp" in only:
+        results["nlp"] = _measure("nlp", bench_nlp.run, commands=config["commands"])
+    return results
+
+def _higher_is_better(metric: str) -> bool:
+    return metric.endswith("_per_second")
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Compare chaque métrique à la référence.
+    :return: Une liste de tuples (mesure, métrique, référence, valeur, variation relative, régression).
+    """
+    rows = []
+    for name, result in results.items():
+        reference = baseline.get(name, {})
+        if "metrics" not in result or "metrics" not in reference:
+            continue
+        for metric, value in result["metrics"].items():
+            old = reference["metrics"].get(metric)
+            if not old:
+                continue
+            change = (value - old) / old
+            worse = -change if _higher_is_better(metric) else change
+            rows.append((name, metric, old, value, change, worse > threshold))
+    return rows
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    only = {name.strip() for name in args.only.split(",") if name.strip()}
+    results = run_suite(args.preset, only, args.workers)
+    document = {
+        "meta": {
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "preset": args.preset,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "benchmarks": results,
+    }
+
+    output = args.output or os.path.join(
+        DEFAULT_RESULTS_DIR, f"{datetime.datetime.now():%Y%m%d-%H%M%S}-{args.preset}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(document, f, indent=2)
+    print(f"Résultats écrits dans '{output}'.")
+
+    regressions = 0
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"\nComparaison avec '{args.baseline}' ({baseline['meta'].get('timestamp')}) :")
+        if any(baseline["meta"].get(key) != document["meta"][key] for key in ("preset", "platform", "cpu_count")):
+            print("  Attention : la référence a été mesurée avec un autre préréglage ou sur une autre machine.")
+        for name, metric, old, value, change, regression in compare(results, baseline["benchmarks"], args.threshold):
+            flag = "  RÉGRESSION" if regression else ""
+            print(f"  {name:<24} {metric:<32} {old:>12.2f} -> {value:>12.2f} ({change:+.1%}){flag}")
+            regressions += regression
+    else:
+        print(f"\nAucune référence trouvée ('{args.baseline}'). Utilisez --save-baseline pour en créer une.")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(document, f, indent=2)
+        print(f"Référence enregistrée dans '{args.baseline}'.")
+
+    if regressions and args.fail_on_regression:
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+# benchmarks/stubs.py
+import importlib.util
+import re
+
+# Modèle spaCy réel ; à défaut, un pipeline vierge (tokeniseur seul) permet de mesurer sans réseau.
+REAL_SPACY_MODEL = "fr_core_news_sm"
+STUB_SPACY_MODEL = "blank:fr"
+
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+_WORD = re.compile(r"\w+|[^\w\s]")
+
+def _sent_tokenize(text, language="english"):
+    return [sentence for sentence in _SENTENCE_END.split(text) if sentence.strip()]
+
+def _word_tokenize(text, language="english", preserve_line=False):
+    return _WORD.findall(text)
+
+def ensure_tokenizers() -> str:
+    """
+    Vérifie que les données NLTK du tokeniseur sont installées : 'punkt_tab' (NLTK >= 3.8.2)
+    ou, pour les versions plus anciennes, 'punkt'. Sinon, remplace sent_tokenize
+    et word_tokenize par des découpages par expressions régulières, pour que les mesures
+    fonctionnent hors ligne. Les processus d'analyse ne sont pas créés par fork : passer
+    cette fonction en worker_initializer pour qu'ils appliquent aussi le remplacement.
+    :return: "punkt_tab", "punkt" ou "regex-stub", à consigner avec les résultats.
+    """
+    import nltk
+    for resource in ("punkt_tab", "punkt"):
+        try:
+            nltk.data.find(f'tokenizers/{resource}')
+            # Les versions récentes de NLTK ignorent 'punkt' : on vérifie que la tokenisation fonctionne.
+            nltk.sent_tokenize("Une phrase. Une autre.")
+            return resource
+        except LookupError:
+            continue
+    nltk.sent_tokenize = _sent_tokenize
+    nltk.word_tokenize = _word_tokenize
+    return "regex-stub"
+
+def spacy_model_name() -> str:
+    """ Retourne le modèle spaCy réel s'il est installé, sinon le pipeline vierge. """
+    if importlib.util.find_spec(REAL_SPACY_MODEL) is not None:
+        return REAL_SPACY_MODEL
+    return STUB_SPACY_MODEL
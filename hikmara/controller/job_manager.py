@@ -0,0 +1,173 @@
+# hikmara/controller/job_manager.py
+import asyncio
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Statuts d'une tâche
+PENDING = "en attente"
+RUNNING = "en cours"
+DONE = "terminée"
+FAILED = "échouée"
+CANCELLED = "annulée"
+
+def run_blocking(function, *args) -> asyncio.Future:
+    """
+    Exécute une fonction bloquante (saisie clavier, écoute du micro, requête réseau...)
+    dans un thread démon et retourne un future attendable depuis la boucle asyncio.
+    Contrairement aux threads d'un exécuteur, un thread démon bloqué sur input()
+    n'empêche pas l'application de s'arrêter.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def _resolve(result, error):
+        if future.cancelled():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def _target():
+        result, error = None, None
+        try:
+            result = function(*args)
+        except BaseException as e:
+            error = e
+        try:
+            loop.call_soon_threadsafe(_resolve, result, error)
+        except RuntimeError:
+            pass # La boucle est déjà fermée : personne n'attend plus le résultat.
+
+    threading.Thread(target=_target, name="hikmara-blocking", daemon=True).start()
+    return future
+
+class Job:
+    """
+    Une tâche de fond : une fonction bloquante exécutée hors de la boucle principale.
+    Par convention, la fonction retourne un tuple dont le premier élément indique le succès
+    (ex: (succès, message)), comme les méthodes des modules.
+    """
+    def __init__(self, job_id: int, description: str, on_done=None):
+        self.id = job_id
+        self.description = description
+        self.on_done = on_done
+        self.status = PENDING
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.task = None
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in (PENDING, RUNNING)
+
+    @property
+    def elapsed(self) -> float:
+        """ La durée d'exécution en secondes (jusqu'à maintenant si la tâche est en cours). """
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+    @property
+    def message(self) -> str:
+        """ Le message de résultat ou d'erreur de la tâche. """
+        if self.error:
+            return self.error
+        if isinstance(self.result, tuple) and len(self.result) > 1:
+            return str(self.result[1])
+        return "" if self.result is None else str(self.result)
+
+class JobManager:
+    """
+    Lance les tâches longues (installation, exécution de scripts, apprentissage d'une page...)
+    en arrière-plan et les identifie par un numéro, pour que l'utilisateur puisse
+    continuer à donner des commandes et consulter leur statut.
+    Les méthodes doivent être appelées depuis la boucle asyncio du contrôleur.
+    """
+    def __init__(self, max_workers: int = 4, on_finish=None, history_size: int = 50):
+        """
+        :param max_workers: Le nombre maximal de tâches exécutées simultanément.
+        :param on_finish: Une fonction appelée avec la tâche lorsqu'elle se termine
+                          (sauf si la tâche a son propre on_done).
+        :param history_size: Le nombre de tâches terminées conservées pour les statuts.
+        """
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hikmara-job")
+        self.on_finish = on_finish
+        self.history_size = history_size
+        self.jobs = OrderedDict()
+        self._ids = itertools.count(1)
+
+    def submit(self, description: str, function, *args, on_done=None) -> Job:
+        """
+        Lance une tâche de fond.
+        :param description: Une description lisible de la tâche.
+        :param function: La fonction bloquante à exécuter.
+        :param on_done: Une fonction appelée avec la tâche terminée, à la place de on_finish.
+        :return: La tâche créée (son numéro permet de suivre son statut).
+        """
+        job = Job(next(self._ids), description, on_done)
+        self.jobs[job.id] = job
+        job.task = asyncio.get_running_loop().create_task(self._run(job, function, args))
+        self._forget_old_jobs()
+        return job
+
+    async def _run(self, job: Job, function, args):
+        loop = asyncio.get_running_loop()
+        job.status = RUNNING
+        job.started_at = time.time()
+        try:
+            job.result = await loop.run_in_executor(self.executor, function, *args)
+            failed = isinstance(job.result, tuple) and job.result and job.result[0] is False
+            job.status = FAILED if failed else DONE
+        except asyncio.CancelledError:
+            job.status = CANCELLED
+            raise
+        except Exception as e:
+            job.status = FAILED
+            job.error = f"Une erreur inattendue est survenue: {e}"
+        finally:
+            job.finished_at = time.time()
+        callback = job.on_done or self.on_finish
+        if callback:
+            try:
+                callback(job)
+            except Exception:
+                pass
+
+    def _forget_old_jobs(self):
+        finished = [job_id for job_id, job in self.jobs.items() if not job.is_active]
+        for job_id in finished[:max(0, len(finished) - self.history_size)]:
+            del self.jobs[job_id]
+
+    def get(self, job_id: int) -> Job | None:
+        """ Retourne la tâche portant ce numéro, ou None. """
+        return self.jobs.get(job_id)
+
+    def list_jobs(self) -> list[Job]:
+        """ Retourne les tâches connues, des plus anciennes aux plus récentes. """
+        return list(self.jobs.values())
+
+    def active_jobs(self) -> list[Job]:
+        """ Retourne les tâches en attente ou en cours. """
+        return [job for job in self.jobs.values() if job.is_active]
+
+    async def wait_all(self, timeout: float = None) -> bool:
+        """
+        Attend la fin des tâches actives.
+        :return: True si toutes les tâches sont terminées, False si le délai a expiré.
+        """
+        tasks = [job.task for job in self.active_jobs()]
+        if not tasks:
+            return True
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        return not pending
+
+    def shutdown(self, wait: bool = True):
+        """ Arrête l'exécuteur ; les tâches pas encore démarrées sont abandonnées. """
+        self.executor.shutdown(wait=wait, cancel_futures=True)
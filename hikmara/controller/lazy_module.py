@@ -0,0 +1,77 @@
+# hikmara/controller/lazy_module.py
+import importlib
+import threading
+import time
+
+class LazyModule:
+    """
+    Proxy vers un module de Hikmara qui n'est importé et instancié qu'à sa première utilisation.
+    Tout accès à un attribut (ex: une méthode) déclenche le chargement, une seule fois,
+    même si plusieurs threads y accèdent simultanément.
+    """
+    def __init__(self, module_path: str, class_name: str, on_load=None, **kwargs):
+        """
+        :param module_path: Le chemin d'import du module Python (ex: "hikmara.modules....").
+        :param class_name: Le nom de la classe à instancier.
+        :param on_load: Une fonction appelée avec (nom de la classe, durée du chargement en secondes).
+        :param kwargs: Les arguments passés au constructeur (d'autres proxies sont acceptés).
+        """
+        self._module_path = module_path
+        self._class_name = class_name
+        self._on_load = on_load
+        self._kwargs = kwargs
+        self._instance = None
+        self._lock = threading.RLock()
+
+    @property
+    def is_loaded(self) -> bool:
+        """ True si le module a déjà été instancié. """
+        return self._instance is not None
+
+    def get_instance(self):
+        """ Importe et instancie le module si nécessaire, puis le retourne. """
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    start = time.perf_counter()
+                    module = importlib.import_module(self._module_path)
+                    cls = getattr(module, self._class_name)
+                    self._instance = cls(**self._kwargs)
+                    if self._on_load:
+                        self._on_load(self._class_name, time.perf_counter() - start)
+        return self._instance
+
+    def method(self, name: str):
+        """
+        Retourne une fonction qui résout la méthode au moment de l'appel.
+        Passée à run_blocking, le chargement éventuel du module a lieu dans le thread
+        de travail et non dans la boucle asyncio.
+        """
+        def _call(*args, **kwargs):
+            return getattr(self.get_instance(), name)(*args, **kwargs)
+        _call.__name__ = f"{self._class_name}.{name}"
+        return _call
+
+    def __getattr__(self, name):
+        # Appelé uniquement pour les attributs absents du proxy lui-même.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.get_instance(), name)
+
+def warm_up(modules) -> threading.Thread:
+    """
+    Charge des modules en arrière-plan pour qu'ils soient prêts à leur première utilisation.
+    Les erreurs sont ignorées : le module sera de nouveau chargé (et l'erreur visible) au premier usage.
+    :param modules: Les proxies LazyModule à charger.
+    :return: Le thread démon qui effectue le chargement.
+    """
+    def _load_all():
+        for module in modules:
+            try:
+                module.get_instance()
+            except Exception:
+                pass
+
+    thread = threading.Thread(target=_load_all, name="hikmara-warm-up", daemon=True)
+    thread.start()
+    return thread
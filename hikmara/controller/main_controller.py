@@ -1,52 +1,89 @@
 # hikmara/controller/main_controller.py
 import os
-import nltk
-from hikmara.modules.module_01_knowledge_base.knowledge_base import KnowledgeBase
-from hikmara.modules.module_02_structured_learning.structured_learning import StructuredLearner
-from hikmara.modules.module_03_raw_learning.raw_learning import RawLearner
-from hikmara.modules.module_04_nlp.nlp_processor import NLPProcessor
-from hikmara.modules.module_05_code_generation.code_generator import CodeGenerator
-from hikmara.modules.module_06_code_execution.code_executor import CodeExecutor
-from hikmara.modules.module_07_voice_recognition.voice_recognizer import VoiceRecognizer
-from hikmara.modules.module_08_voice_synthesis.voice_synthesizer import VoiceSynthesizer
-from hikmara.modules.module_09_facial_recognition.facial_recognizer import FacialRecognizer
-from hikmara.modules.module_10_internet_control.internet_controller import InternetController
-from hikmara.modules.web_search.web_searcher import WebSearcher
-from hikmara.modules.module_11_neural_network.neural_network import NeuralNetwork
+import time
+import asyncio
+import importlib.util
+from hikmara.controller.job_manager import JobManager, FAILED, run_blocking
+from hikmara.controller.lazy_module import LazyModule, warm_up
+from hikmara.controller.profiler import Profiler
+from hikmara.modules.module_08_voice_synthesis.voice_synthesizer import PRIORITY_URGENT
 from hikmara.view.terminal_view import TerminalView
 
+NLP_MODEL_NAME = "fr_core_news_sm"
+# Modules chargés en arrière-plan dès le démarrage : l'analyse NLP sert à chaque commande.
+DEFAULT_WARM_UP = ("nlp_processor",)
+SEARCH_PAGE_SIZE = 5
+
 class MainController:
     """
     Le contrôleur principal qui orchestre les différents modules de Hikmara.
+    Les modules sont des proxies (LazyModule) : chacun n'est importé et instancié
+    qu'à la première utilisation de l'intention qui en a besoin.
     """
-    def __init__(self):
+    def __init__(self, warm_up_modules=DEFAULT_WARM_UP, profiler: Profiler = None):
         """
         Initialise le contrôleur principal, la vue et les modules.
+        :param warm_up_modules: Les noms des modules à charger en arrière-plan au démarrage.
+        :param profiler: Le Profiler qui reçoit les durées d'initialisation et de traitement des commandes.
         """
         db_full_path = "hikmara/model/hikmara_kb.db"
-        self.voice_synthesizer = VoiceSynthesizer()
+        modules = "hikmara.modules"
+        self.profiler = profiler or Profiler()
+        start = time.perf_counter()
+        self.voice_synthesizer = self._lazy(f"{modules}.module_08_voice_synthesis.voice_synthesizer", "VoiceSynthesizer",
+                                            on_spoken=self._record_speech)
         self.view = TerminalView(synthesizer=self.voice_synthesizer)
         self.voice_mode_enabled = False
+        self.warm_up_modules = warm_up_modules
+        self._dependencies_ready = False
+        self.jobs = None # Créé au démarrage de la boucle asyncio (voir run)
 
         self.view.display_message("Initialisation du contrôleur et des modules...")
-        self.internet_controller = InternetController(view=self.view) # Instanciation du Module 10
-        self.knowledge_base = KnowledgeBase(db_path=db_full_path)
-        self.structured_learner = StructuredLearner(knowledge_base=self.knowledge_base)
-        self.raw_learner = RawLearner(structured_learner=self.structured_learner)
-        self.nlp_processor = NLPProcessor(internet_controller=self.internet_controller)
-        self.code_generator = CodeGenerator()
-        self.code_executor = CodeExecutor()
-        self.voice_recognizer = VoiceRecognizer()
-        self.facial_recognizer = FacialRecognizer()
-        self.web_searcher = WebSearcher()
-        self.neural_network = NeuralNetwork() # Instanciation du Module 11
-        # Le VoiceSynthesizer est déjà initialisé plus haut
+        self.internet_controller = self._lazy(f"{modules}.module_10_internet_control.internet_controller", "InternetController", view=self.view) # Module 10
+        self.knowledge_base = self._lazy(f"{modules}.module_01_knowledge_base.knowledge_base", "KnowledgeBase", db_path=db_full_path)
+        self.structured_learner = self._lazy(f"{modules}.module_02_structured_learning.structured_learning", "StructuredLearner", knowledge_base=self.knowledge_base)
+        self.raw_learner = self._lazy(f"{modules}.module_03_raw_learning.raw_learning", "RawLearner", structured_learner=self.structured_learner)
+        self.nlp_processor = self._lazy(f"{modules}.module_04_nlp.nlp_processor", "NLPProcessor", internet_controller=self.internet_controller, model_name=NLP_MODEL_NAME)
+        self.code_generator = self._lazy(f"{modules}.module_05_code_generation.code_generator", "CodeGenerator")
+        self.code_executor = self._lazy(f"{modules}.module_06_code_execution.code_executor", "CodeExecutor")
+        self.voice_recognizer = self._lazy(f"{modules}.module_07_voice_recognition.voice_recognizer", "VoiceRecognizer")
+        self.facial_recognizer = self._lazy(f"{modules}.module_09_facial_recognition.facial_recognizer", "FacialRecognizer")
+        self.web_searcher = self._lazy(f"{modules}.web_search.web_searcher", "WebSearcher", knowledge_base=self.knowledge_base)
+        self.neural_network = self._lazy(f"{modules}.module_11_neural_network.neural_network", "NeuralNetwork") # Module 11
+        self.profiler.record("startup.controller", time.perf_counter() - start)
         self.view.display_message("Modules initialisés.")
 
+    def _lazy(self, module_path: str, class_name: str, **kwargs) -> LazyModule:
+        """ Crée le proxy d'un module dont la durée de chargement est transmise au profiler. """
+        return LazyModule(module_path, class_name, on_load=self._record_module_load, **kwargs)
+
+    def _record_module_load(self, class_name: str, seconds: float):
+        self.profiler.record(f"module.{class_name}", seconds)
+
+    def _record_speech(self, text: str, seconds: float):
+        self.profiler.record("command.speech", seconds)
+
+    def _start_warm_up(self):
+        """
+        Lance le chargement en arrière-plan des modules attendus.
+        Le modèle spaCy manquant doit être téléchargé avec la permission de l'utilisateur :
+        dans ce cas, l'analyseur NLP sera chargé au premier plan, à la première commande.
+        """
+        names = list(self.warm_up_modules)
+        if "nlp_processor" in names and importlib.util.find_spec(NLP_MODEL_NAME) is None:
+            names.remove("nlp_processor")
+        if names:
+            warm_up([getattr(self, name) for name in names])
+
     def _ensure_dependencies(self):
         """
         S'assure que les dépendances de données (comme NLTK) sont prêtes.
+        Appelée avant le premier apprentissage, pour ne pas ralentir le démarrage.
         """
+        if self._dependencies_ready:
+            return
+        self._dependencies_ready = True
+        import nltk # Import coûteux, différé jusqu'au premier apprentissage
         try:
             nltk.data.find('tokenizers/punkt')
         except LookupError:
@@ -64,61 +101,144 @@ class MainController:
 
     def start(self):
         """
-        Démarre la boucle principale de l'application en utilisant la vue.
-        Gère les modes d'entrée texte et vocal.
+        Démarre la boucle principale de l'application (asyncio) et attend son arrêt.
         """
-        # On s'assure que les dépendances sont prêtes avant de démarrer la boucle principale
-        self._ensure_dependencies()
+        asyncio.run(self.run())
 
+    async def run(self):
+        """
+        Boucle principale : lit les commandes (texte ou voix) sans bloquer la boucle asyncio.
+        Les étapes bloquantes s'exécutent dans des threads ; les actions longues deviennent
+        des tâches de fond numérotées, et l'utilisateur peut continuer à donner des commandes.
+        """
+        self.jobs = JobManager(on_finish=self._on_job_finished)
+        self._start_warm_up()
         self.view.display_welcome()
+        self.profiler.record_since_origin("startup.total")
 
         while True:
-            command = ""
-            if self.voice_mode_enabled:
-                self.view.display_listening_prompt()
-                status, result = self.voice_recognizer.listen_for_command()
-                if status == 'success':
-                    self.view.display_message(f"Commande reconnue : '{result}'")
-                    command = result
-                else:
-                    self.view.display_message(f"-> {result}")
-                    continue
-            else:
-                command = self.view.get_command()
+            command = await self._next_command()
+            if command is None:
+                continue
 
             # Commandes spéciales pour gérer l'état de l'application
             clean_command = command.lower().strip()
             if clean_command in ["quitter", "exit", "stop"]:
                 break
             if clean_command == "mode vocal":
+                # Le moteur vocal (pyttsx3) est initialisé dans un thread, pas dans la boucle asyncio :
+                # en mode vocal, les messages sont lus depuis la boucle.
+                try:
+                    await run_blocking(self.voice_synthesizer.get_instance)
+                except Exception as e:
+                    self.view.display_message(f"-> Synthèse vocale indisponible : {e}")
+                    continue
                 self.voice_mode_enabled = True
                 self.view.display_message("Mode vocal activé.")
                 continue
             if clean_command == "mode texte":
                 self.voice_mode_enabled = False
+                if self.voice_recognizer.is_loaded:
+                    self.voice_recognizer.stop() # Libère le microphone
                 self.view.display_message("Mode texte activé.")
                 continue
+            if clean_command == "profil":
+                self.view.display_message(self.profiler.format_summary())
+                continue
+            if clean_command in ["tâches", "taches"]:
+                self.view.display_jobs(self.jobs.list_jobs())
+                continue
+            if clean_command.startswith("statut"):
+                self._show_job_status(clean_command)
+                continue
             if not command.strip():
                 continue
 
+            # L'utilisateur reprend la main : on coupe la parole en cours (sans charger le moteur).
+            if self.voice_synthesizer.is_loaded:
+                self.voice_synthesizer.cancel()
+
             # Traitement de la commande
-            nlp_result = self.nlp_processor.process_command(command)
-            self._process_intent(nlp_result)
+            with self.profiler.stage("command.total"):
+                with self.profiler.stage("command.nlp"):
+                    nlp_result = await run_blocking(self.nlp_processor.method("process_command"), command)
+                await self._process_intent(nlp_result)
 
-    def _process_intent(self, nlp_result: dict):
+        await self._wait_for_jobs()
+
+    async def _next_command(self) -> str | None:
+        """
+        Attend la prochaine commande, saisie ou dictée.
+        :return: La commande, ou None si rien n'a été reconnu.
+        """
+        if not self.voice_mode_enabled:
+            return await run_blocking(self.view.get_command)
+        if self.voice_synthesizer.is_loaded and not self.voice_synthesizer.wait_until_done(0):
+            # Ce que le micro a capté pendant que Hikmara parlait est sa propre voix.
+            await run_blocking(self.voice_synthesizer.wait_until_done)
+            if self.voice_recognizer.is_loaded:
+                self.voice_recognizer.discard_pending()
+        self.view.display_listening_prompt()
+        status, result = await run_blocking(self.voice_recognizer.method("listen_for_command"))
+        if status == 'success':
+            self.view.display_message(f"Commande reconnue : '{result}'")
+            return result
+        self.view.display_message(f"-> {result}")
+        return None
+
+    def _show_job_status(self, clean_command: str):
+        """ Affiche le statut de la tâche demandée ("statut 3"), ou de la dernière tâche. """
+        parts = clean_command.split()
+        if len(parts) > 1:
+            try:
+                job = self.jobs.get(int(parts[1]))
+            except ValueError:
+                self.view.display_message("-> Usage : 'statut <numéro de tâche>'.")
+                return
+        else:
+            jobs = self.jobs.list_jobs()
+            job = jobs[-1] if jobs else None
+        if job is None:
+            self.view.display_message("-> Aucune tâche correspondante.")
+        else:
+            self.view.display_job_status(job)
+
+    def _on_job_finished(self, job):
+        """ Annonce la fin d'une tâche de fond (en priorité si elle a échoué). """
+        priority = PRIORITY_URGENT if job.status == FAILED else None
+        self.view.display_message(f"[Tâche {job.id}] {job.description} : {job.status}. {job.message}",
+                                  speak=self.voice_mode_enabled, priority=priority)
+
+    def _submit_job(self, description: str, function, *args, on_done=None):
+        """ Lance une tâche de fond et indique son numéro à l'utilisateur. """
+        job = self.jobs.submit(description, function, *args, on_done=on_done)
+        message = f"-> Tâche {job.id} lancée en arrière-plan ('statut {job.id}' pour la suivre)."
+        self.view.display_message(message, speak=self.voice_mode_enabled)
+        return job
+
+    async def _wait_for_jobs(self):
+        """ Laisse les tâches de fond se terminer avant l'arrêt. """
+        active = self.jobs.active_jobs()
+        if active:
+            self.view.display_message(f"Attente de la fin de {len(active)} tâche(s) en cours...")
+            await self.jobs.wait_all()
+
+    async def _process_intent(self, nlp_result: dict):
         """
         Demande au Module 11 de planifier une action, puis l'exécute.
         """
         # 1. Obtenir un plan du "cerveau"
-        plan = self.neural_network.plan_action(nlp_result)
+        with self.profiler.stage("command.plan"):
+            plan = await run_blocking(self.neural_network.method("plan_action"), nlp_result)
 
         # 2. Exécuter le plan
         self.view.display_nlp_result(plan.get("params")) # On affiche toujours l'analyse
-        self._execute_plan(plan)
+        await self._execute_plan(plan)
 
-    def _execute_plan(self, plan: dict):
+    async def _execute_plan(self, plan: dict):
         """
         Exécute une action planifiée en utilisant un dictionnaire de dispatch.
+        Les gestionnaires sont des coroutines, ou des fonctions bloquantes exécutées dans un thread.
         """
         action = plan.get("action")
         params = plan.get("params")
@@ -135,10 +255,15 @@ class MainController:
 
         handler = action_handlers.get(action)
         if handler:
-            handler(params)
+            # Inclut la synthèse vocale, mesurée aussi séparément (command.speech).
+            with self.profiler.stage(f"command.handler.{action}"):
+                if asyncio.iscoroutinefunction(handler):
+                    await handler(params)
+                else:
+                    await run_blocking(handler, params)
         else:
             message = f"-> Je ne sais pas comment gérer l'action '{action}'. Pouvez-vous reformuler ?"
-            self.view.display_message(message, speak=self.voice_mode_enabled)
+            self.view.display_message(message, speak=self.voice_mode_enabled, priority=PRIORITY_URGENT)
 
     def _handle_speak_intent(self, params: dict):
         """ Gère l'intention de parler pour se présenter. """
@@ -147,9 +272,14 @@ class MainController:
 
     def _handle_learn_face_intent(self, params: dict):
         """ Gère l'intention d'apprendre un visage. """
+        self.view.display_message("Quel est votre nom ?", speak=self.voice_mode_enabled)
+        name = self.view.get_command().strip()
         message = "Je vais tenter d'apprendre votre visage. Veuillez regarder la caméra et ne pas bouger."
         self.view.display_message(message, speak=self.voice_mode_enabled)
-        success, message = self.facial_recognizer.learn_face()
+        if name:
+            success, message = self.facial_recognizer.learn_face(name)
+        else:
+            success, message = self.facial_recognizer.learn_face()
         self.view.display_message(f"-> {message}", speak=self.voice_mode_enabled)
 
     def _handle_verify_face_intent(self, params: dict):
@@ -159,24 +289,27 @@ class MainController:
         success, message = self.facial_recognizer.verify_face()
         self.view.display_message(f"-> {message}", speak=self.voice_mode_enabled)
 
-    def _handle_install_intent(self, params: dict):
-        """ Gère l'intention d'installer un paquet. """
+    async def _handle_install_intent(self, params: dict):
+        """ Gère l'intention d'installer un paquet (l'installation se fait en arrière-plan). """
         package_name = params.get("package_name")
         if not package_name:
             message = "-> Vous voulez installer un paquet, mais vous n'avez pas précisé lequel."
             self.view.display_message(message, speak=self.voice_mode_enabled)
             return
         prompt = f"Voulez-vous vraiment installer le paquet '{package_name}' ?"
-        if self.internet_controller.request_permission(prompt):
+        if await run_blocking(self.internet_controller.method("request_permission"), prompt):
             self.view.display_message(f"-> Lancement de l'installation de '{package_name}'...", speak=self.voice_mode_enabled)
-            success, message = self.internet_controller.install_package(package_name)
-            self.view.display_message(f"-> {message}", speak=self.voice_mode_enabled)
+            self._submit_job(f"Installation de '{package_name}'", self.internet_controller.method("install_package"), package_name)
         else:
             message = "-> Installation annulée."
             self.view.display_message(message, speak=self.voice_mode_enabled)
 
-    def _handle_search_intent(self, params: dict):
-        """ Gère l'intention de recherche web et le cycle d'apprentissage. """
+    async def _handle_search_intent(self, params: dict):
+        """
+        Gère l'intention de recherche web et le cycle d'apprentissage.
+        "plus" affiche la page de résultats suivante (servie par le cache de recherche).
+        La lecture et l'apprentissage de la page choisie se font en arrière-plan.
+        """
         query = params.get("search_query")
         if not query:
             message = "-> Vous voulez rechercher quelque chose, mais votre requête est vide."
@@ -184,36 +317,94 @@ class MainController:
             return
         message = f"Recherche en cours pour : '{query}'..."
         self.view.display_message(message, speak=self.voice_mode_enabled)
-        search_success, results = self.web_searcher.perform_search(query)
-        if not search_success:
-            self.view.display_message(f"-> {results}", speak=self.voice_mode_enabled)
-            return
-        self.view.display_search_results(results)
-        prompt = "Voulez-vous que j'apprenne le contenu d'un de ces liens ? Si oui, entrez son numéro. Sinon, tapez 'n'."
-        self.view.display_message(prompt, speak=self.voice_mode_enabled)
-        choice = self.view.get_command()
+        page = 1
+        while True:
+            search_success, results = await run_blocking(self.web_searcher.method("perform_search"), query, SEARCH_PAGE_SIZE, page)
+            if not search_success:
+                self.view.display_message(f"-> {results}", speak=self.voice_mode_enabled, priority=PRIORITY_URGENT)
+                return
+            self.view.display_search_results(results)
+            if all(result.get('local') for result in results):
+                message = "-> Recherche en ligne impossible : ces résultats viennent de mes connaissances."
+                self.view.display_message(message, speak=self.voice_mode_enabled)
+                return
+            prompt = ("Voulez-vous que j'apprenne le contenu de ces liens ? Entrez un numéro, plusieurs (ex: 1,3,5), "
+                      "'tout' pour tous les apprendre, 'plus' pour d'autres résultats, ou 'n' pour annuler.")
+            self.view.display_message(prompt, speak=self.voice_mode_enabled)
+            choice = await run_blocking(self.view.get_command)
+            if choice.lower().strip() not in ['plus', 'suivant', 'suivants']:
+                break
+            page += 1
         if choice.lower().strip() in ['n', 'non']:
             self.view.display_message("-> Apprentissage annulé.", speak=self.voice_mode_enabled)
             return
-        try:
-            choice_index = int(choice) - 1
-            if 0 <= choice_index < len(results):
-                url_to_learn = results[choice_index]['url']
-                self.view.display_message(f"-> Lecture de la page : {url_to_learn}", speak=self.voice_mode_enabled)
-                fetch_success, content = self.internet_controller.fetch_website_content(url_to_learn)
-                if fetch_success:
-                    self.view.display_message("-> Contenu récupéré. Début de l'analyse et de l'apprentissage...", speak=self.voice_mode_enabled)
-                    learn_success = self.raw_learner.learn_from_text(content, source_name=url_to_learn)
-                    if learn_success:
-                        self.view.display_message("-> Apprentissage terminé avec succès.", speak=self.voice_mode_enabled)
-                    else:
-                        self.view.display_message("-> Une erreur est survenue durant l'apprentissage.", speak=self.voice_mode_enabled)
-                else:
-                    self.view.display_message(f"-> Erreur lors de la récupération de la page : {content}", speak=self.voice_mode_enabled)
+        indexes = self._parse_selection(choice, len(results))
+        if not indexes:
+            self.view.display_message("-> Choix invalide. Apprentissage annulé.", speak=self.voice_mode_enabled)
+            return
+        urls = [results[i]['url'] for i in indexes]
+        for url in urls:
+            self.view.display_message(f"-> Lecture de la page : {url}")
+        # Peut demander une permission : reste au premier plan.
+        await run_blocking(self._ensure_dependencies)
+        description = f"Apprentissage de {urls[0]}" if len(urls) == 1 else f"Apprentissage de {len(urls)} pages"
+        self._submit_job(description, self._fetch_and_learn, urls)
+
+    @staticmethod
+    def _parse_selection(choice: str, count: int) -> list[int] | None:
+        """
+        Interprète le choix des résultats : "tout", "2", "1,3,5", "1 3" ou "2-4".
+        :return: Les indices (à partir de 0) sans doublons, ou None si le choix est invalide.
+        """
+        choice = choice.lower().strip()
+        if choice in ["tout", "tous", "all"]:
+            return list(range(count))
+        indexes = []
+        for part in choice.replace(",", " ").split():
+            start, _, end = part.partition("-")
+            try:
+                numbers = range(int(start), int(end or start) + 1)
+            except ValueError:
+                return None
+            for number in numbers:
+                if not 1 <= number <= count:
+                    return None
+                if number - 1 not in indexes:
+                    indexes.append(number - 1)
+        return indexes or None
+
+    def _fetch_and_learn(self, urls: list[str]) -> tuple[bool, str]:
+        """
+        Tâche de fond : récupère les pages en parallèle, puis les apprend toutes en une transaction.
+        Le délai de fetch_many ne porte que sur les lectures : l'apprentissage commence
+        une fois toutes les pages reçues (ou abandonnées).
+        :return: Un tuple (succès, message).
+        """
+        pages = []
+        errors = []
+        for url, fetch_success, content in self.internet_controller.fetch_many(urls):
+            if fetch_success:
+                pages.append((content, url))
             else:
-                self.view.display_message("-> Choix invalide.", speak=self.voice_mode_enabled)
-        except ValueError:
-            self.view.display_message("-> Entrée non valide. Apprentissage annulé.", speak=self.voice_mode_enabled)
+                errors.append(f"{url} : {content}")
+        learned = 0
+        if pages:
+            conflicted = self.raw_learner.learn_from_texts(pages)
+            for _, url in pages:
+                if conflicted is None:
+                    errors.append(f"{url} : une erreur est survenue durant l'apprentissage.")
+                elif url in conflicted:
+                    errors.append(f"{url} : page déjà apprise (au moins en partie).")
+                else:
+                    learned += 1
+        if len(urls) == 1:
+            if errors:
+                return False, f"Erreur lors de la récupération ou de l'apprentissage de la page : {errors[0]}"
+            return True, "Apprentissage terminé avec succès."
+        message = f"{learned}/{len(urls)} pages apprises."
+        if errors:
+            message += " Échecs :\n  " + "\n  ".join(errors)
+        return not errors, message
 
     def _handle_creation_intent(self, params: dict):
         """
@@ -235,9 +426,9 @@ class MainController:
             success, message = self.code_generator.create_web_project(project_name)
         self.view.display_message(f"-> {message}", speak=self.voice_mode_enabled)
 
-    def _handle_execution_intent(self, params: dict):
+    async def _handle_execution_intent(self, params: dict):
         """
-        Gère spécifiquement l'intention d'exécuter'.
+        Gère spécifiquement l'intention d'exécuter (le script tourne en arrière-plan).
         """
         project_name = params.get("project_name")
         if not project_name:
@@ -248,11 +439,20 @@ class MainController:
         script_path = os.path.join(project_path, "main.py")
         if not os.path.exists(script_path):
             message = f"-> Erreur: Impossible de trouver le script principal pour le projet '{project_name}'."
-            self.view.display_message(message, speak=self.voice_mode_enabled)
+            self.view.display_message(message, speak=self.voice_mode_enabled, priority=PRIORITY_URGENT)
             return
         message = f"-> Lancement du script pour le projet '{project_name}'..."
         self.view.display_message(message, speak=self.voice_mode_enabled)
-        success, stdout, stderr = self.code_executor.execute_python_script(script_path)
+        self._submit_job(f"Exécution du projet '{project_name}'", self.code_executor.method("execute_python_script"),
+                         script_path, on_done=self._on_execution_finished)
+
+    def _on_execution_finished(self, job):
+        """ Affiche la sortie d'un script exécuté en arrière-plan. """
+        if job.error:
+            self._on_job_finished(job)
+            return
+        self.view.display_message(f"[Tâche {job.id}] {job.description} :")
+        success, stdout, stderr = job.result
         self.view.display_execution_result(success, stdout, stderr, speak=self.voice_mode_enabled)
 
 
@@ -260,5 +460,17 @@ class MainController:
         """
         Arrête proprement les services et les modules.
         """
-        self.knowledge_base.close()
+        if self.jobs:
+            self.jobs.shutdown(wait=False)
+        if self.voice_synthesizer.is_loaded:
+            self.voice_synthesizer.close()
+        if self.voice_recognizer.is_loaded:
+            self.voice_recognizer.stop()
+        if self.facial_recognizer.is_loaded:
+            self.facial_recognizer.close()
+        if self.internet_controller.is_loaded:
+            self.internet_controller.close()
+        # Inutile de charger la base de connaissances juste pour la fermer.
+        if self.knowledge_base.is_loaded:
+            self.knowledge_base.close()
         self.view.display_shutdown_message()
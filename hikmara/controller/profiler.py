@@ -0,0 +1,171 @@
+# hikmara/controller/profiler.py
+import cProfile
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# Bornes supérieures des intervalles des histogrammes, en secondes (à la manière de Prometheus).
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+class Histogram:
+    """
+    Histogramme cumulatif des durées d'une étape : nombre, somme, min, max et intervalles.
+    """
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * len(self.buckets)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, seconds: float):
+        """ Enregistre une durée. """
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                self.bucket_counts[i] += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.min,
+            "max": self.max,
+            "buckets": {str(bound): n for bound, n in zip(self.buckets, self.bucket_counts)},
+        }
+
+class Profiler:
+    """
+    Mesure la durée des étapes de Hikmara (initialisation des modules, analyse NLP,
+    planification, traitement de l'action, synthèse vocale) et les agrège en histogrammes.
+    Les mesures sont exportables en JSON ou au format texte de Prometheus.
+    """
+    def __init__(self, enabled: bool = True, origin: float = None, buckets=DEFAULT_BUCKETS):
+        """
+        :param enabled: False pour ne rien mesurer (les appels deviennent sans effet).
+        :param origin: L'instant (time.perf_counter) du lancement, pour mesurer le temps de démarrage.
+        :param buckets: Les bornes des intervalles des histogrammes, en secondes.
+        """
+        self.enabled = enabled
+        self.origin = origin if origin is not None else time.perf_counter()
+        self.buckets = buckets
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float):
+        """ Enregistre la durée d'une étape. """
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    @contextmanager
+    def stage(self, stage: str):
+        """
+        Mesure la durée du bloc, même s'il lève une exception.
+        Usage : with profiler.stage("command.nlp"): ...
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def record_since_origin(self, stage: str):
+        """ Enregistre le temps écoulé depuis le lancement (ex: jusqu'au premier prompt). """
+        self.record(stage, time.perf_counter() - self.origin)
+
+    def summary(self) -> dict:
+        """ Retourne les histogrammes sous forme de dictionnaire {étape: statistiques}. """
+        with self._lock:
+            return {stage: histogram.to_dict() for stage, histogram in sorted(self.histograms.items())}
+
+    def format_summary(self) -> str:
+        """ Retourne un tableau lisible des durées moyennes et maximales par étape (en ms). """
+        lines = [f"{'Étape':<40} {'n':>6} {'moy. (ms)':>10} {'max (ms)':>10}"]
+        for stage, stats in self.summary().items():
+            lines.append(f"{stage:<40} {stats['count']:>6} {stats['mean'] * 1000:>10.1f} {stats['max'] * 1000:>10.1f}")
+        return "\n".join(lines)
+
+    def export(self, path: str):
+        """
+        Écrit les mesures dans un fichier : JSON si l'extension est .json,
+        format texte de Prometheus sinon (ex: .prom, .txt).
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            if path.endswith(".json"):
+                json.dump(self.summary(), f, indent=2)
+            else:
+                f.write(self.to_prometheus())
+
+    def to_prometheus(self) -> str:
+        """ Retourne les histogrammes au format d'exposition texte de Prometheus. """
+        name = "hikmara_stage_duration_seconds"
+        lines = [
+            f"# HELP {name} Durée des étapes de Hikmara.",
+            f"# TYPE {name} histogram",
+        ]
+        for stage, stats in self.summary().items():
+            for bound, n in stats["buckets"].items():
+                lines.append(f'{name}_bucket{{stage="{stage}",le="{bound}"}} {n}')
+            lines.append(f'{name}_bucket{{stage="{stage}",le="+Inf"}} {stats["count"]}')
+            lines.append(f'{name}_sum{{stage="{stage}"}} {stats["sum"]}')
+            lines.append(f'{name}_count{{stage="{stage}"}} {stats["count"]}')
+        return "\n".join(lines) + "\n"
+
+class CpuProfile:
+    """
+    Profil cProfile de tous les threads, y compris ceux de run_blocking et des tâches de fond.
+    Depuis Python 3.12, un seul profil actif couvre tous les threads (sys.monitoring) ;
+    avant, chaque nouveau thread reçoit son propre profil (threading.setprofile),
+    et les profils sont fusionnés à l'écriture.
+    """
+    def __init__(self):
+        self._profiles = []
+        self._lock = threading.Lock()
+
+    def start(self):
+        """ Active le profil sur le thread courant et sur les threads créés ensuite. """
+        self._add_profile()
+        if sys.version_info < (3, 12):
+            threading.setprofile(self._start_thread_profile)
+
+    def _start_thread_profile(self, frame, event, arg):
+        # Premier événement du nouveau thread : cProfile remplace ce rappel pour ce thread.
+        self._add_profile()
+
+    def _add_profile(self):
+        profile = cProfile.Profile()
+        with self._lock:
+            self._profiles.append(profile)
+        profile.enable()
+
+    def stop(self, path: str):
+        """ Désactive le profil et écrit les statistiques fusionnées (format pstats). """
+        threading.setprofile(None)
+        with self._lock:
+            profiles = list(self._profiles)
+        for profile in profiles:
+            profile.disable()
+        stats = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            try:
+                stats.add(profile)
+            except TypeError:
+                pass # Thread sans aucun appel enregistré
+        stats.dump_stats(path)
@@ -1,25 +1,63 @@
 # hikmara/main.py
 import sys
 import os
+import time
+import argparse
+
+_LAUNCH_TIME = time.perf_counter()
 
 # Ajout du chemin du projet au sys.path pour permettre les imports absolus
 sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
 
 from hikmara.controller.main_controller import MainController
+from hikmara.controller.profiler import CpuProfile, Profiler
 
-def main():
+def parse_args(argv=None):
     """
-    Point d'entrée principal de l'application Hikmara.
+    Analyse les options de la ligne de commande.
     """
-    print("--- Initialisation de Hikmara ---")
-    app_controller = MainController()
+    parser = argparse.ArgumentParser(description="Hikmara, assistante IA locale.")
+    parser.add_argument("--profile", metavar="FICHIER.prof",
+                        help="Profile l'exécution avec cProfile (tous les threads, commandes comprises) et écrit "
+                             "les statistiques dans ce fichier (lisible avec pstats, snakeviz ou flameprof).")
+    parser.add_argument("--metrics", metavar="FICHIER",
+                        help="Écrit les durées par étape à l'arrêt : JSON si le fichier finit par .json, "
+                             "format texte Prometheus sinon.")
+    return parser.parse_args(argv)
+
+def run(profiler: Profiler):
+    """
+    Crée le contrôleur et exécute la boucle principale jusqu'à l'arrêt.
+    """
+    app_controller = MainController(profiler=profiler)
     try:
         app_controller.start()
     except KeyboardInterrupt:
         print("\nInterruption par l'utilisateur détectée.")
     finally:
         app_controller.shutdown()
-        print("--- Hikmara terminée ---")
+
+def main(argv=None):
+    """
+    Point d'entrée principal de l'application Hikmara.
+    """
+    args = parse_args(argv)
+    print("--- Initialisation de Hikmara ---")
+    profiler = Profiler(origin=_LAUNCH_TIME)
+    if args.profile:
+        cpu_profile = CpuProfile()
+        cpu_profile.start()
+        try:
+            run(profiler)
+        finally:
+            cpu_profile.stop(args.profile)
+            print(f"Profil cProfile écrit dans '{args.profile}'.")
+    else:
+        run(profiler)
+    if args.metrics:
+        profiler.export(args.metrics)
+        print(f"Mesures écrites dans '{args.metrics}'.")
+    print("--- Hikmara terminée ---")
 
 if __name__ == "__main__":
     main()
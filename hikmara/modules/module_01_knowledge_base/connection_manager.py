@@ -0,0 +1,88 @@
+# hikmara/modules/module_01_knowledge_base/connection_manager.py
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+class ConnectionManager:
+    """
+    Gère les connexions SQLite de la base de connaissances.
+    Une seule connexion d'écriture (protégée par un verrou) et une connexion
+    de lecture par thread, en mode WAL pour que les lectures ne soient pas
+    bloquées par un apprentissage en cours.
+    """
+    DEFAULT_PRAGMAS = {
+        "synchronous": "NORMAL",    # Suffisant en WAL : pas de fsync à chaque commit
+        "mmap_size": 268435456,     # 256 Mo lus directement via la mémoire projetée
+        "cache_size": -65536,       # 64 Mo de cache de pages (valeur négative = Kio)
+        "temp_store": "MEMORY",
+    }
+
+    def __init__(self, db_path: str, pragmas: dict = None, timeout: float = 5.0):
+        """
+        Ouvre la connexion d'écriture et active le journal WAL.
+        :param db_path: Le chemin du fichier SQLite (ou ":memory:").
+        :param pragmas: Des pragmas supplémentaires ou remplaçant ceux par défaut.
+        :param timeout: Le délai d'attente (en secondes) lorsque la base est verrouillée.
+        """
+        self.db_path = db_path
+        self.timeout = timeout
+        self.pragmas = {**self.DEFAULT_PRAGMAS, **(pragmas or {})}
+        # Une base en mémoire n'existe que dans sa connexion : tout passe alors par l'écrivain.
+        self.in_memory = db_path == ":memory:"
+        self._write_lock = threading.RLock()
+        self._local = threading.local()
+        self._readers = []
+        self._readers_lock = threading.Lock()
+        self._writer = self._connect()
+        if not self.in_memory:
+            self._writer.execute("PRAGMA journal_mode=WAL")
+
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """ Ouvre une connexion configurée avec les pragmas de performance. """
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name}={value}")
+        if read_only:
+            conn.execute("PRAGMA query_only=ON")
+        return conn
+
+    @contextmanager
+    def write(self):
+        """
+        Fournit la connexion d'écriture de manière exclusive.
+        La transaction est validée à la sortie du bloc, ou annulée en cas d'exception.
+        """
+        with self._write_lock:
+            try:
+                yield self._writer
+                self._writer.commit()
+            except BaseException:
+                self._writer.rollback()
+                raise
+
+    @contextmanager
+    def read(self):
+        """
+        Fournit la connexion de lecture propre au thread courant (créée à la demande).
+        """
+        if self.in_memory:
+            with self._write_lock:
+                yield self._writer
+            return
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect(read_only=True)
+            self._local.conn = conn
+            with self._readers_lock:
+                self._readers.append(conn)
+        yield conn
+
+    def close(self):
+        """ Ferme toutes les connexions (lecture et écriture). """
+        with self._readers_lock:
+            for conn in self._readers:
+                conn.close()
+            self._readers.clear()
+        with self._write_lock:
+            self._writer.close()
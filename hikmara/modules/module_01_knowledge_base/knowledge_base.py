@@ -1,14 +1,27 @@
 # hikmara/modules/module_01_knowledge_base/knowledge_base.py
 import sqlite3
 import os
+import re
+from itertools import islice
+from hikmara.modules.module_01_knowledge_base.connection_manager import ConnectionManager
 
 class KnowledgeBase:
     """
     Gère la base de connaissances locale de Hikmara, stockée dans une base de données SQLite.
+    Peut être partagée entre threads : les écritures passent par une connexion unique,
+    les lectures par une connexion propre à chaque thread (voir ConnectionManager).
     """
-    def __init__(self, db_path="hikmara_knowledge.db"):
+    def __init__(self, db_path="hikmara_knowledge.db", batch_size=500, pragmas=None):
+        """
+        :param db_path: Le chemin du fichier SQLite.
+        :param batch_size: Le nombre de lignes envoyées par executemany lors des insertions en masse.
+        :param pragmas: Des pragmas SQLite remplaçant ceux par défaut du ConnectionManager.
+        """
         self.db_path = db_path
-        self.conn = None
+        self.batch_size = batch_size
+        self.pragmas = pragmas
+        self.connections = None
+        self.fts_enabled = False
         self._init_db()
 
     def _init_db(self):
@@ -17,70 +30,357 @@ class KnowledgeBase:
             db_dir = os.path.dirname(self.db_path)
             if db_dir:  # Ne rien faire si le chemin est local (ex: "test.db")
                 os.makedirs(db_dir, exist_ok=True)
-            self.conn = sqlite3.connect(self.db_path)
-            cursor = self.conn.cursor()
-            cursor.execute("""
-            CREATE TABLE IF NOT EXISTS knowledge (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                concept_name TEXT NOT NULL UNIQUE,
-                content TEXT NOT NULL,
-                source TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            """)
-            self.conn.commit()
+            self.connections = ConnectionManager(self.db_path, pragmas=self.pragmas)
+            with self.connections.write() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                CREATE TABLE IF NOT EXISTS knowledge (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    concept_name TEXT NOT NULL UNIQUE,
+                    content TEXT NOT NULL,
+                    source TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+                """)
+                self._init_manifest(cursor)
+                self.fts_enabled = self._init_fts(cursor)
         except sqlite3.Error:
             # En cas d'erreur à l'initialisation, il est préférable de ne pas continuer.
             # Un système de logging serait utile ici.
-            self.conn = None
+            if self.connections:
+                self.connections.close()
+            self.connections = None
+
+    def _init_manifest(self, cursor):
+        """
+        Crée le manifeste des fichiers appris et rattache chaque concept à son fichier d'origine.
+        La colonne 'origin' est ajoutée aux bases créées avant l'existence du manifeste.
+        La table 'concept_conflicts' retient les concepts qu'un fichier n'a pas pu enregistrer
+        parce qu'ils sont déjà définis, par un autre fichier ou plus haut dans le même fichier.
+        """
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS file_manifest (
+            path TEXT PRIMARY KEY,
+            size INTEGER NOT NULL,
+            mtime REAL NOT NULL,
+            content_hash TEXT NOT NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """)
+        columns = [row[1] for row in cursor.execute("PRAGMA table_info(knowledge)")]
+        if "origin" not in columns:
+            cursor.execute("ALTER TABLE knowledge ADD COLUMN origin TEXT")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_knowledge_origin ON knowledge (origin)")
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS concept_conflicts (
+            concept_name TEXT NOT NULL,
+            path TEXT NOT NULL,
+            PRIMARY KEY (concept_name, path)
+        )
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_concept_conflicts_path ON concept_conflicts (path)")
+
+    def _init_fts(self, cursor) -> bool:
+        """
+        Crée l'index plein texte FTS5 sur les concepts et le tient à jour par des triggers.
+        Si la base existait déjà sans index, celui-ci est reconstruit une fois.
+        :return: True si l'index est disponible, False si SQLite n'a pas été compilé avec FTS5.
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'knowledge_fts'")
+        already_exists = cursor.fetchone() is not None
+        try:
+            cursor.executescript("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS knowledge_fts USING fts5(
+                concept_name, content,
+                content='knowledge', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            );
+            CREATE TRIGGER IF NOT EXISTS knowledge_fts_ai AFTER INSERT ON knowledge BEGIN
+                INSERT INTO knowledge_fts (rowid, concept_name, content)
+                VALUES (new.id, new.concept_name, new.content);
+            END;
+            CREATE TRIGGER IF NOT EXISTS knowledge_fts_ad AFTER DELETE ON knowledge BEGIN
+                INSERT INTO knowledge_fts (knowledge_fts, rowid, concept_name, content)
+                VALUES ('delete', old.id, old.concept_name, old.content);
+            END;
+            CREATE TRIGGER IF NOT EXISTS knowledge_fts_au AFTER UPDATE ON knowledge BEGIN
+                INSERT INTO knowledge_fts (knowledge_fts, rowid, concept_name, content)
+                VALUES ('delete', old.id, old.concept_name, old.content);
+                INSERT INTO knowledge_fts (rowid, concept_name, content)
+                VALUES (new.id, new.concept_name, new.content);
+            END;
+            """)
+        except sqlite3.OperationalError:
+            # FTS5 indisponible : la recherche se rabattra sur un balayage LIKE.
+            return False
+        if not already_exists:
+            cursor.execute("INSERT INTO knowledge_fts (knowledge_fts) VALUES ('rebuild')")
+        return True
 
     def add_knowledge(self, concept_name: str, content: str, source: str = None) -> int:
-        if not self.conn: return None
+        if not self.connections: return None
         sql = "INSERT INTO knowledge (concept_name, content, source) VALUES (?, ?, ?)"
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(sql, (concept_name, content, source))
-            self.conn.commit()
+            with self.connections.write() as conn:
+                cursor = conn.cursor()
+                cursor.execute(sql, (concept_name, content, source))
             return cursor.lastrowid
         except (sqlite3.IntegrityError, sqlite3.Error):
             # En cas d'erreur (doublon ou autre), on retourne None.
             return None
 
+    def add_knowledge_many(self, rows, batch_size: int = None) -> tuple[int, list[str]] | None:
+        """
+        Insère un flux de concepts dans une seule transaction.
+        Les lignes sont consommées paresseusement et insérées par lots avec executemany,
+        ce qui évite un commit (et donc un fsync) par concept.
+        :param rows: Un itérable de tuples (concept_name, content, source).
+        :param batch_size: La taille des lots (par défaut, celle de l'instance).
+        :return: Un tuple (nombre de lignes insérées, noms des concepts en conflit),
+                 ou None en cas d'erreur SQLite (la transaction est alors annulée).
+        """
+        if not self.connections: return None
+        try:
+            # Une erreur du producteur (ex: analyse d'un fichier) annule aussi tout le lot.
+            with self.connections.write() as conn:
+                return self._insert_rows(conn.cursor(), rows, batch_size or self.batch_size)
+        except sqlite3.Error:
+            return None
+
+    def _insert_rows(self, cursor, rows, batch_size: int, origin: str = None) -> tuple[int, list[str]]:
+        """
+        Insère des concepts par lots dans la transaction en cours.
+        :return: Un tuple (nombre de lignes insérées, noms des concepts en conflit).
+        """
+        rows = iter(rows)
+        inserted = 0
+        conflicts = []
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            new_rows, batch_conflicts = self._filter_conflicts(cursor, batch, origin)
+            conflicts.extend(batch_conflicts)
+            if new_rows:
+                cursor.executemany(
+                    "INSERT INTO knowledge (concept_name, content, source, origin) VALUES (?, ?, ?, ?)",
+                    new_rows
+                )
+                inserted += len(new_rows)
+        return inserted, conflicts
+
+    def _filter_conflicts(self, cursor, batch: list, origin: str = None) -> tuple[list, list[str]]:
+        """
+        Sépare un lot en lignes insérables et en concepts déjà présents
+        (dans la base ou plus tôt dans le même lot).
+        """
+        names = list({row[0] for row in batch})
+        placeholders = ",".join("?" * len(names))
+        cursor.execute(f"SELECT concept_name FROM knowledge WHERE concept_name IN ({placeholders})", names)
+        seen = {row[0] for row in cursor.fetchall()}
+        new_rows = []
+        conflicts = []
+        for concept_name, content, source in batch:
+            if concept_name in seen:
+                conflicts.append(concept_name)
+            else:
+                seen.add(concept_name)
+                new_rows.append((concept_name, content, source, origin))
+        return new_rows, conflicts
+
+    def get_manifest(self, directory_path: str) -> dict[str, tuple[int, float, str]]:
+        """
+        Retourne les entrées du manifeste situées sous un dossier.
+        :param directory_path: Le chemin absolu du dossier.
+        :return: Un dictionnaire {chemin: (taille, mtime, empreinte du contenu)}.
+        """
+        if not self.connections: return {}
+        prefix = os.path.join(directory_path, "")
+        sql = "SELECT path, size, mtime, content_hash FROM file_manifest WHERE substr(path, 1, ?) = ?"
+        try:
+            with self.connections.read() as conn:
+                rows = conn.execute(sql, (len(prefix), prefix)).fetchall()
+            return {row["path"]: (row["size"], row["mtime"], row["content_hash"]) for row in rows}
+        except sqlite3.Error:
+            return {}
+
+    def get_known_files(self, directory_path: str) -> set[str]:
+        """
+        Retourne tous les fichiers connus sous un dossier : ceux du manifeste, ceux d'où
+        viennent des concepts et ceux dont des concepts sont masqués. Un fichier absent du
+        manifeste (échec d'écriture, base plus ancienne) peut ainsi être oublié à sa suppression.
+        :param directory_path: Le chemin absolu du dossier.
+        """
+        if not self.connections: return set()
+        prefix = os.path.join(directory_path, "")
+        sql = """
+        SELECT path FROM file_manifest WHERE substr(path, 1, ?) = ?
+        UNION SELECT origin FROM knowledge WHERE substr(origin, 1, ?) = ?
+        UNION SELECT path FROM concept_conflicts WHERE substr(path, 1, ?) = ?
+        """
+        try:
+            with self.connections.read() as conn:
+                rows = conn.execute(sql, (len(prefix), prefix) * 3).fetchall()
+            return {row[0] for row in rows}
+        except sqlite3.Error:
+            return set()
+
+    def sync_files(self, entries, batch_size: int = None) -> tuple[int, list[str]] | None:
+        """
+        Met à jour les concepts de plusieurs fichiers et le manifeste dans une seule transaction.
+        Pour chaque fichier modifié, les anciens concepts sont supprimés puis remplacés.
+        Les concepts masqués d'un fichier (déjà définis ailleurs, ou deux fois dans le fichier)
+        sont notés dans 'concept_conflicts' (voir purge_files) ; le fichier est tout de même
+        inscrit au manifeste, pour ne pas être réanalysé tant qu'il ne change pas.
+        :param entries: Un itérable de tuples (chemin, taille, mtime, empreinte, concepts).
+                        concepts vaut None si le contenu est inchangé : seul le manifeste est mis à jour.
+        :param batch_size: La taille des lots d'insertion (par défaut, celle de l'instance).
+        :return: Un tuple (nombre de concepts insérés, noms des nouveaux concepts en conflit), ou None
+                 en cas d'erreur. Les conflits déjà notés pour un fichier ne sont pas signalés à nouveau.
+        """
+        if not self.connections: return None
+        batch_size = batch_size or self.batch_size
+        inserted = 0
+        conflicts = []
+        try:
+            with self.connections.write() as conn:
+                cursor = conn.cursor()
+                for path, size, mtime, content_hash, concepts in entries:
+                    if concepts is not None:
+                        cursor.execute("SELECT concept_name FROM concept_conflicts WHERE path = ?", (path,))
+                        known_conflicts = {row[0] for row in cursor.fetchall()}
+                        cursor.execute("DELETE FROM knowledge WHERE origin = ?", (path,))
+                        cursor.execute("DELETE FROM concept_conflicts WHERE path = ?", (path,))
+                        file_inserted, file_conflicts = self._insert_rows(cursor, concepts, batch_size, origin=path)
+                        inserted += file_inserted
+                        conflicts.extend(name for name in file_conflicts if name not in known_conflicts)
+                        cursor.executemany(
+                            "INSERT OR IGNORE INTO concept_conflicts (concept_name, path) VALUES (?, ?)",
+                            [(name, path) for name in file_conflicts]
+                        )
+                    cursor.execute("""
+                    INSERT INTO file_manifest (path, size, mtime, content_hash) VALUES (?, ?, ?, ?)
+                    ON CONFLICT(path) DO UPDATE SET
+                        size = excluded.size, mtime = excluded.mtime,
+                        content_hash = excluded.content_hash, updated_at = CURRENT_TIMESTAMP
+                    """, (path, size, mtime, content_hash))
+            return inserted, conflicts
+        except sqlite3.Error:
+            return None
+
+    def purge_files(self, paths) -> tuple[int, list[str]]:
+        """
+        Oublie des fichiers supprimés : leurs concepts et leurs entrées du manifeste.
+        Les fichiers que ces concepts masquaient (voir sync_files) sont retirés du manifeste
+        et retournés, pour être appris à nouveau.
+        :param paths: Les chemins absolus des fichiers à oublier.
+        :return: Un tuple (nombre de concepts supprimés, fichiers à réapprendre), ou (0, []) en cas d'erreur.
+        """
+        if not self.connections: return 0, []
+        paths = list(paths)
+        removed = 0
+        shadowed = []
+        try:
+            with self.connections.write() as conn:
+                cursor = conn.cursor()
+                for path in paths:
+                    cursor.execute("""
+                    SELECT DISTINCT c.path FROM concept_conflicts AS c
+                    JOIN knowledge AS k ON k.concept_name = c.concept_name
+                    WHERE k.origin = ?
+                    """, (path,))
+                    shadowed.extend(row[0] for row in cursor.fetchall() if row[0] not in shadowed)
+                    cursor.execute("DELETE FROM knowledge WHERE origin = ?", (path,))
+                    removed += cursor.rowcount
+                    cursor.execute("DELETE FROM file_manifest WHERE path = ?", (path,))
+                    cursor.execute("DELETE FROM concept_conflicts WHERE path = ?", (path,))
+                shadowed = [path for path in shadowed if path not in paths]
+                cursor.executemany("DELETE FROM file_manifest WHERE path = ?", [(path,) for path in shadowed])
+            return removed, shadowed
+        except sqlite3.Error:
+            return 0, []
+
     def get_knowledge(self, concept_name: str) -> dict:
-        if not self.conn: return None
+        if not self.connections: return None
         sql = "SELECT * FROM knowledge WHERE concept_name = ?"
         try:
-            self.conn.row_factory = sqlite3.Row
-            cursor = self.conn.cursor()
-            cursor.execute(sql, (concept_name,))
-            row = cursor.fetchone()
+            with self.connections.read() as conn:
+                row = conn.execute(sql, (concept_name,)).fetchone()
             return dict(row) if row else None
         except sqlite3.Error:
             return None
 
+    def search(self, query: str, limit: int = 10, offset: int = 0) -> list[dict]:
+        """
+        Recherche des concepts par leur contenu, classés par pertinence (BM25).
+        :param query: Le texte recherché (mots libres, tous requis).
+        :param limit: Le nombre maximal de résultats.
+        :param offset: Le nombre de résultats à sauter (pagination).
+        :return: Une liste de dictionnaires (colonnes de 'knowledge', plus 'snippet' et 'score').
+                 Une liste vide si rien n'est trouvé ou en cas d'erreur.
+        """
+        if not self.connections: return []
+        terms = re.findall(r"\w+", query or "")
+        if not terms:
+            return []
+        if not self.fts_enabled:
+            return self._search_like(terms, limit, offset)
+        # Chaque terme est cité pour que la saisie utilisateur ne soit pas interprétée
+        # comme de la syntaxe FTS5 (opérateurs, colonnes, etc.).
+        match_query = " ".join(f'"{term}"' for term in terms)
+        sql = """
+        SELECT k.*,
+               snippet(knowledge_fts, 1, '[', ']', '...', 12) AS snippet,
+               bm25(knowledge_fts) AS score
+        FROM knowledge_fts
+        JOIN knowledge AS k ON k.id = knowledge_fts.rowid
+        WHERE knowledge_fts MATCH ?
+        ORDER BY score
+        LIMIT ? OFFSET ?
+        """
+        try:
+            with self.connections.read() as conn:
+                rows = conn.execute(sql, (match_query, limit, offset)).fetchall()
+            return [dict(row) for row in rows]
+        except sqlite3.Error:
+            return []
+
+    def _search_like(self, terms: list[str], limit: int, offset: int) -> list[dict]:
+        """
+        Recherche de secours sans index, utilisée si FTS5 n'est pas disponible.
+        """
+        conditions = " AND ".join("content LIKE ?" for _ in terms)
+        sql = f"SELECT *, substr(content, 1, 80) AS snippet, 0.0 AS score FROM knowledge WHERE {conditions} LIMIT ? OFFSET ?"
+        try:
+            with self.connections.read() as conn:
+                rows = conn.execute(sql, [f"%{term}%" for term in terms] + [limit, offset]).fetchall()
+            return [dict(row) for row in rows]
+        except sqlite3.Error:
+            return []
+
     def update_knowledge(self, concept_name: str, new_content: str) -> bool:
-        if not self.conn: return False
+        if not self.connections: return False
         sql = "UPDATE knowledge SET content = ? WHERE concept_name = ?"
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(sql, (new_content, concept_name))
-            self.conn.commit()
+            with self.connections.write() as conn:
+                cursor = conn.cursor()
+                cursor.execute(sql, (new_content, concept_name))
             return cursor.rowcount > 0
         except sqlite3.Error:
             return False
 
     def delete_knowledge(self, concept_name: str) -> bool:
-        if not self.conn: return False
+        if not self.connections: return False
         sql = "DELETE FROM knowledge WHERE concept_name = ?"
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(sql, (concept_name,))
-            self.conn.commit()
+            with self.connections.write() as conn:
+                cursor = conn.cursor()
+                cursor.execute(sql, (concept_name,))
             return cursor.rowcount > 0
         except sqlite3.Error:
             return False
 
     def close(self):
-        if self.conn:
-            self.conn.close()
-            self.conn = None
+        if self.connections:
+            self.connections.close()
+            self.connections = None
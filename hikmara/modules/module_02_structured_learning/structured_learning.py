@@ -30,4 +30,44 @@ class StructuredLearner:
             return new_id is not None
         except Exception:
             # En cas d'erreur (ex: données NLTK manquantes), on retourne False
-            return False
\ No newline at end of file
+            return False
+
+    def learn_concepts(self, concepts, batch_size: int = None, tokenize: bool = True) -> bool:
+        """
+        Analyse et apprend un flux de concepts en une seule transaction.
+        Les concepts sont transmis paresseusement à KnowledgeBase.add_knowledge_many.
+        :param concepts: Un itérable de tuples (concept_name, content, source).
+        :param batch_size: La taille des lots d'insertion (par défaut, celle de la base).
+        :param tokenize: False si les concepts ont déjà été filtrés et tokenisés (voir prepare_concepts).
+        :return: True si tous les concepts ont été stockés, False sinon (conflit ou erreur).
+        """
+        result = self.store_concepts(concepts, batch_size, tokenize)
+        if result is None:
+            return False
+        _, conflicts = result
+        return not conflicts
+
+    def store_concepts(self, concepts, batch_size: int = None, tokenize: bool = True) -> tuple[int, list[str]] | None:
+        """
+        Variante détaillée de learn_concepts.
+        :return: Un tuple (nombre de concepts insérés, noms des concepts en conflit), ou None en cas d'erreur.
+        """
+        try:
+            if tokenize:
+                concepts = self.prepare_concepts(concepts)
+            return self.kb.add_knowledge_many(concepts, batch_size)
+        except Exception:
+            # En cas d'erreur (ex: données NLTK manquantes), on retourne None
+            return None
+
+    @staticmethod
+    def prepare_concepts(concepts):
+        """
+        Filtre les contenus vides et tokenise chaque concept avant son stockage.
+        Sans état, elle peut être exécutée dans un processus de travail.
+        """
+        for concept_name, content, source in concepts:
+            if not content or not content.strip():
+                continue # Ce n'est pas une erreur
+            nltk.word_tokenize(content)
+            yield concept_name, content, source
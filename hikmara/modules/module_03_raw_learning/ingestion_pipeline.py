@@ -0,0 +1,274 @@
+# hikmara/modules/module_03_raw_learning/ingestion_pipeline.py
+import hashlib
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from hikmara.modules.module_02_structured_learning.structured_learning import StructuredLearner
+
+# Statuts retournés par les processus de travail
+PARSED = "parsed"
+UNCHANGED = "unchanged"
+STREAM = "stream"
+FAILED = "failed"
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+def _pool_context():
+    """
+    Le mode de démarrage des processus d'analyse : jamais fork, car le processus parent a
+    des threads actifs (écrivain, boucle asyncio...) et une connexion SQLite ouverte, qu'un
+    fork copierait dans un état incohérent. forkserver si disponible (POSIX), spawn sinon.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+def _parse_file(parser, filepath: str, known_hash: str = None, stream: bool = False) -> tuple:
+    """
+    Tâche exécutée dans un processus de travail : lit, empreinte, analyse et tokenise un fichier.
+    L'analyse est évitée si l'empreinte du contenu est identique à celle du manifeste.
+    Un fichier volumineux (stream=True) est seulement empreint par morceaux : son analyse
+    est laissée à l'écrivain, qui le lit en flux pour ne jamais le charger en mémoire.
+    :return: Un tuple (chemin, statut, taille, mtime, empreinte, concepts prêts à être stockés).
+    """
+    try:
+        stat = os.stat(filepath)
+        digest = hashlib.sha256()
+        with open(filepath, 'rb') as f:
+            if stream:
+                for block in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                    digest.update(block)
+            else:
+                data = f.read()
+                digest.update(data)
+        content_hash = digest.hexdigest()
+        if content_hash == known_hash:
+            return filepath, UNCHANGED, stat.st_size, stat.st_mtime, content_hash, None
+        if stream:
+            return filepath, STREAM, stat.st_size, stat.st_mtime, content_hash, None
+        concepts = list(StructuredLearner.prepare_concepts(parser(filepath, data.decode('utf-8'))))
+        return filepath, PARSED, stat.st_size, stat.st_mtime, content_hash, concepts
+    except Exception:
+        return filepath, FAILED, None, None, None, None
+
+class IngestionPipeline:
+    """
+    Pipeline producteur/consommateur pour l'apprentissage incrémental d'un dossier.
+    Un pool de processus analyse et tokenise les fichiers ; un unique thread écrivain
+    vide la file des résultats et les stocke par lots dans la base de connaissances.
+    Les files sont bornées : si l'écriture prend du retard, l'analyse est mise en pause.
+    Le manifeste de la base (taille, mtime, empreinte) permet d'ignorer les fichiers
+    inchangés sans les lire et d'oublier les fichiers supprimés.
+    """
+    def __init__(self, structured_learner: StructuredLearner, parser, stream_parser=None,
+                 stream_threshold: int = 16 * 1024 * 1024, workers: int = None,
+                 max_pending: int = None, files_per_write: int = 32, progress_callback=None,
+                 worker_initializer=None):
+        """
+        :param structured_learner: L'instance dont la base de connaissances reçoit les concepts.
+        :param parser: Une fonction picklable (chemin, contenu -> concepts) exécutée dans les processus.
+        :param stream_parser: Une fonction (chemin -> générateur de concepts) utilisée par l'écrivain
+                              pour les fichiers plus gros que stream_threshold (en octets).
+        :param workers: Le nombre de processus d'analyse (par défaut, le nombre de cœurs ; 1 = séquentiel).
+        :param max_pending: Le nombre maximal de fichiers en cours d'analyse ou en attente d'écriture.
+        :param files_per_write: Le nombre maximal de fichiers regroupés dans une même transaction.
+        :param progress_callback: Une fonction appelée avec le rapport intermédiaire après chaque écriture.
+        :param worker_initializer: Une fonction picklable exécutée au démarrage de chaque processus d'analyse
+                                   (les processus ne sont pas des copies du parent, voir _pool_context).
+        """
+        self.kb = structured_learner.kb
+        self.parser = parser
+        self.stream_parser = stream_parser
+        self.stream_threshold = stream_threshold
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 4
+        self.files_per_write = files_per_write
+        self.progress_callback = progress_callback
+        self.worker_initializer = worker_initializer
+
+    def run(self, directory_path: str) -> dict:
+        """
+        Synchronise la base de connaissances avec le contenu d'un dossier.
+        :return: Un dictionnaire (fichiers traités, ignorés, supprimés, échecs, concepts, conflits, durée et débits).
+        """
+        report = {
+            "files": 0,
+            "skipped_files": 0,
+            "removed_files": 0,
+            "failed_files": 0,
+            "concepts": 0,
+            "conflicts": 0,
+            "elapsed": 0.0,
+            "files_per_second": 0.0,
+            "concepts_per_second": 0.0,
+        }
+        start = time.perf_counter()
+        directory_path = os.path.abspath(directory_path)
+        manifest = self.kb.get_manifest(directory_path)
+        seen = set()
+        # Le parcours complet précède l'analyse : les fichiers supprimés sont oubliés d'abord,
+        # pour que les fichiers dont ils masquaient des concepts puissent les enregistrer.
+        tasks = list(self._iter_changed_files(directory_path, manifest, seen, report))
+        deleted = [path for path in self.kb.get_known_files(directory_path) | set(manifest) if path not in seen]
+        if deleted:
+            _, shadowed = self.kb.purge_files(deleted)
+            report["removed_files"] = len(deleted)
+            tasks.extend(self._shadowed_tasks(shadowed, {task[0] for task in tasks}))
+
+        results = queue.Queue(maxsize=self.max_pending)
+        writer = threading.Thread(target=self._write_results, args=(results, report, start), daemon=True)
+        writer.start()
+        try:
+            # Peu de fichiers à analyser : démarrer des processus coûterait plus que l'analyse.
+            if self.workers <= 1 or len(tasks) <= 1:
+                for filepath, known_hash, stream in tasks:
+                    results.put(_parse_file(self.parser, filepath, known_hash, stream))
+            else:
+                self._parse_in_pool(tasks, results)
+        finally:
+            results.put(None)
+            writer.join()
+
+        self._update_rates(report, start)
+        return report
+
+    def _shadowed_tasks(self, paths: list[str], queued: set):
+        """
+        Produit les fichiers (éventuellement hors du dossier) dont des concepts étaient masqués
+        par un fichier supprimé : ils sont réappris en entier.
+        """
+        for filepath in paths:
+            if filepath in queued:
+                continue
+            try:
+                size = os.path.getsize(filepath)
+            except OSError:
+                continue # Fichier lui-même supprimé entre-temps
+            yield filepath, None, self.stream_parser is not None and size > self.stream_threshold
+
+    def _iter_changed_files(self, directory_path: str, manifest: dict, seen: set, report: dict):
+        """
+        Parcourt le dossier et produit les fichiers nouveaux ou modifiés.
+        Un fichier dont la taille et le mtime correspondent au manifeste est ignoré sans être lu.
+        :return: Un générateur de tuples (chemin, empreinte connue ou None, lecture en flux).
+        """
+        for root, _, files in os.walk(directory_path):
+            for filename in files:
+                filepath = os.path.join(root, filename)
+                seen.add(filepath)
+                try:
+                    stat = os.stat(filepath)
+                except OSError:
+                    continue
+                known = manifest.get(filepath)
+                if known and (stat.st_size, stat.st_mtime) == known[:2]:
+                    report["skipped_files"] += 1
+                    continue
+                stream = self.stream_parser is not None and stat.st_size > self.stream_threshold
+                yield filepath, known[2] if known else None, stream
+
+    def _parse_in_pool(self, tasks: list, results: queue.Queue):
+        """
+        Soumet les fichiers au pool en limitant le nombre de tâches en vol.
+        L'appel bloquant à results.put freine la soumission lorsque l'écrivain est en retard.
+        Si le pool se casse (processus tué, module principal non réimportable...), les fichiers
+        en vol sont comptés en échec et ceux pas encore soumis sont analysés dans ce processus.
+        """
+        pending = {} # future -> chemin
+        submitted = 0
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers, mp_context=_pool_context(),
+                                     initializer=self.worker_initializer) as pool:
+                for filepath, known_hash, stream in tasks:
+                    if len(pending) >= self.max_pending:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        self._put_done(done, pending, results)
+                    pending[pool.submit(_parse_file, self.parser, filepath, known_hash, stream)] = filepath
+                    submitted += 1
+        except (BrokenProcessPool, OSError):
+            pass
+        # À la sortie du bloc with, toutes les tâches soumises sont terminées (ou en échec).
+        self._put_done(wait(pending).done, pending, results)
+        for filepath, known_hash, stream in tasks[submitted:]:
+            results.put(_parse_file(self.parser, filepath, known_hash, stream))
+
+    @staticmethod
+    def _put_done(done, pending: dict, results: queue.Queue):
+        """ Transmet à l'écrivain les résultats des tâches terminées ; une tâche en erreur est un échec. """
+        for future in done:
+            filepath = pending.pop(future)
+            try:
+                result = future.result()
+            except Exception:
+                result = (filepath, FAILED, None, None, None, None)
+            results.put(result)
+
+    def _write_results(self, results: queue.Queue, report: dict, start: float):
+        """
+        Boucle de l'écrivain : regroupe les résultats disponibles et les stocke en une transaction.
+        """
+        finished = False
+        while not finished:
+            batch = [results.get()]
+            while len(batch) < self.files_per_write:
+                try:
+                    batch.append(results.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batch:
+                finished = True
+                batch = [item for item in batch if item is not None]
+            if not batch:
+                continue
+            try:
+                self._write_batch(batch, report)
+                self._update_rates(report, start)
+                if self.progress_callback:
+                    self.progress_callback(dict(report))
+            except Exception:
+                # L'écrivain ne doit jamais s'arrêter : le producteur resterait bloqué sur la file.
+                report["failed_files"] += len(batch)
+
+    def _write_batch(self, batch: list, report: dict):
+        """
+        Remplace les concepts des fichiers analysés et met à jour le manifeste.
+        Les fichiers en échec ne sont pas inscrits au manifeste : ils seront retentés.
+        Les fichiers lus en flux ont chacun leur transaction, pour qu'une erreur de lecture
+        en cours de route n'annule pas le reste du lot.
+        """
+        entries = []
+        streamed = []
+        for filepath, status, size, mtime, content_hash, concepts in batch:
+            if status == STREAM:
+                streamed.append((filepath, size, mtime, content_hash))
+            elif status != FAILED:
+                entries.append((filepath, size, mtime, content_hash, concepts))
+        report["files"] += len(batch)
+        report["failed_files"] += len(batch) - len(entries) - len(streamed)
+        if entries:
+            self._sync(entries, report)
+        for filepath, size, mtime, content_hash in streamed:
+            concepts = StructuredLearner.prepare_concepts(self.stream_parser(filepath))
+            try:
+                self._sync([(filepath, size, mtime, content_hash, concepts)], report)
+            except Exception:
+                report["failed_files"] += 1
+
+    def _sync(self, entries: list, report: dict):
+        result = self.kb.sync_files(entries)
+        if result is None:
+            report["failed_files"] += len(entries)
+            return
+        inserted, conflicts = result
+        report["concepts"] += inserted
+        report["conflicts"] += len(conflicts)
+
+    def _update_rates(self, report: dict, start: float):
+        elapsed = time.perf_counter() - start
+        report["elapsed"] = elapsed
+        if elapsed > 0:
+            report["files_per_second"] = report["files"] / elapsed
+            report["concepts_per_second"] = report["concepts"] / elapsed
@@ -4,6 +4,12 @@ import nltk
 import ast
 import re
 from hikmara.modules.module_02_structured_learning.structured_learning import StructuredLearner
+from hikmara.modules.module_03_raw_learning.ingestion_pipeline import IngestionPipeline
+
+PHP_BLOCK_PATTERN = re.compile(r'<\?php(.*?)\?>', re.DOTALL)
+
+# Taille des morceaux lus lors de l'apprentissage en flux (en caractères)
+TEXT_CHUNK_SIZE = 64 * 1024
 
 class RawLearner:
     """
@@ -15,6 +21,7 @@ class RawLearner:
         if structured_learner is None:
             raise ValueError("L'instance de StructuredLearner ne peut pas être None.")
         self.structured_learner = structured_learner
+        self.last_report = None
 
     def learn_from_file(self, filepath: str) -> bool:
         """
@@ -31,15 +38,65 @@ class RawLearner:
     def _learn_from_text_file(self, filepath: str) -> bool:
         """
         Analyse un fichier texte en le segmentant en phrases.
-        Utilise la méthode générique learn_from_text.
+        Le fichier est lu en flux (voir learn_from_stream) : la mémoire reste bornée
+        quelle que soit sa taille.
         """
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-            return self.learn_from_text(content, os.path.basename(filepath))
+                return self.learn_from_stream(f, os.path.basename(filepath))
         except (FileNotFoundError, Exception):
             return False
 
+    def learn_from_stream(self, stream, source_name: str, chunk_size: int = TEXT_CHUNK_SIZE) -> bool:
+        """
+        Apprend un texte de taille arbitraire, lu morceau par morceau.
+        Les phrases sont produites paresseusement et écrites par lots.
+        :param stream: Un fichier texte ouvert (méthode read) ou un itérable de chaînes.
+        :param source_name: Le nom de la source (ex: URL ou nom de fichier).
+        :param chunk_size: La taille des morceaux lus depuis un fichier.
+        :return: True si l'apprentissage est réussi, False sinon.
+        """
+        try:
+            sentences = self.iter_sentences(stream, chunk_size)
+            return self.structured_learner.learn_concepts(
+                self._iter_sentence_concepts(sentences, source_name)
+            )
+        except Exception:
+            return False
+
+    @staticmethod
+    def iter_sentences(stream, chunk_size: int = TEXT_CHUNK_SIZE, max_carry: int = None):
+        """
+        Segmente un flux de texte en phrases sans le charger entièrement.
+        La dernière phrase de chaque morceau peut être coupée : elle est reportée
+        en tête du morceau suivant et segmentée à nouveau.
+        :param max_carry: La longueur au-delà de laquelle une phrase sans fin est émise telle quelle
+                          (par défaut, 4 fois la taille d'un morceau).
+        """
+        max_carry = max_carry or 4 * chunk_size
+        if hasattr(stream, 'read'):
+            chunks = iter(lambda: stream.read(chunk_size), '')
+        else:
+            chunks = iter(stream)
+        carry = ""
+        for chunk in chunks:
+            buffer = carry + chunk
+            sentences = nltk.sent_tokenize(buffer)
+            if not sentences:
+                carry = ""
+                continue
+            # On reporte le texte brut à partir de la dernière phrase (espaces de fin compris),
+            # pour ne pas coller sa fin au début du morceau suivant.
+            last = sentences.pop()
+            position = buffer.rfind(last)
+            carry = buffer[position:] if position >= 0 else last
+            yield from sentences
+            if len(carry) > max_carry:
+                yield carry
+                carry = ""
+        if carry.strip():
+            yield carry
+
     def learn_from_text(self, text_content: str, source_name: str) -> bool:
         """
         Analyse un contenu textuel (depuis une chaîne) en le segmentant en phrases.
@@ -52,16 +109,43 @@ class RawLearner:
             if not sentences:
                 return True  # Pas une erreur s'il n'y a rien à apprendre
 
-            all_successful = True
-            for i, sentence in enumerate(sentences):
-                # On crée un nom de concept unique pour chaque phrase
-                concept_name = f"{source_name}_sentence_{i+1}"
-                if not self.structured_learner.learn_concept(concept_name, sentence.strip(), source_name):
-                    all_successful = False
-            return all_successful
+            return self.structured_learner.learn_concepts(
+                self._iter_sentence_concepts(sentences, source_name)
+            )
         except Exception:
             return False
 
+    def learn_from_texts(self, texts) -> list[str] | None:
+        """
+        Apprend plusieurs contenus textuels (ex: des pages web) en une seule transaction.
+        :param texts: Un itérable de tuples (contenu textuel, nom de la source).
+        :return: Les sources dont des phrases étaient déjà connues (conflits),
+                 ou None en cas d'erreur (rien n'est alors enregistré).
+        """
+        concepts = (
+            concept
+            for text_content, source_name in texts
+            for concept in self._iter_sentence_concepts(nltk.sent_tokenize(text_content), source_name)
+        )
+        result = self.structured_learner.store_concepts(concepts)
+        if result is None:
+            return None
+        _, conflicts = result
+        sources = []
+        for concept_name in conflicts:
+            source_name = concept_name.rpartition("_sentence_")[0]
+            if source_name not in sources:
+                sources.append(source_name)
+        return sources
+
+    @staticmethod
+    def _iter_sentence_concepts(sentences, source_name: str):
+        """
+        Produit un concept par phrase, avec un nom unique dérivé de la source.
+        """
+        for i, sentence in enumerate(sentences):
+            yield f"{source_name}_sentence_{i+1}", sentence.strip(), source_name
+
     def _learn_from_python_file(self, filepath: str) -> bool:
         """
         Analyse un fichier de code Python et apprend ses fonctions, classes (avec héritage), et imports.
@@ -71,59 +155,97 @@ class RawLearner:
                 source_code = f.read()
 
             tree = ast.parse(source_code)
-            all_successful = True
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    concept_name = f"py_class:{node.name}"
-                    content = ast.get_docstring(node) or f"Classe '{node.name}' sans docstring."
-                    parent_classes = [base.id for base in node.bases if isinstance(base, ast.Name)]
-                    if parent_classes:
-                        content += f"\nHérite de : {parent_classes}."
-                    if not self.structured_learner.learn_concept(concept_name, content, filepath):
-                        all_successful = False
-
-                elif isinstance(node, ast.FunctionDef):
-                    concept_name = f"py_function:{node.name}"
-                    content = ast.get_docstring(node) or f"Fonction '{node.name}' sans docstring."
-                    args = [a.arg for a in node.args.args]
-                    if args:
-                        content += f"\nArguments : {args}."
-                    if not self.structured_learner.learn_concept(concept_name, content, filepath):
-                        all_successful = False
-
-                elif isinstance(node, ast.Import):
-                    for alias in node.names:
-                        concept_name = f"py_import:{alias.name}"
-                        content = f"Module '{alias.name}' importé dans {os.path.basename(filepath)}."
-                        if not self.structured_learner.learn_concept(concept_name, content, filepath):
-                            all_successful = False
-
-                elif isinstance(node, ast.ImportFrom):
-                    module = node.module or 'local'
-                    for alias in node.names:
-                        concept_name = f"py_import_from:{module}.{alias.name}"
-                        content = f"'{alias.name}' importé depuis le module '{module}' dans {os.path.basename(filepath)}."
-                        if not self.structured_learner.learn_concept(concept_name, content, filepath):
-                            all_successful = False
-            return all_successful
+            return self.structured_learner.learn_concepts(self._iter_python_concepts(tree, filepath))
         except (FileNotFoundError, SyntaxError, Exception):
             return False
 
-    def learn_from_directory(self, directory_path: str) -> bool:
+    @staticmethod
+    def _iter_python_concepts(tree: ast.AST, filepath: str):
+        """
+        Parcourt l'arbre syntaxique et produit les concepts (classes, fonctions, imports).
+        """
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ClassDef):
+                content = ast.get_docstring(node) or f"Classe '{node.name}' sans docstring."
+                parent_classes = [base.id for base in node.bases if isinstance(base, ast.Name)]
+                if parent_classes:
+                    content += f"\nHérite de : {parent_classes}."
+                yield f"py_class:{node.name}", content, filepath
+
+            elif isinstance(node, ast.FunctionDef):
+                content = ast.get_docstring(node) or f"Fonction '{node.name}' sans docstring."
+                args = [a.arg for a in node.args.args]
+                if args:
+                    content += f"\nArguments : {args}."
+                yield f"py_function:{node.name}", content, filepath
+
+            elif isinstance(node, ast.Import):
+                for alias in node.names:
+                    content = f"Module '{alias.name}' importé dans {os.path.basename(filepath)}."
+                    yield f"py_import:{alias.name}", content, filepath
+
+            elif isinstance(node, ast.ImportFrom):
+                module = node.module or 'local'
+                for alias in node.names:
+                    content = f"'{alias.name}' importé depuis le module '{module}' dans {os.path.basename(filepath)}."
+                    yield f"py_import_from:{module}.{alias.name}", content, filepath
+
+    def learn_from_directory(self, directory_path: str, workers: int = None, progress_callback=None,
+                             worker_initializer=None) -> bool:
         """
         Parcourt un dossier récursivement et apprend de chaque fichier trouvé.
+        L'analyse est répartie sur plusieurs processus et l'écriture confiée à un seul thread
+        (voir IngestionPipeline). Le rapport détaillé est conservé dans self.last_report.
+        :param workers: Le nombre de processus d'analyse (par défaut, le nombre de cœurs ; 1 = séquentiel).
+        :param progress_callback: Une fonction appelée avec le rapport intermédiaire après chaque écriture.
+        :param worker_initializer: Une fonction picklable exécutée au démarrage de chaque processus d'analyse.
+        L'apprentissage est incrémental : les fichiers inchangés depuis le dernier passage sont ignorés,
+        les fichiers modifiés voient leurs concepts remplacés et ceux supprimés sont oubliés.
         """
         if not os.path.isdir(directory_path):
             return False
 
-        overall_success = True
-        for root, _, files in os.walk(directory_path):
-            for filename in files:
-                file_path = os.path.join(root, filename)
-                if not self.learn_from_file(file_path):
-                    overall_success = False
-        return overall_success
+        pipeline = IngestionPipeline(
+            self.structured_learner, RawLearner.extract_concepts,
+            stream_parser=RawLearner.stream_concepts,
+            workers=workers, progress_callback=progress_callback, worker_initializer=worker_initializer
+        )
+        self.last_report = pipeline.run(directory_path)
+        return self.last_report["failed_files"] == 0 and self.last_report["conflicts"] == 0
+
+    @staticmethod
+    def stream_concepts(filepath: str, chunk_size: int = TEXT_CHUNK_SIZE):
+        """
+        Variante en flux de extract_concepts, pour les fichiers volumineux.
+        Les fichiers texte sont segmentés morceau par morceau ; le code (.py, .php),
+        qui doit être analysé d'un bloc, est lu entièrement.
+        """
+        if filepath.endswith(('.py', '.php')):
+            yield from RawLearner.extract_concepts(filepath)
+            return
+        with open(filepath, 'r', encoding='utf-8') as f:
+            yield from RawLearner._iter_sentence_concepts(
+                RawLearner.iter_sentences(f, chunk_size), os.path.basename(filepath)
+            )
+
+    @staticmethod
+    def extract_concepts(filepath: str, content: str = None) -> list:
+        """
+        Retourne les concepts d'un fichier sans les stocker, selon son extension.
+        Sans état, elle peut être exécutée dans un processus de travail.
+        Lève une exception si le fichier ne peut pas être lu ou analysé.
+        :param content: Le contenu déjà lu du fichier (sinon, il est lu depuis le disque).
+        """
+        if content is None:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                content = f.read()
+        if filepath.endswith('.py'):
+            concepts = RawLearner._iter_python_concepts(ast.parse(content), filepath)
+        elif filepath.endswith('.php'):
+            concepts = RawLearner._iter_php_concepts(PHP_BLOCK_PATTERN.findall(content), filepath)
+        else:
+            concepts = RawLearner._iter_sentence_concepts(nltk.sent_tokenize(content), os.path.basename(filepath))
+        return list(concepts)
 
     def _learn_from_php_file(self, filepath: str) -> bool:
         """
@@ -133,16 +255,19 @@ class RawLearner:
             with open(filepath, 'r', encoding='utf-8') as f:
                 content = f.read()
 
-            php_blocks = re.findall(r'<\?php(.*?)\?>', content, re.DOTALL)
+            php_blocks = PHP_BLOCK_PATTERN.findall(content)
             if not php_blocks:
                 return True
 
-            base_filename = os.path.basename(filepath)
-            all_successful = True
-            for i, block in enumerate(php_blocks):
-                concept_name = f"php_block_{i+1}_from_{base_filename}"
-                if not self.structured_learner.learn_concept(concept_name, block.strip(), filepath):
-                    all_successful = False
-            return all_successful
+            return self.structured_learner.learn_concepts(self._iter_php_concepts(php_blocks, filepath))
         except (FileNotFoundError, Exception):
-            return False
\ No newline at end of file
+            return False
+
+    @staticmethod
+    def _iter_php_concepts(php_blocks: list, filepath: str):
+        """
+        Produit un concept par bloc de code PHP.
+        """
+        base_filename = os.path.basename(filepath)
+        for i, block in enumerate(php_blocks):
+            yield f"php_block_{i+1}_from_{base_filename}", block.strip(), filepath
@@ -0,0 +1,82 @@
+# hikmara/modules/module_04_nlp/intent_matcher.py
+import json
+from spacy.matcher import PhraseMatcher
+
+# --- Vocabulaire par défaut ---
+# L'ordre des intentions fixe leur priorité lorsque plusieurs sont reconnues.
+DEFAULT_INTENT_KEYWORDS = {
+    "create": ["crée", "créer", "fabrique", "génère"],
+    "execute": ["exécute", "exécuter", "lance", "lancer", "démarre"],
+    "install": ["installe", "installer", "télécharge"],
+    "search": ["recherche", "cherche", "trouve"],
+    "speak": ["parle", "parler", "dis", "dire", "présente-toi"],
+    "learn_face": ["apprends", "apprendre", "mémorise", "mémoriser", "enregistre mon visage"],
+    "verify_face": ["identifie", "identifier", "vérifie", "vérifier", "reconnais", "qui suis-je"]
+}
+DEFAULT_PROJECT_TYPE_KEYWORDS = {
+    "python": ["python", "py"],
+    "web": ["web", "html", "site"]
+}
+# Mots qui ne peuvent pas être pris pour un nom de projet
+GENERIC_PROJECT_WORDS = ["projet", "script"]
+
+class IntentMatcher:
+    """
+    Détecte l'intention et le type de projet d'une commande.
+    Les mots-clés (y compris les expressions de plusieurs mots, comme "enregistre mon visage")
+    sont compilés une seule fois dans des PhraseMatcher spaCy insensibles à la casse :
+    le coût de la détection ne dépend plus de la taille du vocabulaire.
+    """
+    def __init__(self, nlp, intent_keywords: dict = None, project_type_keywords: dict = None):
+        """
+        :param nlp: Le pipeline spaCy dont le tokeniseur et le vocabulaire sont utilisés.
+        :param intent_keywords: Un dictionnaire {intention: [expressions]}, dans l'ordre de priorité.
+        :param project_type_keywords: Un dictionnaire {type de projet: [expressions]}.
+        """
+        self.intent_keywords = intent_keywords or DEFAULT_INTENT_KEYWORDS
+        self.project_type_keywords = project_type_keywords or DEFAULT_PROJECT_TYPE_KEYWORDS
+        self.intent_matcher = self._compile(nlp, self.intent_keywords)
+        self.project_type_matcher = self._compile(nlp, self.project_type_keywords)
+        self.intent_priority = {label: i for i, label in enumerate(self.intent_keywords)}
+        self.project_type_priority = {label: i for i, label in enumerate(self.project_type_keywords)}
+        self.excluded_names = {
+            keyword.lower() for keywords in self.project_type_keywords.values() for keyword in keywords
+        } | set(GENERIC_PROJECT_WORDS)
+
+    @classmethod
+    def from_config(cls, nlp, config_path: str):
+        """
+        Crée un matcher à partir d'un fichier JSON de la forme
+        {"intents": {intention: [expressions]}, "project_types": {type: [expressions]}}.
+        Une section absente reprend le vocabulaire par défaut.
+        """
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        return cls(nlp, config.get("intents"), config.get("project_types"))
+
+    def _compile(self, nlp, keywords: dict) -> PhraseMatcher:
+        matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+        for label, phrases in keywords.items():
+            # make_doc se limite au tokeniseur : les motifs sont découpés comme les commandes.
+            matcher.add(label, [nlp.make_doc(phrase) for phrase in phrases])
+        return matcher
+
+    def match_intent(self, doc):
+        """
+        Retourne l'intention la plus prioritaire reconnue et l'expression qui l'a déclenchée.
+        :return: Un tuple (intention ou "unknown", Span de l'expression ou None).
+        """
+        return self._best_match(self.intent_matcher, self.intent_priority, doc)
+
+    def match_project_type(self, doc) -> str:
+        """ Retourne le type de projet le plus prioritaire reconnu, ou "unknown". """
+        label, _ = self._best_match(self.project_type_matcher, self.project_type_priority, doc)
+        return label
+
+    def _best_match(self, matcher: PhraseMatcher, priority: dict, doc):
+        spans = matcher(doc, as_spans=True)
+        if not spans:
+            return "unknown", None
+        # À priorité égale, la première occurrence dans la commande l'emporte.
+        best = min(spans, key=lambda span: (priority[span.label_], span.start))
+        return best.label_, best
@@ -1,6 +1,14 @@
 # hikmara/modules/module_04_nlp/nlp_processor.py
 import spacy
 import os
+import copy
+import unicodedata
+from hikmara.modules.module_04_nlp.intent_matcher import IntentMatcher
+from hikmara.modules.module_04_nlp.result_cache import ResultCache
+
+# Composants du pipeline spaCy inutiles à la détection d'intention :
+# seuls la tokenisation, les catégories grammaticales (POS) et les entités sont exploitées.
+DEFAULT_DISABLED_COMPONENTS = ("parser", "lemmatizer")
 
 class NLPProcessor:
     """
@@ -8,15 +16,51 @@ class NLPProcessor:
     Utilise spaCy pour analyser les commandes de l'utilisateur,
     identifier les intentions et extraire les entités.
     """
-    def __init__(self, internet_controller, model_name="fr_core_news_sm"):
+    def __init__(self, internet_controller, model_name="fr_core_news_sm",
+                 disabled_components=DEFAULT_DISABLED_COMPONENTS, keywords_path=None, cache_size=256):
         """
         Initialise le processeur NLP en chargeant le modèle spaCy.
         :param internet_controller: L'instance du contrôleur Internet pour gérer les téléchargements.
         :param model_name: Le nom du modèle spaCy à utiliser.
+        :param disabled_components: Les composants du pipeline à désactiver au chargement.
+        :param keywords_path: Un fichier JSON de mots-clés (voir IntentMatcher.from_config).
+                              Sans fichier, le vocabulaire par défaut est utilisé.
+        :param cache_size: Le nombre de résultats d'analyse gardés en cache (0 le désactive).
         """
         self.model_name = model_name
+        self.disabled_components = list(disabled_components)
+        self.keywords_path = keywords_path
         self.internet_controller = internet_controller
+        self.cache = ResultCache(cache_size)
+        self.nlp = self._load_model()
+        self.matcher = self._build_matcher()
+
+    def reload_keywords(self, keywords_path=None):
+        """
+        Recompile le vocabulaire (depuis un fichier JSON, ou celui par défaut)
+        et invalide le cache, dont les résultats dépendent des mots-clés.
+        """
+        self.keywords_path = keywords_path
+        self.matcher = self._build_matcher()
+        self.cache.clear()
+
+    def reload_model(self, model_name=None):
+        """
+        Recharge le modèle spaCy (éventuellement un autre) et invalide le cache.
+        """
+        if model_name:
+            self.model_name = model_name
         self.nlp = self._load_model()
+        self.matcher = self._build_matcher()
+        self.cache.clear()
+
+    def _build_matcher(self):
+        """ Compile les mots-clés une fois pour toutes, dès que le modèle est chargé. """
+        if not self.nlp:
+            return None
+        if self.keywords_path:
+            return IntentMatcher.from_config(self.nlp, self.keywords_path)
+        return IntentMatcher(self.nlp)
 
     def _load_model(self):
         """
@@ -24,7 +68,7 @@ class NLPProcessor:
         demande la permission de le télécharger via l'InternetController.
         """
         try:
-            return spacy.load(self.model_name)
+            return spacy.load(self.model_name, disable=self.disabled_components)
         except OSError:
             prompt = f"Le modèle spaCy '{self.model_name}' est manquant. Puis-je le télécharger ?"
             if self.internet_controller.request_permission(prompt):
@@ -32,7 +76,7 @@ class NLPProcessor:
                 try:
                     spacy.cli.download(self.model_name)
                     self.internet_controller.view.display_message("Téléchargement terminé.")
-                    return spacy.load(self.model_name)
+                    return spacy.load(self.model_name, disable=self.disabled_components)
                 except Exception as e:
                     self.internet_controller.view.display_message(f"ERREUR: Impossible de télécharger le modèle. {e}")
                     return None
@@ -48,22 +92,48 @@ class NLPProcessor:
         if not self.nlp:
             return {"error": "Le modèle NLP n'est pas chargé."}
 
-        doc = self.nlp(command_text.lower()) # Travailler en minuscules pour la simplicité
-
-        # --- Définition des mots-clés ---
-        INTENT_KEYWORDS = {
-            "create": ["crée", "créer", "fabrique", "génère"],
-            "execute": ["exécute", "exécuter", "lance", "lancer", "démarre"],
-            "install": ["installe", "installer", "télécharge"],
-            "search": ["recherche", "cherche", "trouve"],
-            "speak": ["parle", "parler", "dis", "dire", "présente-toi"],
-            "learn_face": ["apprends", "apprendre", "mémorise", "mémoriser", "enregistre mon visage"],
-            "verify_face": ["identifie", "identifier", "vérifie", "vérifier", "reconnais", "qui suis-je"]
-        }
-        PROJECT_TYPE_KEYWORDS = {
-            "python": ["python", "py"],
-            "web": ["web", "html", "site"]
-        }
+        # Les commandes répétées (fréquentes en mode vocal) sont servies depuis le cache.
+        key = self._normalize(command_text)
+        result = self.cache.get(key)
+        if result is None:
+            # Une seule analyse : les comparaisons se font sur token.lower_,
+            # le texte original reste disponible pour les noms et les entités.
+            result = self._analyze_doc(self.nlp(key))
+            self.cache.put(key, result)
+        # Copie : l'appelant peut modifier le résultat sans altérer le cache.
+        result = copy.deepcopy(result)
+        result["original_text"] = command_text
+        return result
+
+    @staticmethod
+    def _normalize(command_text: str) -> str:
+        """ Normalise une commande (Unicode NFC, espaces superflus) pour servir de clé de cache. """
+        return " ".join(unicodedata.normalize("NFC", command_text).split())
+
+    def process_commands(self, commands, batch_size: int = 64, n_process: int = 1):
+        """
+        Analyse un flux de commandes par lots avec nlp.pipe (rejeu de journaux, évaluation, sessions multiples).
+        Les résultats sont produits au fur et à mesure, dans l'ordre des commandes,
+        avec la même structure que process_command. Le cache n'est pas utilisé :
+        chaque commande est réellement analysée (utile pour mesurer la précision).
+        :param commands: Un itérable de commandes textuelles.
+        :param batch_size: Le nombre de commandes traitées par lot.
+        :param n_process: Le nombre de processus utilisés par spaCy.
+        :return: Un générateur de dictionnaires de résultats.
+        """
+        if not self.nlp:
+            for _ in commands:
+                yield {"error": "Le modèle NLP n'est pas chargé."}
+            return
+
+        for doc in self.nlp.pipe(commands, batch_size=batch_size, n_process=n_process):
+            yield self._analyze_doc(doc)
+
+    def _analyze_doc(self, doc) -> dict:
+        """
+        Extrait intention, type de projet, noms et requête d'un Doc spaCy déjà analysé.
+        """
+        command_text = doc.text
 
         # --- Initialisation des résultats ---
         result = {
@@ -73,32 +143,22 @@ class NLPProcessor:
             "project_name": None,
             "package_name": None,
             "search_query": None, # Ajout pour la recherche
-            "entities": {ent.label_: ent.text for ent in self.nlp(command_text).ents}
+            "entities": {ent.label_: ent.text for ent in doc.ents}
         }
 
         # --- Extraction par mots-clés ---
-        tokens = [token.text for token in doc]
-
-        # 1. Trouver l'intention
-        for intent, keywords in INTENT_KEYWORDS.items():
-            if any(keyword in tokens for keyword in keywords):
-                result["intent"] = intent
-                break
+        # 1. Trouver l'intention (et l'expression qui l'a déclenchée)
+        result["intent"], intent_span = self.matcher.match_intent(doc)
 
         # 2. Trouver le type de projet
-        for project_type, keywords in PROJECT_TYPE_KEYWORDS.items():
-            if any(keyword in tokens for keyword in keywords):
-                result["project_type"] = project_type
-                break
+        result["project_type"] = self.matcher.match_project_type(doc)
 
         # 3. Extraire le nom du projet (heuristique simple)
         # On cherche un nom propre (PROPN) ou un nom (NOUN) qui n'est pas un mot-clé.
         for token in doc:
-            if token.pos_ in ["PROPN", "NOUN"] and token.text not in (
-                PROJECT_TYPE_KEYWORDS["python"] + PROJECT_TYPE_KEYWORDS["web"] + ["projet", "script"]
-            ):
-                 # On prend le nom original (avec majuscules) pour le nom du projet
-                result["project_name"] = self.nlp(command_text)[token.i].text
+            if token.pos_ in ["PROPN", "NOUN"] and token.lower_ not in self.matcher.excluded_names:
+                # On prend le nom original (avec majuscules) pour le nom du projet
+                result["project_name"] = token.text
                 break
 
         # Si le nom n'est pas trouvé, on peut essayer avec les entités génériques
@@ -108,19 +168,14 @@ class NLPProcessor:
         # 4. Extraire le nom du paquet si l'intention est d'installer
         if result["intent"] == "install":
             # Heuristique: le nom du paquet est souvent le nom qui suit le mot-clé d'installation.
-            for i, token in enumerate(doc):
-                if token.text in INTENT_KEYWORDS["install"] and i + 1 < len(doc):
-                    result["package_name"] = doc[i + 1].text
-                    break
+            if intent_span.end < len(doc):
+                result["package_name"] = doc[intent_span.end].lower_
             if not result["package_name"]:
                 result["package_name"] = result["project_name"]
 
         # 5. Extraire la requête de recherche
         if result["intent"] == "search":
-            for i, token in enumerate(doc):
-                if token.text in INTENT_KEYWORDS["search"]:
-                    # On prend tout le reste de la phrase comme requête
-                    result["search_query"] = command_text[token.idx + len(token.text):].strip()
-                    break
+            # On prend tout le reste de la phrase comme requête
+            result["search_query"] = command_text[intent_span.end_char:].strip()
 
         return result
\ No newline at end of file
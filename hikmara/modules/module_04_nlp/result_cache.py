@@ -0,0 +1,56 @@
+# hikmara/modules/module_04_nlp/result_cache.py
+import threading
+from collections import OrderedDict
+
+class ResultCache:
+    """
+    Cache LRU borné pour les résultats d'analyse des commandes.
+    Compte les succès, les échecs et les évictions. Utilisable depuis plusieurs threads.
+    """
+    def __init__(self, max_size: int = 256):
+        """
+        :param max_size: Le nombre maximal de résultats conservés (0 désactive le cache).
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """ Retourne la valeur associée à la clé (ou None) et la marque comme récemment utilisée. """
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+    def put(self, key, value):
+        """ Ajoute une valeur, en évinçant la moins récemment utilisée si le cache est plein. """
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """ Vide le cache (les compteurs sont conservés). """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """ Retourne les compteurs du cache. """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,151 @@
+# hikmara/modules/module_07_voice_recognition/speech_backends.py
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+import speech_recognition as sr
+
+DEFAULT_VOSK_MODEL_PATH = "hikmara/model/vosk-model-fr"
+DEFAULT_WHISPER_MODEL = "base"
+DEFAULT_WHISPER_MODEL_DIR = "hikmara/model/whisper"
+
+def whisper_cache_dir() -> str:
+    """ Le dossier où openai-whisper range les modèles qu'il télécharge. """
+    cache = os.getenv("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(cache, "whisper")
+
+class SpeechBackend(ABC):
+    """
+    Interface d'un moteur de transcription.
+    Le modèle est chargé une seule fois (load) puis gardé en mémoire.
+    Les erreurs suivent les conventions de SpeechRecognition :
+    sr.UnknownValueError si l'audio n'est pas compris, sr.RequestError si le moteur
+    est indisponible (modèle absent, pas de réseau...) — le suivant est alors essayé.
+    """
+    name = "base"
+    offline = True
+
+    def __init__(self):
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def load(self):
+        """ Charge le modèle si ce n'est pas déjà fait. Lève sr.RequestError en cas d'échec. """
+        with self._lock:
+            if self._loaded:
+                return
+            try:
+                self._load()
+            except sr.RequestError:
+                raise
+            except Exception as e:
+                raise sr.RequestError(f"{self.name}: chargement impossible ({e})")
+            self._loaded = True
+
+    def _load(self):
+        pass
+
+    def transcribe(self, audio: sr.AudioData) -> str:
+        """ Transcrit un énoncé en texte. """
+        self.load()
+        text = self._transcribe(audio).strip()
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+
+    @abstractmethod
+    def _transcribe(self, audio: sr.AudioData) -> str:
+        pass
+
+class VoskBackend(SpeechBackend):
+    """
+    Transcription hors ligne avec Vosk (modèle Kaldi, rapide sur CPU).
+    Modèle à télécharger depuis https://alphacephei.com/vosk/models (ex: vosk-model-small-fr).
+    """
+    name = "vosk"
+    sample_rate = 16000
+
+    def __init__(self, model_path: str = DEFAULT_VOSK_MODEL_PATH):
+        super().__init__()
+        self.model_path = model_path
+        self.model = None
+
+    def _load(self):
+        if not os.path.isdir(self.model_path):
+            raise sr.RequestError(f"vosk: modèle introuvable dans '{self.model_path}'")
+        import vosk
+        vosk.SetLogLevel(-1)
+        self.model = vosk.Model(self.model_path)
+
+    def _transcribe(self, audio: sr.AudioData) -> str:
+        import vosk
+        # Un recognizer par énoncé (état interne) ; le modèle, coûteux, est partagé.
+        recognizer = vosk.KaldiRecognizer(self.model, self.sample_rate)
+        recognizer.AcceptWaveform(audio.get_raw_data(convert_rate=self.sample_rate, convert_width=2))
+        return json.loads(recognizer.FinalResult()).get("text", "")
+
+class WhisperBackend(SpeechBackend):
+    """
+    Transcription hors ligne avec un modèle Whisper local (openai-whisper).
+    Le modèle doit déjà être sur le disque : il n'est jamais téléchargé implicitement
+    (le modèle "base" pèse environ 140 Mo). Pour l'installer :
+        python -c "import whisper; whisper.load_model('base')"
+    ou placer le fichier base.pt dans hikmara/model/whisper.
+    """
+    name = "whisper"
+    sample_rate = 16000
+
+    def __init__(self, model_name: str = DEFAULT_WHISPER_MODEL, language: str = "fr",
+                 model_dir: str = DEFAULT_WHISPER_MODEL_DIR):
+        """
+        :param model_name: Le nom du modèle (ex: "base", "small") ou le chemin d'un fichier .pt.
+        :param model_dir: Le dossier cherché avant le cache d'openai-whisper.
+        """
+        super().__init__()
+        self.model_name = model_name
+        self.language = language
+        self.model_dir = model_dir
+        self.model = None
+
+    def model_path(self) -> str | None:
+        """ Retourne le fichier du modèle s'il est déjà installé, sinon None. """
+        if os.path.isfile(self.model_name):
+            return self.model_name
+        for directory in (self.model_dir, whisper_cache_dir()):
+            path = os.path.join(directory, f"{self.model_name}.pt")
+            if os.path.isfile(path):
+                return path
+        return None
+
+    def _load(self):
+        path = self.model_path()
+        if path is None:
+            raise sr.RequestError(f"whisper: modèle '{self.model_name}' non installé (aucun téléchargement automatique)")
+        import whisper
+        self.model = whisper.load_model(path)
+
+    def _transcribe(self, audio: sr.AudioData) -> str:
+        import numpy as np
+        raw = audio.get_raw_data(convert_rate=self.sample_rate, convert_width=2)
+        samples = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+        result = self.model.transcribe(samples, language=self.language, fp16=False)
+        return result.get("text", "")
+
+class GoogleBackend(SpeechBackend):
+    """
+    Transcription en ligne par l'API Google de SpeechRecognition (nécessite Internet).
+    """
+    name = "google"
+    offline = False
+
+    def __init__(self, language: str = "fr-FR"):
+        super().__init__()
+        self.language = language
+        self.recognizer = sr.Recognizer()
+
+    def _transcribe(self, audio: sr.AudioData) -> str:
+        return self.recognizer.recognize_google(audio, language=self.language)
+
+def default_backends() -> list[SpeechBackend]:
+    """ Les moteurs par défaut, du préféré au dernier recours : hors ligne d'abord, Google ensuite. """
+    return [VoskBackend(), WhisperBackend(), GoogleBackend()]
@@ -1,56 +1,183 @@
 # hikmara/modules/module_07_voice_recognition/voice_recognizer.py
+import queue
+import threading
 import speech_recognition as sr
+from hikmara.modules.module_07_voice_recognition.speech_backends import default_backends
+
+# Marqueur de fin de flux (ex: fin d'un fichier WAV)
+_END_OF_STREAM = object()
 
 class VoiceRecognizer:
     """
     Module 7: Reconnaissance vocale.
     Utilise la bibliothèque SpeechRecognition pour écouter les commandes de l'utilisateur
     via le microphone et les convertir en texte.
+    Le flux audio reste ouvert dans un thread d'écoute : le bruit ambiant est calibré une
+    seule fois, le seuil d'énergie s'adapte ensuite en continu, et chaque énoncé détecté
+    est placé dans une file. Aucune parole n'est perdue entre deux commandes.
+    La transcription passe par une liste de moteurs (hors ligne d'abord) : si l'un est
+    indisponible, le suivant prend le relais.
     """
 
-    def __init__(self):
+    def __init__(self, audio_source: sr.AudioSource = None, energy_threshold: int = 4000,
+                 calibration_duration: float = 1.0, pause_threshold: float = 0.8,
+                 phrase_time_limit: float = 10, max_queued: int = 8, backends: list = None):
         """
         Initialise le reconnaisseur vocal.
+        :param audio_source: La source audio (par défaut, le microphone ; ex: sr.AudioFile pour des tests).
+        :param energy_threshold: Le seuil d'énergie initial, avant calibration.
+        :param calibration_duration: La durée de mesure du bruit ambiant à l'ouverture du flux (0 = aucune).
+        :param pause_threshold: Le silence (en secondes) qui marque la fin d'un énoncé.
+        :param phrase_time_limit: La durée maximale d'un énoncé.
+        :param max_queued: Le nombre d'énoncés gardés en attente (les plus anciens sont abandonnés).
+        :param backends: Les moteurs de transcription, par ordre de préférence (voir speech_backends).
         """
         self.recognizer = sr.Recognizer()
         # On ajuste le seuil d'énergie pour mieux détecter le début et la fin de la parole.
-        self.recognizer.energy_threshold = 4000
+        self.recognizer.energy_threshold = energy_threshold
+        self.recognizer.dynamic_energy_threshold = True
+        self.recognizer.pause_threshold = pause_threshold
+        self.audio_source = audio_source
+        self.calibration_duration = calibration_duration
+        self.phrase_time_limit = phrase_time_limit
+        self.backends = backends if backends is not None else default_backends()
+        self.unavailable = {} # nom du moteur -> raison
+        self.utterances = queue.Queue(maxsize=max_queued)
+        self.calibrated = False
+        self.exhausted = False # La source finie (fichier) a été lue jusqu'au bout
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
 
-    def listen_for_command(self) -> tuple[str, str | None]:
+    def start(self):
+        """
+        Démarre le thread d'écoute s'il ne tourne pas déjà.
+        Une source finie (ex: sr.AudioFile) lue jusqu'au bout n'est jamais rouverte :
+        elle serait rejouée depuis le début.
         """
-        Écoute une commande via le microphone et la transcrit en texte.
-        Cette méthode est bloquante pendant l'écoute.
+        with self._lock:
+            if self.exhausted or (self._thread and self._thread.is_alive()):
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._capture, name="hikmara-listen", daemon=True)
+            self._thread.start()
+            # Les modèles se chargent pendant que l'utilisateur commence à parler.
+            threading.Thread(target=self._load_backends, name="hikmara-stt-load", daemon=True).start()
 
-        :return: Un tuple (statut, résultat).
-                 - statut: "success", "unrecognized", "error", "timeout".
-                 - résultat: Le texte de la commande ou un message d'erreur/information.
+    def _load_backends(self):
+        """ Charge les moteurs jusqu'au premier disponible, pour qu'il soit prêt au premier énoncé. """
+        for backend in self.backends:
+            if backend.name in self.unavailable:
+                continue
+            try:
+                backend.load()
+                return
+            except sr.RequestError as e:
+                self.unavailable[backend.name] = str(e)
+
+    def stop(self, timeout: float = 2.0):
         """
-        try:
-            with sr.Microphone() as source:
-                # Ajustement rapide au bruit ambiant
-                self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
+        Arrête le thread d'écoute et ferme le flux audio.
+        """
+        self._stop.set()
+        thread = self._thread
+        if thread:
+            thread.join(timeout)
 
-                # L'information "Je vous écoute..." sera gérée par la vue.
+    def discard_pending(self):
+        """ Oublie les énoncés en attente (ex: captés pendant que Hikmara parlait). """
+        while True:
+            try:
+                self.utterances.get_nowait()
+            except queue.Empty:
+                return
 
-                # Écoute de la parole avec un timeout pour ne pas bloquer indéfiniment
-                audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=10)
+    def _capture(self):
+        """
+        Boucle du thread d'écoute : segmente le flux en énoncés grâce à la détection
+        d'activité vocale de SpeechRecognition (seuil d'énergie dynamique, pauses).
+        """
+        try:
+            if self.audio_source is None:
+                self.audio_source = sr.Microphone()
+            with self.audio_source as source:
+                if not self.calibrated and self.calibration_duration > 0:
+                    self.recognizer.adjust_for_ambient_noise(source, duration=self.calibration_duration)
+                self.calibrated = True
+                while not self._stop.is_set():
+                    try:
+                        # Timeout court : le thread vérifie régulièrement s'il doit s'arrêter.
+                        audio = self.recognizer.listen(source, timeout=1, phrase_time_limit=self.phrase_time_limit)
+                    except sr.WaitTimeoutError:
+                        continue
+                    if not audio.frame_data:
+                        self.exhausted = True
+                        self._enqueue(_END_OF_STREAM)
+                        return
+                    self._enqueue(audio)
+        except Exception as e:
+            self._enqueue(("error", f"Impossible d'accéder à la source audio: {e}"))
 
-            # La reconnaissance est une étape interne, pas besoin d'afficher de message.
-            # Utilisation de l'API de reconnaissance vocale de Google
-            text = self.recognizer.recognize_google(audio, language="fr-FR")
+    def _enqueue(self, item):
+        """ Ajoute un énoncé à la file, en abandonnant le plus ancien si elle est pleine. """
+        while True:
+            try:
+                self.utterances.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self.utterances.get_nowait()
+                except queue.Empty:
+                    pass
 
-            return "success", text
+    def listen_for_command(self, timeout: float = 5) -> tuple[str, str | None]:
+        """
+        Attend le prochain énoncé capté par le thread d'écoute et le transcrit en texte.
+        Cette méthode est bloquante jusqu'à l'arrivée d'un énoncé (ou l'expiration du délai).
 
-        except sr.WaitTimeoutError:
+        :param timeout: Le délai d'attente d'un énoncé, en secondes.
+        :return: Un tuple (statut, résultat).
+                 - statut: "success", "unrecognized", "error", "timeout".
+                 - résultat: Le texte de la commande ou un message d'erreur/information.
+        """
+        self.start()
+        try:
+            # Source épuisée : inutile d'attendre, seuls les énoncés déjà en file restent à lire.
+            item = self.utterances.get(block=not self.exhausted, timeout=timeout)
+        except queue.Empty:
+            if self.exhausted:
+                return "timeout", "La source audio est terminée."
             # L'utilisateur n'a pas parlé dans le temps imparti
             return "timeout", "Aucune parole n'a été détectée."
-        except sr.UnknownValueError:
-            # L'API n'a pas pu comprendre l'audio
-            return "unrecognized", "Désolé, je n'ai pas compris ce que vous avez dit."
-        except sr.RequestError as e:
-            # Erreur de connexion à l'API (ex: pas d'Internet)
-            error_msg = f"Impossible de contacter le service de reconnaissance vocale; {e}"
-            return "error", error_msg
-        except Exception as e:
-            # Autre erreur inattendue
-            return "error", f"Une erreur inattendue est survenue: {e}"
\ No newline at end of file
+        if item is _END_OF_STREAM:
+            return "timeout", "La source audio est terminée."
+        if isinstance(item, tuple):
+            return item
+        return self.transcribe(item)
+
+    def transcribe(self, audio: sr.AudioData) -> tuple[str, str | None]:
+        """
+        Transcrit un énoncé en texte avec le premier moteur disponible.
+        Un moteur qui ne peut pas être chargé est écarté pour le reste de la session ;
+        un moteur en ligne qui échoue (ex: pas d'Internet) sera réessayé au prochain énoncé.
+        :return: Un tuple (statut, résultat), comme listen_for_command.
+        """
+        errors = []
+        for backend in self.backends:
+            if backend.name in self.unavailable:
+                continue
+            try:
+                return "success", backend.transcribe(audio)
+            except sr.UnknownValueError:
+                # Le moteur n'a pas pu comprendre l'audio
+                return "unrecognized", "Désolé, je n'ai pas compris ce que vous avez dit."
+            except sr.RequestError as e:
+                # Moteur indisponible (modèle absent, pas d'Internet...) : on passe au suivant.
+                if backend.offline:
+                    self.unavailable[backend.name] = str(e)
+                errors.append(str(e))
+            except Exception as e:
+                # Autre erreur inattendue
+                return "error", f"Une erreur inattendue est survenue: {e}"
+        details = "; ".join(errors) or "aucun moteur disponible"
+        return "error", f"Impossible de contacter le service de reconnaissance vocale; {details}"
@@ -0,0 +1,160 @@
+# hikmara/modules/module_08_voice_synthesis/speech_cache.py
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import time
+from collections import OrderedDict
+
+# Âge au-delà duquel un rendu temporaire est considéré comme abandonné (en secondes)
+STALE_TEMP_SECONDS = 10 * 60
+
+def audio_extension() -> str:
+    """ Le format produit par save_to_file : AIFF avec le pilote macOS, WAV ailleurs (SAPI5, espeak). """
+    return ".aiff" if sys.platform == "darwin" else ".wav"
+
+def find_player() -> list[str] | None:
+    """
+    Cherche un lecteur audio du système.
+    :return: La commande à compléter par le chemin du fichier, ["winsound"] sous Windows,
+             ou None si aucun lecteur n'est disponible (le cache est alors désactivé).
+    """
+    if sys.platform == "win32":
+        return ["winsound"]
+    if sys.platform == "darwin":
+        return ["afplay"] if shutil.which("afplay") else None
+    for command in (["paplay"], ["aplay", "-q"]):
+        if shutil.which(command[0]):
+            return command
+    return None
+
+class SpeechCache:
+    """
+    Cache disque des phrases déjà synthétisées.
+    Chaque fichier audio est nommé d'après l'empreinte (texte, voix, débit) ; la taille
+    totale est bornée et les fichiers les moins récemment lus sont supprimés en premier.
+    Utilisé uniquement par le thread de lecture du VoiceSynthesizer (pas de verrou).
+    """
+    def __init__(self, directory: str, max_bytes: int = 64 * 1024 * 1024, extension: str = None):
+        """
+        :param directory: Le dossier des fichiers audio (créé si besoin).
+        :param max_bytes: La taille totale maximale du cache.
+        :param extension: L'extension des fichiers (par défaut, celle du pilote de la plateforme).
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.extension = extension or audio_extension()
+        self.entries = OrderedDict() # empreinte -> taille, du moins au plus récemment utilisé
+        self.total_bytes = 0
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    def _load(self):
+        """
+        Reconstruit l'index depuis le disque, dans l'ordre des dernières utilisations (mtime).
+        Les rendus temporaires (voir temp_path) restés après un arrêt brutal sont supprimés ;
+        ceux de moins de STALE_TEMP_SECONDS peuvent appartenir à une autre instance en cours.
+        """
+        files = []
+        now = time.time()
+        for filename in os.listdir(self.directory):
+            path = os.path.join(self.directory, filename)
+            try:
+                stat = os.stat(path)
+                if filename.endswith(".tmp" + self.extension):
+                    if now - stat.st_mtime > STALE_TEMP_SECONDS:
+                        os.remove(path)
+                    continue
+            except OSError:
+                continue
+            if filename.endswith(self.extension):
+                files.append((stat.st_mtime, filename[:-len(self.extension)], stat.st_size))
+        for _, key, size in sorted(files):
+            self.entries[key] = size
+            self.total_bytes += size
+
+    @staticmethod
+    def make_key(text: str, voice: str, rate) -> str:
+        return hashlib.sha256(f"{text}|{voice}|{rate}".encode('utf-8')).hexdigest()
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.extension)
+
+    def get(self, key: str) -> str | None:
+        """ Retourne le fichier audio de cette empreinte (et le marque comme utilisé), ou None. """
+        if key not in self.entries:
+            return None
+        path = self.path_for(key)
+        try:
+            os.utime(path) # Conserve l'ordre LRU d'une session à l'autre
+        except OSError:
+            self._forget(key)
+            return None
+        self.entries.move_to_end(key)
+        return path
+
+    def add(self, key: str, rendered_path: str) -> str | None:
+        """
+        Enregistre un fichier fraîchement produit, puis évince les plus anciens au-delà de la taille maximale.
+        :param rendered_path: Le fichier temporaire produit par le moteur (déplacé dans le cache).
+        :return: Le chemin du fichier dans le cache, ou None si le rendu est vide.
+        """
+        if not os.path.exists(rendered_path) or os.path.getsize(rendered_path) == 0:
+            return None
+        path = self.path_for(key)
+        os.replace(rendered_path, path)
+        if key in self.entries:
+            self.total_bytes -= self.entries[key]
+        self.entries[key] = os.path.getsize(path)
+        self.entries.move_to_end(key)
+        self.total_bytes += self.entries[key]
+        while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+            oldest = next(iter(self.entries))
+            self._forget(oldest)
+            try:
+                os.remove(self.path_for(oldest))
+            except OSError:
+                pass
+        return path if key in self.entries else None
+
+    def temp_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.{os.getpid()}.tmp{self.extension}")
+
+    def _forget(self, key: str):
+        self.total_bytes -= self.entries.pop(key, 0)
+
+def play(player: list[str], path: str, cancelled) -> bool:
+    """
+    Lit un fichier audio jusqu'au bout, ou jusqu'à ce que cancelled() retourne True.
+    :return: True si la lecture a été lancée.
+    """
+    if player == ["winsound"]:
+        import winsound
+        winsound.PlaySound(path, winsound.SND_FILENAME | winsound.SND_ASYNC)
+        duration = _wav_duration(path)
+        deadline = time.monotonic() + duration
+        while time.monotonic() < deadline:
+            if cancelled():
+                winsound.PlaySound(None, 0)
+                break
+            time.sleep(0.05)
+        return True
+    try:
+        process = subprocess.Popen(player + [path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError:
+        return False
+    while process.poll() is None:
+        if cancelled():
+            process.terminate()
+            break
+        time.sleep(0.05)
+    return True
+
+def _wav_duration(path: str) -> float:
+    import wave
+    try:
+        with wave.open(path, 'rb') as f:
+            return f.getnframes() / float(f.getframerate())
+    except Exception:
+        return 0.0
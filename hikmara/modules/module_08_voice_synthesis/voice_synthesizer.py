@@ -1,23 +1,85 @@
 # hikmara/modules/module_08_voice_synthesis/voice_synthesizer.py
-import pyttsx3
+import itertools
+import os
+import queue
+import threading
+import time
+from hikmara.modules.module_08_voice_synthesis.speech_cache import SpeechCache, find_player, play
+
+# Priorités des messages (la plus petite valeur est lue en premier)
+PRIORITY_URGENT = 0 # Erreurs, avertissements
+PRIORITY_NORMAL = 1
+_STOP = 2 # Après tous les messages en attente
+
+DEFAULT_CACHE_DIR = "hikmara/model/speech_cache"
 
 class VoiceSynthesizer:
     """
     Module 8: Synthèse vocale.
     Utilise la bibliothèque pyttsx3 pour convertir du texte en parole.
+    La parole est produite par un thread dédié, propriétaire du moteur : speak() se contente
+    de mettre le message en file et rend la main immédiatement. Les messages en attente
+    sont regroupés en une seule lecture, les messages urgents passent en tête,
+    et cancel() interrompt la lecture en cours (quand l'utilisateur reprend la parole).
+    Les phrases récurrentes sont synthétisées une fois dans un fichier audio (à leur
+    deuxième utilisation), puis rejouées directement depuis le cache, sans coût de synthèse.
     """
 
-    def __init__(self):
+    def __init__(self, max_coalesced: int = 8, on_spoken=None, init_timeout: float = 5.0,
+                 cache_dir: str = DEFAULT_CACHE_DIR, cache_max_bytes: int = 64 * 1024 * 1024,
+                 render_after: int = 2):
+        """
+        Initialise le moteur de synthèse vocale dans son thread.
+        :param max_coalesced: Le nombre maximal de messages lus d'un seul tenant.
+        :param on_spoken: Une fonction appelée avec (texte, durée en secondes) après chaque lecture.
+        :param init_timeout: Le délai d'attente de l'initialisation du moteur.
+        :param cache_dir: Le dossier du cache audio (None le désactive).
+        :param cache_max_bytes: La taille maximale du cache audio.
+        :param render_after: Le nombre d'utilisations d'une phrase à partir duquel elle est mise en cache.
+        """
+        self.engine = None
+        self.max_coalesced = max_coalesced
+        self.on_spoken = on_spoken
+        self.cache_dir = cache_dir
+        self.cache_max_bytes = cache_max_bytes
+        self.render_after = render_after
+        self.cache = None
+        self.player = None
+        self._uses = {}
+        self._queue = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._cancel = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        ready = threading.Event()
+        self._worker = threading.Thread(target=self._run, args=(ready,), name="hikmara-speech", daemon=True)
+        self._worker.start()
+        ready.wait(init_timeout)
+
+    def _init_engine(self):
         """
-        Initialise le moteur de synthèse vocale.
+        Crée le moteur dans le thread de lecture : certains pilotes pyttsx3
+        exigent que le moteur soit utilisé par le thread qui l'a créé.
         """
         try:
+            import pyttsx3
             self.engine = pyttsx3.init()
             self._configure_voice()
+            # Point d'interruption : le moteur ne peut être arrêté que depuis sa propre boucle.
+            self.engine.connect('started-word', self._on_word)
         except Exception:
             # Si le moteur ne peut pas être initialisé, il sera None.
             # La logique appelante devra gérer ce cas.
             self.engine = None
+            return
+        self.player = find_player()
+        if self.cache_dir and self.player:
+            try:
+                self.cache = SpeechCache(self.cache_dir, self.cache_max_bytes)
+            except OSError:
+                self.cache = None
 
     def _configure_voice(self):
         """
@@ -34,18 +96,169 @@ class VoiceSynthesizer:
                 return
         # Si aucune voix française n'est trouvée, la voix par défaut sera utilisée.
 
-    def speak(self, text: str):
+    def speak(self, text: str, priority: int = PRIORITY_NORMAL):
         """
-        Convertit le texte fourni en parole et le lit à voix haute.
-        Cette méthode est bloquante jusqu'à ce que la parole soit terminée.
+        Met le texte en file pour qu'il soit lu à voix haute. Non bloquant.
+        :param text: Le texte à lire.
+        :param priority: PRIORITY_URGENT pour passer devant les messages en attente.
         """
-        if not self.engine:
+        if not self.engine or not text.strip():
             # Si le moteur n'est pas disponible, ne fait rien.
             return
+        with self._pending_lock:
+            self._pending += 1
+            self._idle.clear()
+        self._queue.put((priority, next(self._sequence), text))
+
+    def cancel(self):
+        """
+        Vide la file et interrompt la phrase en cours de lecture.
+        """
+        self._drain()
+        if not self._idle.is_set():
+            self._cancel.set()
+
+    def wait_until_done(self, timeout: float = None) -> bool:
+        """
+        Attend que tous les messages en file aient été lus.
+        :return: True si la file est vide, False si le délai a expiré.
+        """
+        return self._idle.wait(timeout)
+
+    def close(self, timeout: float = 5.0):
+        """
+        Arrête le thread de lecture après les messages déjà en file (dans la limite du délai).
+        """
+        self._queue.put((_STOP, next(self._sequence), None))
+        self._worker.join(timeout)
 
+    def _run(self, ready: threading.Event):
+        """ Boucle du thread de lecture. """
+        self._init_engine()
+        ready.set()
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            self._cancel.clear()
+            text = " ".join(batch)
+            start = time.perf_counter()
+            try:
+                self._speak_batch(batch)
+            except Exception:
+                # En cas d'erreur de la bibliothèque, on ne bloque pas le programme.
+                pass
+            self._done(len(batch))
+            if self.on_spoken and not self._cancel.is_set():
+                self.on_spoken(text, time.perf_counter() - start)
+
+    def _speak_batch(self, batch: list[str]):
+        """
+        Lit un lot de messages : ceux qui sont en cache sont rejoués depuis leur fichier audio,
+        les autres sont regroupés et synthétisés en direct.
+        """
+        live = []
+        for text in batch:
+            if self._cancel.is_set():
+                return
+            path = self._cached_audio(text)
+            if path is None:
+                live.append(text)
+                continue
+            self._say_live(live)
+            live = []
+            if not play(self.player, path, self._cancel.is_set):
+                self._say_live([text])
+        self._say_live(live)
+
+    def _say_live(self, texts: list[str]):
+        if texts and not self._cancel.is_set():
+            self.engine.say(" ".join(texts))
+            self.engine.runAndWait()
+
+    def _cached_audio(self, text: str) -> str | None:
+        """
+        Retourne le fichier audio de la phrase, en le produisant si elle revient assez souvent.
+        :return: Le chemin du fichier, ou None pour une synthèse en direct.
+        """
+        if self.cache is None:
+            return None
+        key = SpeechCache.make_key(text, self.engine.getProperty('voice'), self.engine.getProperty('rate'))
+        path = self.cache.get(key)
+        if path:
+            return path
+        uses = self._uses.get(key, 0) + 1
+        if uses < self.render_after:
+            if len(self._uses) >= 4096:
+                self._uses.clear() # Borne la mémoire des phrases vues une seule fois
+            self._uses[key] = uses
+            return None
+        self._uses.pop(key, None)
+        rendered_path = self.cache.temp_path(key)
         try:
-            self.engine.say(text)
+            self.engine.save_to_file(text, rendered_path)
             self.engine.runAndWait()
+            if self._cancel.is_set():
+                # Rendu interrompu par engine.stop() : le fichier est tronqué, il ne doit pas être
+                # mis en cache. La phrase sera produite à sa prochaine utilisation.
+                self._uses[key] = self.render_after - 1
+                return None
+            return self.cache.add(key, rendered_path)
         except Exception:
-            # En cas d'erreur de la bibliothèque, on ne bloque pas le programme.
-            pass
\ No newline at end of file
+            return None
+        finally:
+            # Rendu en échec, interrompu ou refusé par le cache : le fichier temporaire ne doit pas rester.
+            try:
+                os.remove(rendered_path)
+            except OSError:
+                pass
+
+    def _next_batch(self) -> list[str] | None:
+        """
+        Attend un message, puis regroupe ceux de même priorité déjà en file.
+        :return: Les textes à lire ensemble, ou None pour arrêter le thread.
+        """
+        priority, _, text = self._queue.get()
+        if priority == _STOP:
+            return None
+        batch = [text]
+        while len(batch) < self.max_coalesced:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item[0] != priority:
+                self._queue.put(item) # Rendu à la file : il sera lu au tour suivant.
+                break
+            batch.append(item[2])
+        return batch
+
+    def _drain(self):
+        """ Retire les messages en attente (mais pas la demande d'arrêt). """
+        dropped = 0
+        kept = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item[0] == _STOP:
+                kept.append(item)
+            else:
+                dropped += 1
+        for item in kept:
+            self._queue.put(item)
+        if dropped:
+            self._done(dropped)
+
+    def _done(self, count: int):
+        with self._pending_lock:
+            self._pending -= count
+            if self._pending <= 0:
+                self._pending = 0
+                self._idle.set()
+
+    def _on_word(self, name, location, length):
+        """ Rappel du moteur avant chaque mot : arrête la lecture si une annulation est demandée. """
+        if self._cancel.is_set():
+            self.engine.stop()
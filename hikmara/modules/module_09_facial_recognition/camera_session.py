@@ -0,0 +1,160 @@
+# hikmara/modules/module_09_facial_recognition/camera_session.py
+import threading
+import time
+import cv2
+
+# Une lecture plus longue que ce délai a attendu une nouvelle image : le tampon du pilote est vide.
+FRESH_GRAB_DELAY = 0.005
+
+class CameraSource:
+    """
+    Source d'images : une webcam (index) ou un fichier vidéo (chemin), via cv2.VideoCapture.
+    Le périphérique est ouvert à la première lecture et reste ouvert jusqu'à release().
+    Chaque image d'une webcam est datée (last_timestamp, horloge time.monotonic) : une image
+    lue sans attente sortait du tampon du pilote et reçoit la date de l'image précédente.
+    """
+    def __init__(self, device=0, warmup_frames: int = 2, max_buffered_frames: int = 5):
+        """
+        :param device: L'index de la webcam ou le chemin d'un fichier vidéo.
+        :param warmup_frames: Les images ignorées à l'ouverture (souvent sombres ou floues sur une webcam).
+        :param max_buffered_frames: Le nombre maximal d'images jetées pour vider le tampon (voir flush).
+        """
+        self.device = device
+        self.is_camera = isinstance(device, int)
+        self.warmup_frames = warmup_frames if self.is_camera else 0
+        self.max_buffered_frames = max_buffered_frames
+        self.capture = None
+        self.last_timestamp = None
+
+    def read(self):
+        """ Retourne un tuple (succès, image BGR). """
+        if self.capture is None:
+            self.capture = cv2.VideoCapture(self.device)
+            if not self.capture.isOpened():
+                self.release()
+                return False, None
+            if self.is_camera:
+                self.capture.set(cv2.CAP_PROP_BUFFERSIZE, 1) # Ignoré par certains pilotes : voir flush
+            for _ in range(self.warmup_frames):
+                self.capture.read()
+        started = time.monotonic()
+        if not self.capture.grab():
+            return False, None
+        if self.is_camera and (self.last_timestamp is None or time.monotonic() - started > FRESH_GRAB_DELAY):
+            self.last_timestamp = started # Image capturée pendant l'attente
+        return self.capture.retrieve()
+
+    def flush(self):
+        """
+        Jette les images restées dans le tampon du pilote depuis la dernière session,
+        jusqu'à ce qu'une lecture doive attendre une nouvelle image.
+        """
+        if self.capture is None or not self.is_camera:
+            return
+        self.last_timestamp = 0.0 # Images du tampon : antérieures à la session
+        for _ in range(self.max_buffered_frames):
+            started = time.monotonic()
+            if not self.capture.grab():
+                break
+            if time.monotonic() - started > FRESH_GRAB_DELAY:
+                self.last_timestamp = started
+                break
+
+    def release(self):
+        if self.capture is not None:
+            self.capture.release()
+            self.capture = None
+        self.last_timestamp = None
+
+class ImageFilesSource:
+    """
+    Source d'images lues depuis des fichiers (tests, démonstrations), en boucle.
+    """
+    def __init__(self, paths: list[str]):
+        self.paths = list(paths)
+        self._index = 0
+
+    def read(self):
+        if not self.paths:
+            return False, None
+        path = self.paths[self._index % len(self.paths)]
+        self._index += 1
+        frame = cv2.imread(path)
+        return frame is not None, frame
+
+    def release(self):
+        pass
+
+class CameraSession:
+    """
+    Session de capture réutilisable : la source reste ouverte entre deux appels
+    (pas de coût d'initialisation du périphérique à chaque vérification) et n'est
+    relâchée qu'après une période d'inactivité, pour ne pas monopoliser la webcam.
+    Au début de chaque session, le tampon de la source est vidé (flush) et les images
+    datées d'avant le début de la session (last_timestamp) sont refusées : une vérification
+    ne doit jamais porter sur des images de la session précédente.
+    """
+    def __init__(self, source=None, idle_timeout: float = 30.0):
+        """
+        :param source: La source d'images (par défaut, la webcam 0). Tout objet ayant
+                       read() -> (succès, image BGR) et release() convient ; flush() et
+                       last_timestamp sont facultatifs.
+        :param idle_timeout: Le délai d'inactivité (en secondes) avant de relâcher la source (0 = jamais).
+        """
+        self.source = source if source is not None else CameraSource(0)
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._timer = None
+
+    def read_frames(self, count: int):
+        """
+        Produit jusqu'à count images BGR consécutives (moins si la source s'épuise).
+        Au plus count images antérieures au début de la session sont ignorées.
+        """
+        with self._lock:
+            self._cancel_timer()
+            try:
+                started = time.monotonic()
+                flush = getattr(self.source, "flush", None)
+                if flush:
+                    flush()
+                produced = stale = 0
+                while produced < count:
+                    ok, frame = self.source.read()
+                    if not ok or frame is None:
+                        return
+                    timestamp = getattr(self.source, "last_timestamp", None)
+                    if timestamp is not None and timestamp < started:
+                        stale += 1
+                        if stale > count:
+                            return
+                        continue
+                    produced += 1
+                    yield frame
+            finally:
+                self._schedule_release()
+
+    def close(self):
+        """ Relâche immédiatement la source. """
+        with self._lock:
+            self._cancel_timer()
+            self.source.release()
+
+    def _schedule_release(self):
+        if self.idle_timeout > 0:
+            self._timer = threading.Timer(self.idle_timeout, self._release_if_idle)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _release_if_idle(self):
+        # Pas d'attente : une capture en cours reprogramme son propre minuteur.
+        if self._lock.acquire(blocking=False):
+            try:
+                self.source.release()
+            finally:
+                self._lock.release()
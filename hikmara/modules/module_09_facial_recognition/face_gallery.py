@@ -0,0 +1,123 @@
+# hikmara/modules/module_09_facial_recognition/face_gallery.py
+import json
+import os
+import numpy as np
+
+ENCODING_SIZE = 128 # Taille des encodages de face_recognition
+
+class FaceGallery:
+    """
+    Galerie de visages connus : plusieurs identités, plusieurs encodages par identité.
+    Tous les encodages forment une seule matrice float32 contiguë (un fichier .npy
+    ouvert en mémoire partagée), associée à un index JSON des noms ligne par ligne.
+    La recherche du plus proche voisin est un unique calcul vectorisé :
+    |e - q|² = |e|² - 2 e·q + |q|², où les normes |e|² sont précalculées.
+    """
+    def __init__(self, directory: str):
+        """
+        :param directory: Le dossier de la galerie (créé si besoin).
+        """
+        self.directory = directory
+        self.matrix_path = os.path.join(directory, "face_gallery.npy")
+        self.labels_path = os.path.join(directory, "face_gallery_labels.json")
+        os.makedirs(directory, exist_ok=True)
+        self.matrix = None
+        self.labels = []
+        self._squared_norms = None
+        self._load()
+
+    def _load(self):
+        """ Ouvre la matrice en lecture seule (mmap) et son index de noms. """
+        if not os.path.exists(self.matrix_path) or not os.path.exists(self.labels_path):
+            self.matrix = np.empty((0, ENCODING_SIZE), dtype=np.float32)
+            self.labels = []
+        else:
+            self.matrix = np.load(self.matrix_path, mmap_mode='r')
+            with open(self.labels_path, 'r', encoding='utf-8') as f:
+                self.labels = json.load(f)["labels"]
+            # Une écriture interrompue peut laisser une ligne sans nom : on l'ignore.
+            rows = min(len(self.labels), self.matrix.shape[0])
+            self.matrix = self.matrix[:rows]
+            self.labels = self.labels[:rows]
+        self._squared_norms = np.einsum('ij,ij->i', self.matrix, self.matrix)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def identities(self) -> dict[str, int]:
+        """ Retourne le nombre d'encodages enregistrés par identité. """
+        counts = {}
+        for label in self.labels:
+            counts[label] = counts.get(label, 0) + 1
+        return counts
+
+    def add(self, name: str, encodings):
+        """
+        Ajoute des encodages à une identité (créée si elle n'existe pas).
+        :param encodings: Une liste (ou un tableau k×128) d'encodages.
+        """
+        new_rows = np.asarray(encodings, dtype=np.float32).reshape(-1, ENCODING_SIZE)
+        matrix = np.concatenate([np.asarray(self.matrix), new_rows])
+        self._save(matrix, self.labels + [name] * len(new_rows))
+
+    def remove(self, name: str) -> int:
+        """
+        Supprime une identité et tous ses encodages.
+        :return: Le nombre d'encodages supprimés.
+        """
+        keep = [i for i, label in enumerate(self.labels) if label != name]
+        removed = len(self.labels) - len(keep)
+        if removed:
+            self._save(np.asarray(self.matrix)[keep], [self.labels[i] for i in keep])
+        return removed
+
+    def _save(self, matrix, labels: list[str]):
+        """
+        Écrit la matrice puis l'index dans des fichiers temporaires remplacés atomiquement.
+        La matrice en mémoire partagée est fermée d'abord (nécessaire sous Windows).
+        """
+        matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+        self.matrix = None
+        matrix_tmp = self.matrix_path + ".tmp.npy"
+        labels_tmp = self.labels_path + ".tmp"
+        np.save(matrix_tmp, matrix)
+        with open(labels_tmp, 'w', encoding='utf-8') as f:
+            json.dump({"labels": labels}, f, ensure_ascii=False)
+        os.replace(matrix_tmp, self.matrix_path)
+        os.replace(labels_tmp, self.labels_path)
+        self._load()
+
+    def distances(self, encodings) -> np.ndarray:
+        """
+        Calcule les distances euclidiennes entre des encodages et toute la galerie.
+        :param encodings: Un encodage (128,) ou un tableau k×128.
+        :return: Un tableau k×N de distances.
+        """
+        queries = np.asarray(encodings, dtype=np.float32).reshape(-1, ENCODING_SIZE)
+        squared = (self._squared_norms[None, :]
+                   - 2.0 * queries @ self.matrix.T
+                   + np.einsum('ij,ij->i', queries, queries)[:, None])
+        return np.sqrt(np.maximum(squared, 0.0))
+
+    def match(self, encoding) -> tuple[str | None, float]:
+        """
+        Retourne l'identité la plus proche d'un encodage et sa distance.
+        :return: Un tuple (nom, distance), ou (None, inf) si la galerie est vide.
+        """
+        if not self.labels:
+            return None, float("inf")
+        distances = self.distances(encoding)[0]
+        best = int(np.argmin(distances))
+        return self.labels[best], float(distances[best])
+
+    def migrate_legacy(self, legacy_path: str, name: str) -> bool:
+        """
+        Importe l'ancien fichier à encodage unique (user_face.npy) sous le nom donné,
+        puis le renomme en .migrated pour ne pas l'importer deux fois.
+        :return: True si un fichier a été importé.
+        """
+        if not os.path.exists(legacy_path):
+            return False
+        self.add(name, [np.load(legacy_path)])
+        os.replace(legacy_path, legacy_path + ".migrated")
+        return True
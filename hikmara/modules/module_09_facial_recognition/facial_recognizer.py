@@ -3,93 +3,267 @@ import cv2
 import face_recognition
 import numpy as np
 import os
+from hikmara.modules.module_09_facial_recognition.camera_session import CameraSession
+from hikmara.modules.module_09_facial_recognition.face_gallery import FaceGallery
+
+DEFAULT_USER_NAME = "Utilisateur"
+# Agrandissements de l'image avant détection (face_recognition.face_locations) : identique
+# pour la détection image par image et par lots, afin que les deux trouvent les mêmes visages.
+DETECTION_UPSAMPLE = 1
+
+# Écart moyen (niveaux de gris, sur 255) en dessous duquel deux visages consécutifs sont identiques
+# au pixel près : le bruit d'un vrai capteur dépasse ce seuil, une image fixe injectée non.
+STATIC_FRAME_THRESHOLD = 0.5
 
 class FacialRecognizer:
     """
     Module 9: Reconnaissance faciale.
-    Gère l'apprentissage et la vérification du visage de l'utilisateur.
+    Gère l'apprentissage et l'identification des visages des utilisateurs (voir FaceGallery).
+    Plusieurs images sont analysées à chaque capture et la meilleure (visage le plus grand
+    et le plus net) est retenue. La détection se fait sur une image réduite, l'encodage
+    sur l'image en pleine résolution.
+    La vérification analyse un flux d'images par lots et exige plusieurs images concordantes.
     """
 
-    def __init__(self, data_path="hikmara/model/security"):
+    def __init__(self, data_path="hikmara/model/security", frame_source=None, frames_per_capture: int = 5,
+                 detection_scale: float = 0.5, detection_model: str = "hog", tolerance: float = 0.6,
+                 verification_window: int = 15, batch_size: int = 4, min_matches: int = 3,
+                 static_check: bool = True):
         """
         Initialise le reconnaisseur facial.
         :param data_path: Le dossier où stocker les données de visage.
+        :param frame_source: La source d'images (par défaut, la webcam ; voir camera_session pour
+                             des sources de test : ImageFilesSource, CameraSource("video.mp4")).
+        :param frames_per_capture: Le nombre d'images analysées pour retenir le meilleur visage.
+        :param detection_scale: Le facteur de réduction des images avant la détection (1 = aucune).
+        :param detection_model: Le modèle de détection de face_recognition ("hog" ou "cnn").
+        :param tolerance: La distance maximale pour reconnaître un visage (0.6 comme compare_faces).
+        :param verification_window: Le nombre maximal d'images analysées lors d'une vérification.
+        :param batch_size: Le nombre d'images traitées ensemble (détection et comparaison).
+        :param min_matches: Le nombre d'images concordantes exigé pour une identification.
+        :param static_check: Refuse un flux dont les visages sont identiques au pixel près.
         """
         self.data_path = data_path
-        self.known_face_encoding_path = os.path.join(self.data_path, "user_face.npy")
+        self.camera = CameraSession(frame_source)
+        self.frames_per_capture = frames_per_capture
+        self.detection_scale = detection_scale
+        self.detection_model = detection_model
+        self.tolerance = tolerance
+        self.verification_window = verification_window
+        self.batch_size = batch_size
+        self.min_matches = min_matches
+        self.static_check = static_check
         os.makedirs(self.data_path, exist_ok=True)
-        self.known_face_encoding = self._load_known_face()
-
-    def _load_known_face(self):
-        """ Charge l'encodage du visage connu s'il existe. """
-        if os.path.exists(self.known_face_encoding_path):
-            return np.load(self.known_face_encoding_path)
-        return None
+        self.gallery = FaceGallery(self.data_path)
+        # Ancien format : un seul visage dans user_face.npy
+        self.gallery.migrate_legacy(os.path.join(self.data_path, "user_face.npy"), DEFAULT_USER_NAME)
 
     def _get_face_encoding_from_webcam(self):
         """
-        Capture une image de la webcam, détecte un visage et retourne son encodage.
+        Capture plusieurs images, y détecte un visage et retourne l'encodage du meilleur.
         Retourne (status, data), où status peut être "success", "no_face", "multi_face", "error".
         """
-        # Utilisation de la webcam 0 (par défaut)
-        video_capture = cv2.VideoCapture(0)
-        if not video_capture.isOpened():
-            return "error", "Impossible d'accéder à la webcam."
-
-        ret, frame = video_capture.read()
-        video_capture.release() # On relâche la webcam immédiatement
+        best = None # (qualité, image RGB, position du visage)
+        frames = 0
+        multi_face_frames = 0
+        for frame in self.camera.read_frames(self.frames_per_capture):
+            frames += 1
+            locations = self._detect_faces(frame)
+            if len(locations) > 1:
+                multi_face_frames += 1
+                continue
+            if not locations:
+                continue
+            quality = self._face_quality(frame, locations[0])
+            if best is None or quality > best[0]:
+                # Convertir l'image de BGR (utilisé par OpenCV) en RGB (utilisé par face_recognition)
+                best = (quality, np.ascontiguousarray(frame[:, :, ::-1]), locations[0])
 
-        if not ret:
+        if frames == 0:
             return "error", "Impossible de capturer une image depuis la webcam."
 
-        # Convertir l'image de BGR (utilisé par OpenCV) en RGB (utilisé par face_recognition)
-        rgb_frame = frame[:, :, ::-1]
+        if best is None:
+            if multi_face_frames:
+                return "multi_face", "Plusieurs visages ont été détectés. Veuillez être seul devant la caméra."
+            return "no_face", "Aucun visage n'a été détecté."
 
-        face_locations = face_recognition.face_locations(rgb_frame)
+        _, rgb_frame, location = best
+        face_encoding = face_recognition.face_encodings(rgb_frame, [location])[0]
+        return "success", face_encoding
 
-        if len(face_locations) == 0:
-            return "no_face", "Aucun visage n'a été détecté."
+    def _detect_faces(self, frame) -> list[tuple[int, int, int, int]]:
+        """
+        Détecte les visages sur une version réduite de l'image (BGR) et retourne
+        leurs positions (haut, droite, bas, gauche) dans l'image en pleine résolution.
+        """
+        locations = face_recognition.face_locations(
+            self._downscale(frame), number_of_times_to_upsample=DETECTION_UPSAMPLE, model=self.detection_model,
+        )
+        return self._upscale(locations, frame.shape)
 
-        if len(face_locations) > 1:
-            return "multi_face", "Plusieurs visages ont été détectés. Veuillez être seul devant la caméra."
+    def _downscale(self, frame):
+        """ Réduit une image BGR (ou une partie) et la convertit en RGB pour la détection. """
+        scale = self.detection_scale
+        small = frame if scale == 1 else cv2.resize(frame, (0, 0), fx=scale, fy=scale)
+        return cv2.cvtColor(small, cv2.COLOR_BGR2RGB)
 
-        # On prend le premier (et unique) visage trouvé
-        face_encoding = face_recognition.face_encodings(rgb_frame, face_locations)[0]
-        return "success", face_encoding
+    def _upscale(self, locations, shape, scale: float = None, offset=(0, 0)) -> list[tuple[int, int, int, int]]:
+        """ Ramène des positions détectées sur une image réduite (ou recadrée) dans l'image complète. """
+        scale = scale or self.detection_scale
+        height, width = shape[:2]
+        dy, dx = offset
+        return [
+            (max(0, int(top / scale) + dy), min(width, int(right / scale) + dx),
+             min(height, int(bottom / scale) + dy), max(0, int(left / scale) + dx))
+            for top, right, bottom, left in locations
+        ]
 
-    def learn_face(self) -> tuple[bool, str]:
+    def _track_face(self, frame, previous) -> tuple[int, int, int, int] | None:
+        """
+        Cherche le visage uniquement autour de sa position précédente (zone élargie de moitié),
+        ce qui évite une détection sur l'image entière tant que le visage ne sort pas de la zone.
+        La zone est réduite comme l'image entière (detection_scale) : elle coûte donc toujours
+        moins de pixels qu'une nouvelle détection.
+        :return: La nouvelle position, ou None si le visage n'y est plus (ou n'est pas seul).
+        """
+        top, right, bottom, left = previous
+        margin_y, margin_x = (bottom - top) // 2, (right - left) // 2
+        height, width = frame.shape[:2]
+        y0, y1 = max(0, top - margin_y), min(height, bottom + margin_y)
+        x0, x1 = max(0, left - margin_x), min(width, right + margin_x)
+        crop = self._downscale(frame[y0:y1, x0:x1])
+        locations = face_recognition.face_locations(crop, number_of_times_to_upsample=DETECTION_UPSAMPLE, model="hog")
+        if len(locations) != 1:
+            return None
+        return self._upscale(locations, frame.shape, offset=(y0, x0))[0]
+
+    def _locate_batch(self, frames: list, previous) -> list:
+        """
+        Localise le visage de chaque image d'un lot.
+        Avec le modèle "cnn", les images sans position connue sont détectées ensemble
+        (batch_face_locations) ; sinon, le visage est suivi d'une image à l'autre.
+        :return: La liste des positions (None si aucun visage unique n'a été trouvé).
         """
-        Apprend le visage de l'utilisateur principal via la webcam.
+        if self.detection_model == "cnn" and previous is None:
+            batch = face_recognition.batch_face_locations(
+                [self._downscale(frame) for frame in frames],
+                number_of_times_to_upsample=DETECTION_UPSAMPLE, batch_size=len(frames),
+            )
+            return [
+                self._upscale(locations, frame.shape)[0] if len(locations) == 1 else None
+                for frame, locations in zip(frames, batch)
+            ]
+        located = []
+        for frame in frames:
+            location = self._track_face(frame, previous) if previous else None
+            if location is None:
+                locations = self._detect_faces(frame)
+                location = locations[0] if len(locations) == 1 else None
+            located.append(location)
+            previous = location
+        return located
+
+    @staticmethod
+    def _face_signature(frame, location):
+        """ Une vignette 32×32 en niveaux de gris du visage, pour comparer les images entre elles. """
+        top, right, bottom, left = location
+        face = cv2.cvtColor(frame[top:bottom, left:right], cv2.COLOR_BGR2GRAY)
+        return cv2.resize(face, (32, 32)).astype(np.float32)
+
+    @staticmethod
+    def _is_static(signatures: list) -> bool:
+        """
+        Indique si les visages retenus sont identiques au pixel près (image fixe rejouée).
+        Ne remplace pas une vraie détection du vivant : une photo tenue devant la caméra passe.
+        """
+        if len(signatures) < 2:
+            return False
+        differences = [np.abs(a - b).mean() for a, b in zip(signatures, signatures[1:])]
+        return max(differences) < STATIC_FRAME_THRESHOLD
+
+    @staticmethod
+    def _face_quality(frame, location) -> float:
+        """
+        Note la qualité d'un visage : sa surface multipliée par sa netteté
+        (variance du laplacien, faible sur une image floue ou bougée).
+        """
+        top, right, bottom, left = location
+        face = cv2.cvtColor(frame[top:bottom, left:right], cv2.COLOR_BGR2GRAY)
+        if face.size == 0:
+            return 0.0
+        sharpness = cv2.Laplacian(face, cv2.CV_64F).var()
+        return float(face.size * sharpness)
+
+    def close(self):
+        """ Relâche la webcam. """
+        self.camera.close()
+
+    def learn_face(self, name: str = DEFAULT_USER_NAME) -> tuple[bool, str]:
+        """
+        Apprend le visage d'un utilisateur via la webcam.
+        Un utilisateur déjà connu reçoit un encodage supplémentaire (meilleure reconnaissance).
+        :param name: Le nom de l'utilisateur.
         :return: Un tuple (succès, message).
         """
         status, data = self._get_face_encoding_from_webcam()
 
         if status == "success":
-            face_encoding = data
-            np.save(self.known_face_encoding_path, face_encoding)
-            self.known_face_encoding = face_encoding
-            return True, "Votre visage a été appris avec succès."
+            self.gallery.add(name, [data])
+            return True, f"Le visage de {name} a été appris avec succès."
         else:
             # data contient le message d'erreur
             return False, data
 
     def verify_face(self) -> tuple[bool, str]:
         """
-        Vérifie si le visage devant la webcam correspond au visage appris.
+        Identifie le visage devant la webcam parmi les visages appris.
+        Les images sont analysées par lots : le visage est suivi d'une image à l'autre, les
+        encodages du lot sont comparés à la galerie en un seul calcul, et la vérification
+        s'arrête dès que min_matches images concordent. Une seule image favorable ne suffit pas.
         :return: Un tuple (succès, message).
         """
-        if self.known_face_encoding is None:
+        if not len(self.gallery):
             return False, "Aucun visage n'a été appris. Veuillez d'abord m'apprendre votre visage."
 
-        status, data = self._get_face_encoding_from_webcam()
-
-        if status != "success":
-            return False, data # Retourne le message d'erreur ("no_face", etc.)
+        matches = {} # nom -> distances des images concordantes
+        signatures = []
+        previous = None
+        frames = faces = 0
+        frame_stream = self.camera.read_frames(self.verification_window)
+        try:
+            while True:
+                batch = [frame for _, frame in zip(range(self.batch_size), frame_stream)]
+                if not batch:
+                    break
+                frames += len(batch)
+                located = [(frame, location) for frame, location in zip(batch, self._locate_batch(batch, previous))
+                           if location is not None]
+                previous = located[-1][1] if located else None
+                if not located:
+                    continue
+                faces += len(located)
+                encodings = [
+                    face_recognition.face_encodings(np.ascontiguousarray(frame[:, :, ::-1]), [location])[0]
+                    for frame, location in located
+                ]
+                distances = self.gallery.distances(encodings)
+                for (frame, location), row in zip(located, distances):
+                    best = int(np.argmin(row))
+                    if row[best] <= self.tolerance:
+                        matches.setdefault(self.gallery.labels[best], []).append(float(row[best]))
+                        signatures.append(self._face_signature(frame, location))
 
-        unknown_encoding = data
-        matches = face_recognition.compare_faces([self.known_face_encoding], unknown_encoding)
+                name, distances_for_name = max(matches.items(), key=lambda item: len(item[1]), default=(None, []))
+                if len(distances_for_name) >= self.min_matches:
+                    if self.static_check and self._is_static(signatures):
+                        return False, "Image figée détectée. Veuillez vous présenter en personne devant la caméra."
+                    confidence = 1 - np.mean(distances_for_name) / self.tolerance
+                    return True, f"Identification réussie. Bonjour {name} ! (confiance : {confidence:.0%})"
+        finally:
+            frame_stream.close()
 
-        if True in matches:
-            return True, "Identification réussie. Bonjour !"
-        else:
-            return False, "Visage non reconnu."
\ No newline at end of file
+        if frames == 0:
+            return False, "Impossible de capturer une image depuis la webcam."
+        if faces == 0:
+            return False, "Aucun visage n'a été détecté."
+        return False, "Visage non reconnu."
@@ -0,0 +1,90 @@
+# hikmara/modules/module_10_internet_control/html_extractor.py
+import importlib.util
+
+# Balises dont le contenu n'est pas du texte utile : code, menus, pieds de page et encadrés.
+# <header> et <form> sont conservés : ils contiennent souvent le titre ou toute la page (ASP.NET).
+BOILERPLATE_TAGS = ("script", "style", "nav", "footer", "aside")
+# Balises de bloc : leur début et leur fin séparent des paragraphes
+BLOCK_TAGS = ("p", "div", "section", "article", "main", "li", "ul", "ol", "dd", "dt", "blockquote",
+              "pre", "table", "tr", "td", "th", "h1", "h2", "h3", "h4", "h5", "h6", "br", "hr")
+# Marqueur de paragraphe inséré autour des blocs (U+2029, séparateur de paragraphe)
+PARAGRAPH_MARK = "\u2029"
+
+def available_backends() -> list[str]:
+    """ Les analyseurs HTML installés, du plus rapide au plus lent. """
+    backends = [name for name in ("lxml", "selectolax") if importlib.util.find_spec(name) is not None]
+    return backends + ["bs4"]
+
+class HtmlExtractor:
+    """
+    Extrait le texte lisible d'une page HTML en conservant les paragraphes
+    (séparés par une ligne vide), ce qui améliore le découpage en phrases.
+    Utilise lxml ou selectolax (analyseur lexbor, selectolax >= 1.0) s'ils sont installés,
+    BeautifulSoup sinon.
+    """
+    def __init__(self, backend: str = None):
+        """
+        :param backend: "lxml", "selectolax" ou "bs4" (par défaut, le plus rapide disponible).
+        """
+        self.backend = backend or available_backends()[0]
+        self._extract = {
+            "lxml": self._extract_lxml,
+            "selectolax": self._extract_selectolax,
+            "bs4": self._extract_bs4,
+        }[self.backend]
+
+    def extract(self, html: bytes | str, encoding: str = None) -> str:
+        """
+        Retourne le texte de la page, un paragraphe par bloc.
+        :param html: Le HTML brut. Des octets évitent un décodage complet préalable :
+                     l'analyseur décode lui-même (en-tête HTTP, balise meta charset).
+        :param encoding: L'encodage annoncé par le serveur, s'il est connu.
+        """
+        if not html:
+            return ""
+        return self._normalize(self._extract(html, encoding))
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """ Un paragraphe par marqueur, espaces et retours à la ligne internes réduits. """
+        paragraphs = (" ".join(part.split()) for part in text.split(PARAGRAPH_MARK))
+        return "\n\n".join(paragraph for paragraph in paragraphs if paragraph)
+
+    def _extract_lxml(self, html, encoding):
+        import lxml.html
+        if isinstance(html, bytes) and encoding:
+            parser = lxml.html.HTMLParser(encoding=encoding)
+            root = lxml.html.document_fromstring(html, parser=parser)
+        else:
+            root = lxml.html.document_fromstring(html)
+        for element in list(root.iter(*BOILERPLATE_TAGS)):
+            element.drop_tree() # Conserve le texte qui suit la balise (tail)
+        for element in root.iter(*BLOCK_TAGS):
+            element.text = PARAGRAPH_MARK + (element.text or "")
+            element.tail = PARAGRAPH_MARK + (element.tail or "")
+        body = root.find("body")
+        return (body if body is not None else root).text_content()
+
+    def _extract_selectolax(self, html, encoding):
+        from selectolax.lexbor import LexborHTMLParser
+        if isinstance(html, bytes) and encoding:
+            html = html.decode(encoding, errors="replace")
+        # Des octets : encodage détecté par lexbor (balise meta charset comprise)
+        tree = LexborHTMLParser(html, encoding=isinstance(html, bytes))
+        tree.strip_tags(list(BOILERPLATE_TAGS))
+        for node in tree.css(",".join(BLOCK_TAGS)):
+            node.insert_before(PARAGRAPH_MARK)
+            node.insert_after(PARAGRAPH_MARK)
+        root = tree.body or tree.root
+        return root.text(separator="") if root is not None else ""
+
+    def _extract_bs4(self, html, encoding):
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(html, "html.parser", from_encoding=encoding if isinstance(html, bytes) else None)
+        for element in soup(list(BOILERPLATE_TAGS)):
+            element.decompose()
+        for element in soup.find_all(list(BLOCK_TAGS)):
+            element.insert_before(PARAGRAPH_MARK)
+            element.insert_after(PARAGRAPH_MARK)
+        root = soup.body or soup
+        return root.get_text()
@@ -0,0 +1,214 @@
+# hikmara/modules/module_10_internet_control/http_cache.py
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+
+def parse_cache_control(value: str) -> dict:
+    """ Découpe un en-tête Cache-Control en directives : {"max-age": "60", "no-cache": True, ...}. """
+    directives = {}
+    for part in (value or "").split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') if argument else True
+    return directives
+
+class CacheEntry:
+    """
+    Une réponse HTTP en cache : son corps (sur disque) et les métadonnées
+    nécessaires à la fraîcheur (Cache-Control, Expires) et à la revalidation (ETag, Last-Modified).
+    """
+    def __init__(self, url: str, body_path: str, meta: dict):
+        self.url = url
+        self.body_path = body_path
+        self.meta = meta
+
+    @property
+    def is_fresh(self) -> bool:
+        """ True si la réponse peut être servie sans contacter le serveur. """
+        expires_at = self.meta.get("expires_at")
+        return not self.meta.get("no_cache") and expires_at is not None and time.time() < expires_at
+
+    def conditional_headers(self) -> dict:
+        """ Les en-têtes d'une requête conditionnelle (le serveur répond 304 si rien n'a changé). """
+        headers = {}
+        if self.meta.get("etag"):
+            headers["If-None-Match"] = self.meta["etag"]
+        if self.meta.get("last_modified"):
+            headers["If-Modified-Since"] = self.meta["last_modified"]
+        return headers
+
+    @property
+    def encoding(self) -> str | None:
+        return self.meta.get("encoding")
+
+    def read_bytes(self) -> bytes:
+        with open(self.body_path, 'rb') as f:
+            return f.read()
+
+    def read_text(self) -> str:
+        return self.read_bytes().decode(self.encoding or "utf-8", errors="replace")
+
+class HttpCache:
+    """
+    Cache HTTP sur disque pour les pages lues par Hikmara.
+    Respecte Cache-Control (no-store, no-cache, max-age), Expires, ETag et Last-Modified.
+    La taille totale est bornée : les réponses les moins récemment utilisées sont supprimées.
+    Utilisable depuis plusieurs threads.
+    """
+    def __init__(self, directory: str, max_bytes: int = 100 * 1024 * 1024):
+        """
+        :param directory: Le dossier du cache (créé si besoin).
+        :param max_bytes: La taille totale maximale des corps de réponse conservés.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict() # empreinte -> taille, du moins au plus récemment utilisé
+        self.total_bytes = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    def _load(self):
+        """ Reconstruit l'index depuis le disque, dans l'ordre des dernières utilisations. """
+        files = []
+        for filename in os.listdir(self.directory):
+            if filename.endswith(".body"):
+                key = filename[:-len(".body")]
+                if not os.path.exists(self._meta_path(key)):
+                    continue
+                stat = os.stat(os.path.join(self.directory, filename))
+                files.append((os.path.getmtime(self._meta_path(key)), key, stat.st_size))
+        for _, key, size in sorted(files):
+            self.entries[key] = size
+            self.total_bytes += size
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _body_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".body")
+
+    def _meta_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".json")
+
+    def lookup(self, url: str) -> CacheEntry | None:
+        """ Retourne l'entrée en cache pour cette URL (fraîche ou à revalider), ou None. """
+        key = self._key(url)
+        with self._lock:
+            if key not in self.entries:
+                return None
+            try:
+                with open(self._meta_path(key), 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+                os.utime(self._meta_path(key)) # Conserve l'ordre LRU d'une session à l'autre
+            except (OSError, ValueError):
+                self._remove(key)
+                return None
+            self.entries.move_to_end(key)
+        return CacheEntry(url, self._body_path(key), meta)
+
+    def store(self, url: str, response, body: bytes = None, encoding: str = None) -> bool:
+        """
+        Enregistre une réponse 200 si ses en-têtes l'autorisent.
+        :param response: Une réponse requests (en-têtes, contenu, encodage).
+        :param body: Le corps déjà lu (réponse en flux) ; par défaut, response.content.
+        :param encoding: L'encodage annoncé du corps (None : l'analyseur HTML le détermine).
+        :return: True si la réponse a été mise en cache.
+        """
+        directives = parse_cache_control(response.headers.get("Cache-Control"))
+        if "no-store" in directives or response.status_code != 200:
+            return False
+        if body is None:
+            body = response.content
+        if len(body) > self.max_bytes:
+            return False
+        key = self._key(url)
+        meta = self._metadata(url, response.headers, directives)
+        meta["encoding"] = encoding
+        with self._lock:
+            self._write(key, body, meta)
+            self._evict()
+        return True
+
+    def refresh(self, entry: CacheEntry, headers) -> CacheEntry:
+        """
+        Met à jour la fraîcheur d'une entrée après une réponse 304 (le corps n'a pas changé).
+        """
+        directives = parse_cache_control(headers.get("Cache-Control"))
+        meta = dict(entry.meta)
+        updated = self._metadata(entry.url, headers, directives)
+        for name in ("etag", "last_modified"):
+            if updated.get(name):
+                meta[name] = updated[name]
+        meta["expires_at"] = updated["expires_at"]
+        meta["no_cache"] = updated["no_cache"]
+        key = self._key(entry.url)
+        with self._lock:
+            if key in self.entries:
+                self._write_meta(key, meta)
+        return CacheEntry(entry.url, entry.body_path, meta)
+
+    @staticmethod
+    def _metadata(url: str, headers, directives: dict) -> dict:
+        """ Calcule les métadonnées de fraîcheur et de revalidation d'une réponse. """
+        now = time.time()
+        expires_at = None
+        max_age = directives.get("s-maxage") or directives.get("max-age")
+        if max_age not in (None, True):
+            try:
+                expires_at = now + max(0, int(max_age))
+            except ValueError:
+                expires_at = None
+        elif headers.get("Expires"):
+            try:
+                expires_at = parsedate_to_datetime(headers["Expires"]).timestamp()
+            except (TypeError, ValueError):
+                expires_at = None # Date invalide (ex: "0") : la réponse est déjà expirée
+        return {
+            "url": url,
+            "stored_at": now,
+            "expires_at": expires_at,
+            "no_cache": "no-cache" in directives,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "content_type": headers.get("Content-Type"),
+        }
+
+    def _write(self, key: str, body: bytes, meta: dict):
+        tmp_path = self._body_path(key) + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(body)
+        os.replace(tmp_path, self._body_path(key))
+        self._write_meta(key, meta)
+        self.total_bytes += len(body) - self.entries.get(key, 0)
+        self.entries[key] = len(body)
+        self.entries.move_to_end(key)
+
+    def _write_meta(self, key: str, meta: dict):
+        tmp_path = self._meta_path(key) + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, self._meta_path(key))
+
+    def _evict(self):
+        while self.total_bytes > self.max_bytes and self.entries:
+            self._remove(next(iter(self.entries)))
+
+    def _remove(self, key: str):
+        self.total_bytes -= self.entries.pop(key, 0)
+        for path in (self._body_path(key), self._meta_path(key)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def clear(self):
+        """ Vide le cache. """
+        with self._lock:
+            for key in list(self.entries):
+                self._remove(key)
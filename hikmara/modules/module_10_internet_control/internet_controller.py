@@ -1,21 +1,117 @@
 # hikmara/modules/module_10_internet_control/internet_controller.py
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from email.message import Message
+from urllib.parse import urlsplit
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from hikmara.modules.module_10_internet_control.html_extractor import HtmlExtractor
+from hikmara.modules.module_10_internet_control.http_cache import HttpCache
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+DEFAULT_HTTP_CACHE_DIR = "hikmara/model/http_cache"
+DEFAULT_MAX_PAGE_BYTES = 5 * 1024 * 1024
+READ_CHUNK_SIZE = 64 * 1024
 
 class InternetController:
     """
     Module 10: Contrôle Internet et installation locale.
     Sert de gardien pour toutes les actions nécessitant un accès à Internet.
+    Les pages sont lues par une session HTTP partagée (connexions conservées, nouvelles
+    tentatives) et mises en cache sur disque : une page déjà lue coûte au plus une
+    requête conditionnelle (réponse 304 si elle n'a pas changé).
     """
 
-    def __init__(self, view):
+    def __init__(self, view, cache_dir: str = DEFAULT_HTTP_CACHE_DIR, cache_max_bytes: int = 100 * 1024 * 1024,
+                 retries: int = 3, pool_size: int = 10, max_page_bytes: int = DEFAULT_MAX_PAGE_BYTES,
+                 html_backend: str = None):
         """
         Initialise le contrôleur Internet.
         :param view: L'instance de la vue pour interagir avec l'utilisateur.
+        :param cache_dir: Le dossier du cache HTTP (None le désactive).
+        :param cache_max_bytes: La taille maximale du cache HTTP.
+        :param retries: Le nombre de nouvelles tentatives sur erreur de connexion ou réponse 429/5xx.
+        :param pool_size: Le nombre de connexions conservées par hôte.
+        :param max_page_bytes: La taille maximale lue d'une page (le reste est ignoré).
+        :param html_backend: L'analyseur HTML à utiliser (voir HtmlExtractor ; par défaut, le plus rapide).
         """
         self.view = view
+        self.session = self._create_session(retries, pool_size)
+        self.http_cache = HttpCache(cache_dir, cache_max_bytes) if cache_dir else None
+        self.max_page_bytes = max_page_bytes
+        self.extractor = HtmlExtractor(html_backend)
+
+    @staticmethod
+    def _create_session(retries: int, pool_size: int) -> requests.Session:
+        """ Crée une session HTTP avec un pool de connexions persistantes et des nouvelles tentatives. """
+        session = requests.Session()
+        retry = Retry(
+            total=retries,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET", "HEAD"),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers['User-Agent'] = USER_AGENT
+        return session
+
+    def get_page(self, url: str, timeout: float = 10) -> str:
+        """
+        Retourne le contenu d'une page sous forme de texte (voir get_page_bytes).
+        """
+        body, encoding = self.get_page_bytes(url, timeout)
+        return body.decode(encoding or "utf-8", errors="replace")
+
+    def get_page_bytes(self, url: str, timeout: float = 10) -> tuple[bytes, str | None]:
+        """
+        Retourne le contenu brut d'une page et son encodage annoncé, depuis le cache si possible.
+        Une entrée périmée est revalidée par une requête conditionnelle (If-None-Match / If-Modified-Since).
+        La réponse est lue en flux et tronquée à max_page_bytes.
+        Lève une requests.exceptions.RequestException en cas d'erreur réseau ou HTTP.
+        """
+        entry = self.http_cache.lookup(url) if self.http_cache else None
+        if entry and entry.is_fresh:
+            return entry.read_bytes(), entry.encoding
+
+        headers = entry.conditional_headers() if entry else {}
+        with self.session.get(url, headers=headers, timeout=timeout, stream=True) as response:
+            if response.status_code == 304 and entry:
+                entry = self.http_cache.refresh(entry, response.headers)
+                return entry.read_bytes(), entry.encoding
+            response.raise_for_status() # Lève une exception pour les codes d'erreur HTTP
+            body = self._read_capped(response)
+            encoding = self._declared_charset(response.headers)
+            if self.http_cache:
+                self.http_cache.store(url, response, body=body, encoding=encoding)
+        return body, encoding
+
+    @staticmethod
+    def _declared_charset(headers) -> str | None:
+        """
+        Retourne le charset explicitement annoncé par l'en-tête Content-Type, ou None.
+        Sans charset, l'analyseur HTML lit la balise meta charset de la page
+        (requests supposerait ISO-8859-1 pour tout text/html).
+        """
+        message = Message()
+        message["Content-Type"] = headers.get("Content-Type", "")
+        return message.get_param("charset") or None
+
+    def _read_capped(self, response) -> bytes:
+        """ Lit le corps d'une réponse par morceaux, sans dépasser max_page_bytes. """
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(READ_CHUNK_SIZE):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= self.max_page_bytes:
+                break
+        return b"".join(chunks)[:self.max_page_bytes]
 
     def request_permission(self, prompt: str) -> bool:
         """
@@ -70,27 +166,51 @@ class InternetController:
         :return: Un tuple (succès, contenu textuel ou message d'erreur).
         """
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status() # Lève une exception pour les codes d'erreur HTTP
+            body, encoding = self.get_page_bytes(url)
 
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Supprimer les balises de script et de style
-            for script_or_style in soup(['script', 'style']):
-                script_or_style.decompose()
-
-            # Extraire le texte et nettoyer les espaces
-            text = soup.get_text()
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            clean_text = '\n'.join(chunk for chunk in chunks if chunk)
+            # Texte sans scripts, menus ni pieds de page ; un paragraphe par bloc.
+            clean_text = self.extractor.extract(body, encoding)
 
             return True, clean_text
 
         except requests.exceptions.RequestException as e:
             return False, f"Erreur réseau lors de l'accès à l'URL: {e}"
         except Exception as e:
-            return False, f"Une erreur inattendue est survenue lors de la lecture de la page: {e}"
\ No newline at end of file
+            return False, f"Une erreur inattendue est survenue lors de la lecture de la page: {e}"
+
+    def fetch_many(self, urls: list[str], max_workers: int = 8, per_host: int = 2, timeout: float = 60):
+        """
+        Récupère et nettoie plusieurs pages en parallèle, et produit les résultats dans l'ordre d'arrivée.
+        :param urls: Les URLs à lire.
+        :param max_workers: Le nombre maximal de pages lues simultanément.
+        :param per_host: Le nombre maximal de requêtes simultanées vers un même hôte.
+        :param timeout: Le délai global (en secondes) ; les pages non reçues à temps sont abandonnées.
+                        Il court pendant l'itération : ne pas traiter les pages entre deux résultats.
+        :return: Un générateur de tuples (url, succès, contenu textuel ou message d'erreur).
+        """
+        host_limits = {}
+        for url in urls:
+            host_limits.setdefault(urlsplit(url).netloc, threading.BoundedSemaphore(per_host))
+
+        def _fetch(url):
+            with host_limits[urlsplit(url).netloc]:
+                return self.fetch_website_content(url)
+
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls))), thread_name_prefix="hikmara-fetch")
+        futures = {executor.submit(_fetch, url): url for url in urls}
+        pending = set(futures)
+        try:
+            for future in as_completed(futures, timeout=timeout):
+                pending.discard(future)
+                success, content = future.result()
+                yield futures[future], success, content
+        except FuturesTimeoutError:
+            for future in pending:
+                yield futures[future], False, f"Délai de {timeout:.0f} s dépassé."
+        finally:
+            # Les lectures déjà lancées se terminent en arrière-plan ; les autres sont annulées.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def close(self):
+        """ Ferme les connexions HTTP conservées. """
+        self.session.close()
\ No newline at end of file
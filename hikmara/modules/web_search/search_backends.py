@@ -0,0 +1,108 @@
+# hikmara/modules/web_search/search_backends.py
+from abc import ABC, abstractmethod
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Paramètres de suivi retirés des URLs (ils ne changent pas la page)
+TRACKING_PARAMS = ("gclid", "fbclid", "msclkid", "yclid", "mc_cid", "mc_eid", "ref_src")
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+def normalize_url(url: str) -> str:
+    """
+    Met une URL sous forme canonique pour détecter les doublons :
+    redirection Google (/url?q=...) dépliée, schéma et hôte en minuscules, port par défaut,
+    fragment et paramètres de suivi (utm_*, gclid...) retirés, '/' final supprimé.
+    """
+    parts = urlsplit((url or "").strip())
+    if parts.path == "/url" and parts.netloc.lower().endswith("google.com"):
+        params = dict(parse_qsl(parts.query))
+        target = params.get("q") or params.get("url")
+        if target:
+            return normalize_url(target)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = urlencode([(name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                       if not name.lower().startswith("utm_") and name.lower() not in TRACKING_PARAMS])
+    path = parts.path.rstrip("/") if parts.path not in ("", "/") else ""
+    return urlunsplit((scheme, host, path, query, ""))
+
+def deduplicate(results: list[dict]) -> list[dict]:
+    """
+    Retire les résultats dont l'URL normalisée a déjà été vue (le premier, mieux classé, est gardé).
+    L'URL normalisée ne sert que de clé : celle du résultat, affichée puis lue, reste inchangée.
+    """
+    seen = set()
+    unique = []
+    for result in results:
+        key = normalize_url(result["url"])
+        if not key or key in seen:
+            continue
+        seen.add(key)
+        unique.append(result)
+    return unique
+
+class SearchBackend(ABC):
+    """
+    Interface d'un moteur de recherche.
+    search() retourne une liste de dictionnaires {'title', 'url', 'description'}, du plus
+    au moins pertinent, et lève une exception si le moteur est indisponible (le suivant est alors essayé).
+    """
+    name = "base"
+    offline = True
+    cacheable = False # Les résultats peuvent-ils être conservés dans le SearchCache ?
+
+    @abstractmethod
+    def search(self, query: str, num_results: int) -> list[dict]:
+        pass
+
+class GoogleBackend(SearchBackend):
+    """
+    Recherche Google via la bibliothèque googlesearch-python (nécessite Internet).
+    """
+    name = "google"
+    offline = False
+    cacheable = True
+
+    def __init__(self, language: str = "fr", timeout: float = 10):
+        self.language = language
+        self.timeout = timeout
+
+    def search(self, query: str, num_results: int) -> list[dict]:
+        from googlesearch import search
+        # advanced=True retourne des objets SearchResult (url, title, description) au lieu des seules URLs.
+        results = search(query, num_results=num_results, lang=self.language, advanced=True, timeout=self.timeout)
+        return [
+            {"title": result.title or "", "url": result.url, "description": result.description or ""}
+            for result in results
+        ]
+
+class KnowledgeBaseBackend(SearchBackend):
+    """
+    Recherche hors ligne dans les connaissances déjà apprises (index FTS5 de la KnowledgeBase).
+    Un résultat a pour URL « kb:<concept> » ; la page d'où vient la connaissance est dans 'source'.
+    """
+    name = "local"
+    offline = True
+
+    def __init__(self, knowledge_base):
+        self.knowledge_base = knowledge_base
+
+    def search(self, query: str, num_results: int) -> list[dict]:
+        return [
+            {
+                "title": row["concept_name"],
+                "url": f"kb:{row['concept_name']}",
+                "description": row.get("snippet") or "",
+                "source": row.get("source"),
+                "local": True,
+            }
+            for row in self.knowledge_base.search(query, limit=num_results)
+        ]
+
+def default_backends(knowledge_base=None) -> list[SearchBackend]:
+    """ Les moteurs par défaut : Google, puis les connaissances locales si Internet est indisponible. """
+    backends = [GoogleBackend()]
+    if knowledge_base is not None:
+        backends.append(KnowledgeBaseBackend(knowledge_base))
+    return backends
@@ -0,0 +1,86 @@
+# hikmara/modules/web_search/search_cache.py
+import json
+import os
+import threading
+import time
+
+class SearchCache:
+    """
+    Cache persistant (un fichier JSON) des résultats de recherche : requête -> résultats.
+    Chaque entrée expire après ttl secondes ; au-delà de max_entries, les plus anciennes
+    sont supprimées. Le fichier est réécrit atomiquement (fichier temporaire + os.replace).
+    Utilisable depuis plusieurs threads.
+    """
+    def __init__(self, path: str, ttl: float = 24 * 3600, max_entries: int = 500):
+        """
+        :param path: Le chemin du fichier JSON (son dossier est créé si besoin).
+        :param ttl: La durée de validité d'une entrée, en secondes.
+        :param max_entries: Le nombre maximal de requêtes conservées.
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.entries = {} # clé -> {"stored_at", "complete", "results"}
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f).get("entries", {})
+        except (OSError, ValueError, AttributeError):
+            self.entries = {}
+        self._purge()
+
+    @staticmethod
+    def key(backend: str, query: str) -> str:
+        """ La clé d'une requête : le moteur et la requête sans casse ni espaces superflus. """
+        return f"{backend}:{' '.join(query.lower().split())}"
+
+    def get(self, key: str, count: int) -> list[dict] | None:
+        """
+        Retourne les count premiers résultats en cache, ou None s'ils n'y sont pas (tous).
+        Une entrée « complète » (le moteur n'avait pas plus de résultats) suffit toujours.
+        """
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None or time.time() - entry["stored_at"] > self.ttl:
+                return None
+            if len(entry["results"]) < count and not entry["complete"]:
+                return None
+            return entry["results"][:count]
+
+    def put(self, key: str, results: list[dict], complete: bool):
+        """
+        Enregistre les résultats d'une requête.
+        :param complete: True si le moteur a retourné moins de résultats que demandé.
+        """
+        with self._lock:
+            self.entries[key] = {"stored_at": time.time(), "complete": complete, "results": results}
+            self._purge()
+            self._save()
+
+    def _purge(self):
+        """ Supprime les entrées expirées, puis les plus anciennes au-delà de max_entries. """
+        now = time.time()
+        fresh = [(entry["stored_at"], key) for key, entry in self.entries.items() if now - entry["stored_at"] <= self.ttl]
+        keep = {key for _, key in sorted(fresh, reverse=True)[:self.max_entries]}
+        self.entries = {key: entry for key, entry in self.entries.items() if key in keep}
+
+    def _save(self):
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"entries": self.entries}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass # Le cache reste utilisable en mémoire
+
+    def clear(self):
+        """ Vide le cache. """
+        with self._lock:
+            self.entries = {}
+            self._save()
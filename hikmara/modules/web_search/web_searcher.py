@@ -1,38 +1,75 @@
 # hikmara/modules/web_search/web_searcher.py
-from googlesearch import search
+from hikmara.modules.web_search.search_backends import deduplicate, default_backends
+from hikmara.modules.web_search.search_cache import SearchCache
+
+DEFAULT_SEARCH_CACHE_PATH = "hikmara/model/search_cache.json"
 
 class WebSearcher:
     """
     Un module simple pour effectuer des recherches web.
+    Les moteurs (voir search_backends) sont essayés dans l'ordre ; les résultats sont
+    dédoublonnés (URLs normalisées) et conservés dans un cache persistant : une requête
+    répétée, ou la page suivante d'une requête, est servie sans appel réseau.
     """
 
-    def __init__(self):
+    def __init__(self, knowledge_base=None, backends=None, cache_path: str = DEFAULT_SEARCH_CACHE_PATH,
+                 cache_ttl: float = 24 * 3600, prefetch: int = 20):
         """
         Initialise le chercheur web.
+        :param knowledge_base: La base de connaissances, recherchée hors ligne si Google est indisponible.
+        :param backends: Les moteurs à utiliser (par défaut, Google puis la base de connaissances).
+        :param cache_path: Le fichier du cache de recherche (None pour le désactiver).
+        :param cache_ttl: La durée de validité des résultats en cache, en secondes.
+        :param prefetch: Le nombre minimal de résultats demandés au moteur, pour servir les pages suivantes.
         """
-        pass
+        self.backends = backends if backends is not None else default_backends(knowledge_base)
+        self.cache = SearchCache(cache_path, cache_ttl) if cache_path else None
+        self.prefetch = prefetch
 
-    def perform_search(self, query: str, num_results: int = 5) -> tuple[bool, list | str]:
+    def perform_search(self, query: str, num_results: int = 5, page: int = 1) -> tuple[bool, list | str]:
         """
-        Effectue une recherche Google et retourne les meilleurs résultats.
+        Effectue une recherche et retourne les meilleurs résultats.
         :param query: La requête de recherche.
-        :param num_results: Le nombre de résultats à retourner.
+        :param num_results: Le nombre de résultats par page.
+        :param page: La page de résultats (à partir de 1).
         :return: Un tuple (succès, liste de résultats ou message d'erreur).
-                 Chaque résultat est un dictionnaire {'title': ..., 'url': ...}.
+                 Chaque résultat est un dictionnaire {'title': ..., 'url': ..., 'description': ...}
+                 ('local': True pour une connaissance déjà apprise).
         """
-        try:
-            # La bibliothèque googlesearch est un générateur, on le convertit en liste
-            # L'option `lang='fr'` favorise les résultats en français.
-            search_results = search(query, num_results=num_results, lang='fr', stop=num_results)
-
-            # La bibliothèque ne retourne que les URLs, nous n'avons pas les titres.
-            # Nous allons retourner une liste de dictionnaires avec l'URL.
-            results_list = [{"url": url} for url in search_results]
-
-            if not results_list:
-                return False, "Aucun résultat n'a été trouvé pour votre recherche."
+        needed = num_results * page
+        errors = []
+        for backend in self.backends:
+            try:
+                results = self._search_backend(backend, query, needed)
+            except Exception as e:
+                errors.append(f"{backend.name}: {e}")
+                continue
+            # Le moteur a répondu : on ne se rabat sur le suivant que s'il est indisponible (exception).
+            if not results:
+                break
+            page_results = results[needed - num_results:needed]
+            if not page_results:
+                return False, "Il n'y a plus de résultats pour cette recherche."
+            return True, page_results
 
-            return True, results_list
+        if errors:
+            return False, f"Une erreur est survenue lors de la recherche: {'; '.join(errors)}"
+        return False, "Aucun résultat n'a été trouvé pour votre recherche."
 
-        except Exception as e:
-            return False, f"Une erreur est survenue lors de la recherche: {e}"
\ No newline at end of file
+    def _search_backend(self, backend, query: str, needed: int) -> list[dict]:
+        """
+        Interroge un moteur, via le cache si ses résultats peuvent y être conservés.
+        Plus de résultats que nécessaire sont demandés, pour que les pages suivantes soient en cache.
+        """
+        if not (self.cache and backend.cacheable):
+            return deduplicate(backend.search(query, needed))
+        key = SearchCache.key(backend.name, query)
+        cached = self.cache.get(key, needed)
+        if cached is not None:
+            return cached
+        requested = max(needed, self.prefetch)
+        raw_results = backend.search(query, requested)
+        results = deduplicate(raw_results)
+        if results:
+            self.cache.put(key, results, complete=len(raw_results) < requested)
+        return results
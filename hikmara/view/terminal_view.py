@@ -34,13 +34,18 @@ class TerminalView:
             print() # Ajoute une nouvelle ligne pour la propreté
             return "quitter"
 
-    def display_message(self, message: str, speak: bool = False):
+    def display_message(self, message: str, speak: bool = False, priority: int = None):
         """
         Affiche un message général à l'utilisateur et le lit à voix haute si demandé.
+        La lecture est mise en file : l'affichage n'attend pas la fin de la parole.
+        :param priority: La priorité de lecture (ex: PRIORITY_URGENT pour les erreurs).
         """
         print(message)
         if speak and self.synthesizer:
-            self.synthesizer.speak(message)
+            if priority is None:
+                self.synthesizer.speak(message)
+            else:
+                self.synthesizer.speak(message, priority=priority)
 
     def display_listening_prompt(self):
         """ Affiche le message indiquant que l'IA écoute. """
@@ -80,12 +85,42 @@ class TerminalView:
 
     def display_search_results(self, results: list):
         """
-        Affiche les résultats d'une recherche web.
+        Affiche les résultats d'une recherche web : titre, URL et extrait.
         """
         self.display_message("-> Voici les résultats trouvés :")
-        for i, result in enumerate(results):
-            # Pour l'instant, on n'a que l'URL.
-            print(f"  {i+1}. {result['url']}")
+        for i, result in enumerate(results, 1):
+            title = result.get('title') or result['url']
+            marker = " (déjà appris)" if result.get('local') else ""
+            print(f"  {i}. {title}{marker}")
+            if title != result['url']:
+                print(f"     {result['url']}")
+            description = " ".join((result.get('description') or "").split())
+            if description:
+                print(f"     {description[:157] + '...' if len(description) > 160 else description}")
+
+    def display_jobs(self, jobs: list):
+        """
+        Affiche la liste des tâches de fond et leur statut.
+        """
+        if not jobs:
+            self.display_message("-> Aucune tâche de fond.")
+            return
+        print("--- Tâches de fond ---")
+        for job in jobs:
+            print(f"  {job.id}. [{job.status}] {job.description} ({job.elapsed:.1f} s)")
+        print("----------------------")
+
+    def display_job_status(self, job):
+        """
+        Affiche le détail d'une tâche de fond.
+        """
+        print(f"--- Tâche {job.id} ---")
+        print(f"  > Description: {job.description}")
+        print(f"  > Statut: {job.status}")
+        print(f"  > Durée: {job.elapsed:.1f} s")
+        if job.message:
+            print(f"  > Résultat: {job.message}")
+        print("------------------------------")
 
     def display_shutdown_message(self):
         """
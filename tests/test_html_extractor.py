@@ -0,0 +1,42 @@
+# tests/test_html_extractor.py
+import importlib.util
+import os
+import pytest
+from hikmara.modules.module_10_internet_control.html_extractor import HtmlExtractor
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "html")
+FIXTURES = ("article", "aspnet_form", "latin1_meta")
+BACKENDS = ("lxml", "selectolax", "bs4")
+
+def _extractor(backend: str) -> HtmlExtractor:
+    if importlib.util.find_spec(backend) is None:
+        pytest.skip(f"{backend} n'est pas installé")
+    return HtmlExtractor(backend)
+
+def _read_fixture(name: str) -> tuple[bytes, str]:
+    with open(os.path.join(FIXTURES_DIR, name + ".html"), 'rb') as f:
+        html = f.read()
+    with open(os.path.join(FIXTURES_DIR, name + ".txt"), 'r', encoding='utf-8') as f:
+        expected = f.read().strip()
+    return html, expected
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("name", FIXTURES)
+def test_extract_fixture(backend, name):
+    """ Sans charset dans l'en-tête HTTP, l'encodage vient de la balise meta de la page. """
+    html, expected = _read_fixture(name)
+    assert _extractor(backend).extract(html) == expected
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_extract_with_declared_encoding(backend):
+    html, expected = _read_fixture("latin1_meta")
+    assert _extractor(backend).extract(html, "iso-8859-1") == expected
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_extract_text_input(backend):
+    html, expected = _read_fixture("article")
+    assert _extractor(backend).extract(html.decode("utf-8")) == expected
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_extract_empty(backend):
+    assert _extractor(backend).extract(b"") == ""
@@ -0,0 +1,85 @@
+# tests/test_ingestion_pipeline.py
+import os
+import nltk
+import pytest
+from hikmara.modules.module_01_knowledge_base.knowledge_base import KnowledgeBase
+from hikmara.modules.module_02_structured_learning.structured_learning import StructuredLearner
+from hikmara.modules.module_03_raw_learning.ingestion_pipeline import IngestionPipeline
+from hikmara.modules.module_03_raw_learning.raw_learning import RawLearner
+
+# Deux classes définissant chacune __init__ : 'py_function:__init__' est en conflit dans le fichier même.
+TWO_CLASSES = '''
+class A:
+    def __init__(self):
+        pass
+
+class B:
+    def __init__(self):
+        pass
+'''
+
+@pytest.fixture
+def learner(tmp_path, monkeypatch):
+    # Les données NLTK ne sont pas nécessaires ici : la tokenisation n'est pas ce qui est testé.
+    monkeypatch.setattr(nltk, "word_tokenize", str.split)
+    kb = KnowledgeBase(str(tmp_path / "kb.db"))
+    yield RawLearner(StructuredLearner(kb))
+    kb.close()
+
+@pytest.fixture
+def source_dir(tmp_path):
+    directory = tmp_path / "src"
+    directory.mkdir()
+    (directory / "a.py").write_text(TWO_CLASSES, encoding="utf-8")
+    return directory
+
+def test_unchanged_file_with_conflicts_is_skipped(learner, source_dir):
+    assert learner.learn_from_directory(str(source_dir), workers=1) is False
+    assert learner.last_report["conflicts"] == 1
+    for _ in range(2):
+        assert learner.learn_from_directory(str(source_dir), workers=1) is True
+        assert learner.last_report["skipped_files"] == 1
+        assert learner.last_report["files"] == 0
+
+def test_deleted_file_with_conflicts_is_forgotten(learner, source_dir):
+    kb = learner.structured_learner.kb
+    learner.learn_from_directory(str(source_dir), workers=1)
+    (source_dir / "a.py").unlink()
+    assert learner.learn_from_directory(str(source_dir), workers=1) is True
+    assert learner.last_report["removed_files"] == 1
+    for concept_name in ("py_class:A", "py_class:B", "py_function:__init__"):
+        assert kb.get_knowledge(concept_name) is None
+
+def test_deleted_file_missing_from_manifest_is_forgotten(learner, source_dir):
+    """ Un fichier sans entrée au manifeste (base plus ancienne) est retrouvé par ses concepts. """
+    kb = learner.structured_learner.kb
+    learner.learn_from_directory(str(source_dir), workers=1)
+    with kb.connections.write() as conn:
+        conn.execute("DELETE FROM file_manifest")
+    (source_dir / "a.py").unlink()
+    assert learner.learn_from_directory(str(source_dir), workers=1) is True
+    assert learner.last_report["removed_files"] == 1
+    assert kb.get_knowledge("py_class:A") is None
+
+def test_shadowed_file_is_relearned(learner, source_dir):
+    kb = learner.structured_learner.kb
+    (source_dir / "b.py").write_text("def __init__():\n    pass\n", encoding="utf-8")
+    learner.learn_from_directory(str(source_dir), workers=1)
+    owner = kb.get_knowledge("py_function:__init__")["origin"]
+    other = str(source_dir / ("b.py" if owner.endswith("a.py") else "a.py"))
+    os.remove(owner)
+    assert learner.learn_from_directory(str(source_dir), workers=1) is True
+    assert kb.get_knowledge("py_function:__init__")["origin"] == other
+
+def _failing_initializer():
+    raise RuntimeError("processus d'analyse inutilisable")
+
+def test_broken_pool_falls_back_to_serial(learner, source_dir):
+    """ Un pool cassé ne fait pas lever run() : les fichiers en vol échouent, les autres sont analysés ici. """
+    for name in ("b.py", "c.py"):
+        (source_dir / name).write_text(f"def {name[0]}():\n    pass\n", encoding="utf-8")
+    pipeline = IngestionPipeline(learner.structured_learner, RawLearner.extract_concepts, workers=2,
+                                 max_pending=1, worker_initializer=_failing_initializer)
+    report = pipeline.run(str(source_dir))
+    assert report["files"] == 3
+    assert report["failed_files"] == 1